@@ -0,0 +1,63 @@
+"""Benchmark: per-call overhead of the middleware chain."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
+
+
+class _NoOpMiddleware(Middleware):
+    """Middleware that overrides no hooks."""
+
+
+class _PassThroughMiddleware(Middleware):
+    """Middleware that overrides the tool hook but only forwards the call."""
+
+    async def on_call_tool(self, context, call_next):
+        return await call_next(context)
+
+
+def _build(n_middleware: int, middleware_cls: type[Middleware]) -> FastMCP:
+    mcp = FastMCP(
+        f"bench-mw-{n_middleware}",
+        middleware=[middleware_cls() for _ in range(n_middleware)],
+        dereference_schemas=False,
+    )
+
+    @mcp.tool
+    async def echo(x: str) -> str:
+        return x
+
+    return mcp
+
+
+def _bench_calls(benchmark, mcp: FastMCP) -> None:
+    async def _run():
+        for _ in range(100):
+            await mcp.call_tool("echo", {"x": "hello"})
+
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(_run()), rounds=20, warmup_rounds=2
+        )
+    finally:
+        loop.close()
+
+
+@pytest.mark.benchmark(group="middleware")
+@pytest.mark.parametrize("n_middleware", [0, 1, 5, 10])
+def test_call_tool_noop_middleware(benchmark, n_middleware: int):
+    """100 tool calls through N middleware that override no hooks."""
+    _bench_calls(benchmark, _build(n_middleware, _NoOpMiddleware))
+
+
+@pytest.mark.benchmark(group="middleware")
+@pytest.mark.parametrize("n_middleware", [1, 5, 10])
+def test_call_tool_passthrough_middleware(benchmark, n_middleware: int):
+    """100 tool calls through N middleware that forward on_call_tool."""
+    _bench_calls(benchmark, _build(n_middleware, _PassThroughMiddleware))
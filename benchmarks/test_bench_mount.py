@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
-from fastmcp import FastMCP
+from fastmcp import Client, FastMCP
 
 
 def _child(name: str, n_tools: int) -> FastMCP:
@@ -59,3 +61,38 @@ def test_mount_10_children(benchmark):
         return parent
 
     benchmark(_run)
+
+
+# ---------------------------------------------------------------------------
+# call_tool through nested mounts
+# ---------------------------------------------------------------------------
+
+
+def _nested(depth: int) -> tuple[FastMCP, str]:
+    """Build a mount chain *depth* levels deep; return root and tool name."""
+    server = _child("leaf", 10)
+    name = "tool_0"
+    for level in range(depth):
+        parent = FastMCP(f"level_{level}")
+        parent.mount(server, namespace=f"l{level}")
+        server = parent
+        name = f"l{level}_{name}"
+    return server, name
+
+
+@pytest.mark.benchmark(group="mount-call")
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_call_mounted_tool(benchmark, depth):
+    """Call a tool mounted *depth* levels deep via in-memory client."""
+    root, name = _nested(depth)
+
+    async def _run():
+        async with Client(root) as c:
+            for _ in range(10):
+                await c.call_tool(name, {"x": "hello"})
+
+    benchmark.pedantic(
+        lambda: asyncio.get_event_loop().run_until_complete(_run()),
+        rounds=10,
+        warmup_rounds=1,
+    )
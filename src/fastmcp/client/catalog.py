@@ -0,0 +1,107 @@
+"""Client-side cache of a server's tools, resources and prompts."""
+
+from __future__ import annotations
+
+from typing import Any, Literal, TypeAlias
+
+import mcp.types
+
+from fastmcp.client.messages import Message, MessageHandlerT
+
+CatalogKind: TypeAlias = Literal["tools", "resources", "resource_templates", "prompts"]
+
+_LIST_CHANGED_KINDS: dict[type, tuple[CatalogKind, ...]] = {
+    mcp.types.ToolListChangedNotification: ("tools",),
+    mcp.types.ResourceListChangedNotification: ("resources", "resource_templates"),
+    mcp.types.PromptListChangedNotification: ("prompts",),
+}
+
+
+def notifies_list_changed(
+    capabilities: mcp.types.ServerCapabilities, kind: CatalogKind
+) -> bool:
+    """Whether a server advertises list_changed notifications for `kind`."""
+    if kind == "tools":
+        capability = capabilities.tools
+    elif kind == "prompts":
+        capability = capabilities.prompts
+    else:
+        capability = capabilities.resources
+    return bool(capability and capability.listChanged)
+
+
+class ClientCatalog:
+    """Component lists cached by a client and shared with its `Client.new()` copies.
+
+    A list is only trusted while a session to the server is open, since that
+    is the only way to hear about changes: the catalog is cleared when the
+    first session opens and a list is dropped when the server sends the
+    matching list_changed notification.
+    """
+
+    def __init__(self) -> None:
+        self._lists: dict[CatalogKind, list[Any]] = {}
+        self._generations: dict[CatalogKind, int] = {}
+        self._tools_by_name: dict[str, mcp.types.Tool] = {}
+        self._open_sessions = 0
+        # Output schemas of the cached tools, in the shape of the session's
+        # `_tool_output_schemas` so call results can be parsed against them.
+        # Updated in place, so callers may hold on to it across a refresh.
+        self.tool_output_schemas: dict[str, dict[str, Any] | None] = {}
+
+    def get(self, kind: CatalogKind) -> list[Any] | None:
+        """Return a copy of the cached list for `kind`, or None if not cached."""
+        items = self._lists.get(kind)
+        return list(items) if items is not None else None
+
+    def get_tool(self, name: str) -> mcp.types.Tool | None:
+        return self._tools_by_name.get(name)
+
+    def generation(self, kind: CatalogKind) -> int:
+        """Return a token to pass to `store` after fetching the list for `kind`."""
+        return self._generations.get(kind, 0)
+
+    def store(self, kind: CatalogKind, items: list[Any], generation: int) -> None:
+        """Cache a fetched list unless it was invalidated while being fetched."""
+        if generation != self.generation(kind):
+            return
+        self._lists[kind] = list(items)
+        if kind == "tools":
+            self._tools_by_name = {tool.name: tool for tool in items}
+            self.tool_output_schemas.clear()
+            self.tool_output_schemas.update(
+                (tool.name, tool.outputSchema) for tool in items
+            )
+
+    def invalidate(self, *kinds: CatalogKind) -> None:
+        for kind in kinds:
+            self._generations[kind] = self.generation(kind) + 1
+            self._lists.pop(kind, None)
+            if kind == "tools":
+                self._tools_by_name = {}
+                self.tool_output_schemas.clear()
+
+    def clear(self) -> None:
+        self.invalidate("tools", "resources", "resource_templates", "prompts")
+
+    def session_opened(self) -> None:
+        if self._open_sessions == 0:
+            # Nothing was listening for changes since the last session closed
+            self.clear()
+        self._open_sessions += 1
+
+    def session_closed(self) -> None:
+        self._open_sessions -= 1
+
+    def wrap_message_handler(self, handler: MessageHandlerT | None) -> MessageHandlerT:
+        """Wrap a session's message handler to invalidate on list_changed."""
+
+        async def message_handler(message: Message) -> None:
+            if isinstance(message, mcp.types.ServerNotification):
+                kinds = _LIST_CHANGED_KINDS.get(type(message.root))
+                if kinds:
+                    self.invalidate(*kinds)
+            if handler is not None:
+                await handler(message)
+
+        return message_handler
@@ -22,6 +22,7 @@ from pydantic import AnyUrl
 
 import fastmcp
 from fastmcp.client.auth.oauth import OAuth
+from fastmcp.client.catalog import CatalogKind, ClientCatalog, notifies_list_changed
 from fastmcp.client.elicitation import ElicitationHandler, create_elicitation_callback
 from fastmcp.client.logging import (
     LogHandler,
@@ -102,6 +103,8 @@ class ClientSessionState:
 
     session: ClientSession | None = None
     nesting_counter: int = 0
+    # References counted by _reserve_reference() but not yet entered
+    reserved_references: int = 0
     lock: anyio.Lock = field(default_factory=anyio.Lock)
     session_task: asyncio.Task | None = None
     ready_event: anyio.Event = field(default_factory=anyio.Event)
@@ -171,6 +174,10 @@ class Client(
         timeout: Optional timeout for requests (seconds or timedelta)
         init_timeout: Optional timeout for initial connection (seconds or timedelta).
             Set to 0 to disable. If None, uses the value in the FastMCP global settings.
+        cache_catalog: Cache the lists of tools, resources and prompts, and drop
+            them when the server reports a change. Only lists the server sends
+            list_changed notifications for are cached. The cache is shared with
+            copies made by `new()`.
 
     Examples:
         ```python
@@ -260,6 +267,7 @@ class Client(
         client_info: mcp.types.Implementation | None = None,
         auth: httpx.Auth | Literal["oauth"] | str | None = None,
         verify: ssl.SSLContext | bool | str | None = None,
+        cache_catalog: bool = False,
     ) -> None:
         self.name = name or self.generate_name()
 
@@ -343,6 +351,9 @@ class Client(
         # Session context management - see class docstring for detailed explanation
         self._session_state = ClientSessionState()
 
+        # Shared with copies made by new(), which talk to the same server
+        self._catalog: ClientCatalog | None = ClientCatalog() if cache_catalog else None
+
         # Track task IDs submitted by this client (for list_tasks support)
         self._submitted_task_ids: set[str] = set()
 
@@ -365,6 +376,7 @@ class Client(
         if full:
             self._session_state.session_task = None
             self._session_state.nesting_counter = 0
+            self._session_state.reserved_references = 0
 
     @property
     def session(self) -> ClientSession:
@@ -381,6 +393,15 @@ class Client(
         """Get the result of the initialization request."""
         return self._session_state.initialize_result
 
+    def _catalog_for(self, kind: CatalogKind) -> ClientCatalog | None:
+        """Return the catalog if lists of `kind` can be cached for this server."""
+        result = self.initialize_result
+        if self._catalog is None or result is None:
+            return None
+        if not notifies_list_changed(result.capabilities, kind):
+            return None
+        return self._catalog
+
     def set_roots(self, roots: RootsList | RootsHandler) -> None:
         """Set the roots for the client. This does not automatically call `send_roots_list_changed`."""
         self._session_kwargs["list_roots_callback"] = create_roots_callback(roots)
@@ -458,11 +479,19 @@ class Client(
 
     @asynccontextmanager
     async def _context_manager(self):
+        session_kwargs = self._session_kwargs
+        if self._catalog is not None:
+            session_kwargs = {
+                **session_kwargs,
+                "message_handler": self._catalog.wrap_message_handler(
+                    session_kwargs.get("message_handler")
+                ),
+            }
         with catch(get_catch_handlers()):
-            async with self.transport.connect_session(
-                **self._session_kwargs
-            ) as session:
+            async with self.transport.connect_session(**session_kwargs) as session:
                 self._session_state.session = session
+                if self._catalog is not None:
+                    self._catalog.session_opened()
                 # Initialize the session if auto_initialize is enabled
                 try:
                     if self.auto_initialize:
@@ -472,6 +501,8 @@ class Client(
                     raise RuntimeError("Server session was closed unexpectedly") from e
                 finally:
                     self._reset_session_state()
+                    if self._catalog is not None:
+                        self._catalog.session_closed()
 
     async def initialize(
         self,
@@ -550,7 +581,13 @@ class Client(
                 or self._session_state.session_task.done()
             )
 
+            if not need_to_start and self._session_state.reserved_references:
+                # Enter with a reference counted ahead of time
+                self._session_state.reserved_references -= 1
+                return self
+
             if need_to_start:
+                self._session_state.reserved_references = 0
                 if self._session_state.nesting_counter != 0:
                     raise RuntimeError(
                         f"Internal error: nesting counter should be 0 when starting new session, got {self._session_state.nesting_counter}"
@@ -620,6 +657,20 @@ class Client(
 
         return self
 
+    def _reserve_reference(self) -> bool:
+        """Count the next `async with` on a running session ahead of time.
+
+        Lets code that hands out an already-connected client (such as a
+        session pool) count the reference when it hands it out rather than
+        when the recipient enters it. Returns False if no session is running.
+        """
+        task = self._session_state.session_task
+        if task is None or task.done() or self._session_state.nesting_counter == 0:
+            return False
+        self._session_state.nesting_counter += 1
+        self._session_state.reserved_references += 1
+        return True
+
     async def _disconnect(self, force: bool = False):
         """
         Disconnect from session using reference counting.
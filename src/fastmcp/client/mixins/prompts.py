@@ -72,6 +72,9 @@ class ClientPromptsMixin:
         returning the complete list. For manual pagination control (e.g., to handle
         large result sets incrementally), use list_prompts_mcp() with the cursor parameter.
 
+        On a client created with `cache_catalog=True`, the list is served from
+        the cache until the server reports that it changed.
+
         Args:
             max_pages: Maximum number of pages to fetch before raising. Defaults to 250.
 
@@ -82,6 +85,14 @@ class ClientPromptsMixin:
             RuntimeError: If the page limit is reached before pagination completes.
             McpError: If the request results in a TimeoutError | JSONRPCError
         """
+        catalog = self._catalog_for("prompts")
+        generation = 0
+        if catalog is not None:
+            cached = catalog.get("prompts")
+            if cached is not None:
+                return cached
+            generation = catalog.generation("prompts")
+
         all_prompts: list[mcp.types.Prompt] = []
         cursor: str | None = None
         seen_cursors: set[str] = set()
@@ -107,6 +118,8 @@ class ClientPromptsMixin:
                 " or increase max_pages."
             )
 
+        if catalog is not None:
+            catalog.store("prompts", all_prompts, generation)
         return all_prompts
 
     # --- Prompt ---
@@ -71,6 +71,9 @@ class ClientResourcesMixin:
         returning the complete list. For manual pagination control (e.g., to handle
         large result sets incrementally), use list_resources_mcp() with the cursor parameter.
 
+        On a client created with `cache_catalog=True`, the list is served from
+        the cache until the server reports that it changed.
+
         Args:
             max_pages: Maximum number of pages to fetch before raising. Defaults to 250.
 
@@ -81,6 +84,14 @@ class ClientResourcesMixin:
             RuntimeError: If the page limit is reached before pagination completes.
             McpError: If the request results in a TimeoutError | JSONRPCError
         """
+        catalog = self._catalog_for("resources")
+        generation = 0
+        if catalog is not None:
+            cached = catalog.get("resources")
+            if cached is not None:
+                return cached
+            generation = catalog.generation("resources")
+
         all_resources: list[mcp.types.Resource] = []
         cursor: str | None = None
         seen_cursors: set[str] = set()
@@ -106,6 +117,8 @@ class ClientResourcesMixin:
                 " or increase max_pages."
             )
 
+        if catalog is not None:
+            catalog.store("resources", all_resources, generation)
         return all_resources
 
     async def list_resource_templates_mcp(
@@ -148,6 +161,9 @@ class ClientResourcesMixin:
         large result sets incrementally), use list_resource_templates_mcp() with the
         cursor parameter.
 
+        On a client created with `cache_catalog=True`, the list is served from
+        the cache until the server reports that it changed.
+
         Args:
             max_pages: Maximum number of pages to fetch before raising. Defaults to 250.
 
@@ -158,6 +174,14 @@ class ClientResourcesMixin:
             RuntimeError: If the page limit is reached before pagination completes.
             McpError: If the request results in a TimeoutError | JSONRPCError
         """
+        catalog = self._catalog_for("resource_templates")
+        generation = 0
+        if catalog is not None:
+            cached = catalog.get("resource_templates")
+            if cached is not None:
+                return cached
+            generation = catalog.generation("resource_templates")
+
         all_templates: list[mcp.types.ResourceTemplate] = []
         cursor: str | None = None
         seen_cursors: set[str] = set()
@@ -184,6 +208,8 @@ class ClientResourcesMixin:
                 " or increase max_pages."
             )
 
+        if catalog is not None:
+            catalog.store("resource_templates", all_templates, generation)
         return all_templates
 
     async def read_resource_mcp(
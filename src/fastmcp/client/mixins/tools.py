@@ -76,6 +76,9 @@ class ClientToolsMixin:
         returning the complete list. For manual pagination control (e.g., to handle
         large result sets incrementally), use list_tools_mcp() with the cursor parameter.
 
+        On a client created with `cache_catalog=True`, the list is served from
+        the cache until the server reports that it changed.
+
         Args:
             max_pages: Maximum number of pages to fetch before raising. Defaults to 250.
 
@@ -86,6 +89,14 @@ class ClientToolsMixin:
             RuntimeError: If the page limit is reached before pagination completes.
             McpError: If the request results in a TimeoutError | JSONRPCError
         """
+        catalog = self._catalog_for("tools")
+        generation = 0
+        if catalog is not None:
+            cached = catalog.get("tools")
+            if cached is not None:
+                return cached
+            generation = catalog.generation("tools")
+
         all_tools: list[mcp.types.Tool] = []
         cursor: str | None = None
         seen_cursors: set[str] = set()
@@ -111,8 +122,30 @@ class ClientToolsMixin:
                 " or increase max_pages."
             )
 
+        if catalog is not None:
+            catalog.store("tools", all_tools, generation)
         return all_tools
 
+    async def get_tool(self: Client, name: str) -> mcp.types.Tool | None:
+        """Return the definition of a single tool, or None if there is no such tool.
+
+        On a client created with `cache_catalog=True`, the definition is looked
+        up in the cached tool list, so the server is only asked for the list if
+        it isn't cached.
+
+        Args:
+            name: The name of the tool.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+            McpError: If the request results in a TimeoutError | JSONRPCError
+        """
+        catalog = self._catalog_for("tools")
+        if catalog is not None and catalog.get("tools") is not None:
+            return catalog.get_tool(name)
+        tools = await self.list_tools()
+        return next((tool for tool in tools if tool.name == name), None)
+
     # --- Call Tool ---
 
     async def call_tool_mcp(
@@ -158,6 +191,14 @@ class ClientToolsMixin:
             # Inject trace context into meta for propagation to server
             propagated_meta = inject_trace_context(meta)
 
+            if self._catalog_for("tools") is not None:
+                # The session validates structured output against schemas it
+                # collects by listing tools; hand it the catalog's schema so a
+                # call never triggers that listing.
+                tool = await self.get_tool(name)
+                if tool is not None:
+                    self.session._tool_output_schemas[name] = tool.outputSchema
+
             result = await self._await_with_session_monitoring(
                 self.session.call_tool(
                     name=name,
@@ -198,11 +239,19 @@ class ClientToolsMixin:
             CallToolResult: Parsed result with structured data
         """
 
+        tool_output_schemas = self.session._tool_output_schemas
+        list_tools_fn = self.session.list_tools
+        catalog = self._catalog_for("tools")
+        if catalog is not None:
+            # Listing goes through the catalog, which keeps its own schemas
+            tool_output_schemas = catalog.tool_output_schemas
+            list_tools_fn = self.list_tools
+
         return await _parse_call_tool_result(
             name=name,
             result=result,
-            tool_output_schemas=self.session._tool_output_schemas,
-            list_tools_fn=self.session.list_tools,
+            tool_output_schemas=tool_output_schemas,
+            list_tools_fn=list_tools_fn,
             client_name=self.name,
             raise_on_error=raise_on_error,
         )
@@ -1,9 +1,12 @@
+import asyncio
 import contextlib
 import datetime
+import weakref
 from collections.abc import AsyncIterator
 from typing import Any
 
-from mcp import ClientSession
+import anyio
+from mcp import ClientSession, ServerSession
 from typing_extensions import Unpack
 
 from fastmcp.client.transports.base import ClientTransport, SessionKwargs
@@ -16,12 +19,38 @@ from fastmcp.mcp_config import (
     TransformingRemoteMCPServer,
     TransformingStdioMCPServer,
 )
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.server.middleware.middleware import CallNext
 from fastmcp.server.server import FastMCP, create_proxy
 from fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class _SessionTracker(Middleware):
+    """Remembers the sessions of a composite so late mounts can be announced."""
+
+    def __init__(self) -> None:
+        self.sessions: weakref.WeakSet[ServerSession] = weakref.WeakSet()
+
+    async def on_request(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        if context.fastmcp_context is not None:
+            with contextlib.suppress(RuntimeError):
+                self.sessions.add(context.fastmcp_context.session)
+        return await call_next(context)
+
+    async def notify_list_changed(self) -> None:
+        for session in list(self.sessions):
+            try:
+                await session.send_tool_list_changed()
+                await session.send_resource_list_changed()
+                await session.send_prompt_list_changed()
+            except Exception:
+                logger.debug("Failed to send list_changed notification", exc_info=True)
+
+
 class MCPConfigTransport(ClientTransport):
     """Transport for connecting to one or more MCP servers defined in an MCPConfig.
 
@@ -67,13 +96,30 @@ class MCPConfigTransport(ClientTransport):
             # Access resources with prefixed URIs
             icons = await client.read_resource("weather://weather/icons/sunny")
         ```
+
+    Backends of a multi-server config are connected concurrently. A backend
+    that fails or exceeds `connect_timeout` is skipped. The composite starts
+    once every backend has connected or failed, or when `startup_timeout`
+    expires. Backends still connecting at that point are abandoned, unless
+    `mount_late` is set: then they keep connecting and are mounted when
+    ready, and connected sessions receive list_changed notifications.
     """
 
-    def __init__(self, config: MCPConfig | dict, name_as_prefix: bool = True):
+    def __init__(
+        self,
+        config: MCPConfig | dict,
+        name_as_prefix: bool = True,
+        connect_timeout: float | None = 30.0,
+        startup_timeout: float | None = None,
+        mount_late: bool = False,
+    ):
         if isinstance(config, dict):
             config = MCPConfig.from_dict(config)
         self.config = config
         self.name_as_prefix = name_as_prefix
+        self.connect_timeout = connect_timeout
+        self.startup_timeout = startup_timeout
+        self.mount_late = mount_late
         self._transports: list[ClientTransport] = []
 
         if not self.config.mcpServers:
@@ -99,7 +145,10 @@ class MCPConfigTransport(ClientTransport):
         # the duration of this context (fixes session persistence for
         # streamable-http backends — see #2790).
         timeout = session_kwargs.get("read_timeout_seconds")
-        composite = FastMCP[Any](name="MCPRouter")
+        tracker = _SessionTracker()
+        composite = FastMCP[Any](
+            name="MCPRouter", middleware=[tracker] if self.mount_late else None
+        )
 
         async with contextlib.AsyncExitStack() as stack:
             # Close any previous transports from prior connections to avoid leaking
@@ -107,31 +156,99 @@ class MCPConfigTransport(ClientTransport):
                 await t.close()
             self._transports = []
 
-            for name, server_config in self.config.mcpServers.items():
-                try:
-                    transport, _client, proxy = await self._create_proxy(
-                        name, server_config, timeout, stack
-                    )
-                except Exception:  # Broad catch is intentional: failure modes
-                    # are diverse (OSError, TimeoutError, RuntimeError, etc.)
-                    # and the whole point is to skip any server that can't connect.
-                    logger.warning(
-                        "Failed to connect to MCP server %r, skipping",
-                        name,
-                        exc_info=True,
-                    )
-                    continue
-                self._transports.append(transport)
+            connected: dict[str, FastMCP[Any]] = {}
+            scopes: dict[str, anyio.CancelScope] = {}
+            startup_done = anyio.Event()
+            started = False
+
+            def mount(name: str, proxy: FastMCP[Any]) -> None:
                 composite.mount(proxy, namespace=name if self.name_as_prefix else None)
 
-            if not self._transports:
+            async def connect(name: str, server_config: MCPServerTypes) -> None:
+                with scopes[name]:
+                    try:
+                        with anyio.fail_after(self.connect_timeout):
+                            transport, _client, proxy = await self._create_proxy(
+                                name, server_config, timeout, stack
+                            )
+                    except Exception:  # Broad catch is intentional: failure modes
+                        # are diverse (OSError, TimeoutError, RuntimeError, etc.)
+                        # and the whole point is to skip any server that can't connect.
+                        logger.warning(
+                            "Failed to connect to MCP server %r, skipping",
+                            name,
+                            exc_info=True,
+                        )
+                        return
+                    finally:
+                        del scopes[name]
+                        if not scopes:
+                            startup_done.set()
+                    self._transports.append(transport)
+                    if not started:
+                        connected[name] = proxy
+                        return
+                    logger.info("MCP server %r connected late, mounting it", name)
+                    try:
+                        mount(name, proxy)
+                        await tracker.notify_list_changed()
+                    except Exception:
+                        logger.warning(
+                            "Failed to mount late MCP server %r",
+                            name,
+                            exc_info=True,
+                        )
+
+            async def connect_all() -> None:
+                async with anyio.create_task_group() as tg:
+                    for name, server_config in self.config.mcpServers.items():
+                        tg.start_soon(connect, name, server_config)
+
+            for name in self.config.mcpServers:
+                scopes[name] = anyio.CancelScope()
+
+            # Connect in a separate task rather than a task group around the
+            # yield, since the session may be closed from another task while
+            # late backends are still connecting.
+            connecting = asyncio.create_task(connect_all())
+            try:
+                with anyio.move_on_after(self.startup_timeout):
+                    await startup_done.wait()
+                started = True
+
+                if scopes:
+                    logger.warning(
+                        "MCP servers %s did not connect within %ss%s",
+                        sorted(scopes),
+                        self.startup_timeout,
+                        ", they will be mounted when ready"
+                        if self.mount_late
+                        else ", skipping",
+                    )
+                    if not self.mount_late:
+                        for scope in scopes.values():
+                            scope.cancel()
+
+                # Mount in config order so name conflicts resolve predictably
+                for name in self.config.mcpServers:
+                    if name in connected:
+                        mount(name, connected[name])
+
+                serve = bool(connected) or (self.mount_late and bool(scopes))
+                if serve:
+                    async with FastMCPTransport(mcp=composite).connect_session(
+                        **session_kwargs
+                    ) as session:
+                        yield session
+            finally:
+                # Stop connecting backends nobody will use
+                connecting.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await connecting
+
+            if not serve:
                 raise ConnectionError("All MCP servers failed to connect")
 
-            async with FastMCPTransport(mcp=composite).connect_session(
-                **session_kwargs
-            ) as session:
-                yield session
-
     async def _create_proxy(
         self,
         name: str,
@@ -11,7 +11,7 @@ from typing import Any, Literal, cast
 import httpx
 from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
-from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared._httpx_utils import McpHttpClientFactory
 from pydantic import AnyUrl
 from typing_extensions import Unpack
 
@@ -21,6 +21,7 @@ from fastmcp.client.auth.oauth import OAuth
 from fastmcp.client.transports.base import ClientTransport, SessionKwargs
 from fastmcp.exceptions import FastMCPDeprecationWarning
 from fastmcp.server.dependencies import get_http_headers
+from fastmcp.utilities.http import create_pooled_http_client
 from fastmcp.utilities.timeout import normalize_timeout_to_timedelta
 
 
@@ -168,7 +169,7 @@ class StreamableHttpTransport(ClientTransport):
             timeout = httpx.Timeout(30.0, read=read_timeout_seconds.total_seconds())
 
         # Create httpx client from factory or use default with MCP-appropriate
-        # timeouts. Note: create_mcp_http_client enables follow_redirects, but
+        # timeouts. Note: create_pooled_http_client enables follow_redirects, but
         # httpx automatically strips Authorization headers on cross-origin
         # redirects to prevent credential leakage.
         verify_factory = self._make_verify_factory()
@@ -186,7 +187,8 @@ class StreamableHttpTransport(ClientTransport):
                 auth=self.auth,
             )
         else:
-            http_client = create_mcp_http_client(
+            # Connections come from the shared pool and outlive this session
+            http_client = create_pooled_http_client(
                 headers=headers,
                 timeout=timeout,
                 auth=self.auth,
@@ -19,6 +19,7 @@ from fastmcp.client.auth.bearer import BearerAuth
 from fastmcp.client.auth.oauth import OAuth
 from fastmcp.client.transports.base import ClientTransport, SessionKwargs
 from fastmcp.server.dependencies import get_http_headers
+from fastmcp.utilities.http import create_pooled_http_client
 from fastmcp.utilities.timeout import normalize_timeout_to_timedelta
 
 
@@ -144,8 +145,9 @@ class SSETransport(ClientTransport):
             client_kwargs["httpx_client_factory"] = self.httpx_client_factory
         else:
             verify_factory = self._make_verify_factory()
-            if verify_factory is not None:
-                client_kwargs["httpx_client_factory"] = verify_factory
+            client_kwargs["httpx_client_factory"] = (
+                verify_factory or create_pooled_http_client
+            )
 
         async with sse_client(self.url, auth=self.auth, **client_kwargs) as transport:
             read_stream, write_stream = transport
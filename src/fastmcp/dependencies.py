@@ -8,7 +8,7 @@ using the uncalled-for DI engine. Only task-related dependencies (CurrentDocket,
 CurrentWorker) and background task execution require fastmcp[tasks].
 """
 
-from uncalled_for import Dependency, Depends, Shared
+from uncalled_for import Dependency, Shared
 
 from fastmcp.server.dependencies import (
     CurrentAccessToken,
@@ -18,6 +18,8 @@ from fastmcp.server.dependencies import (
     CurrentHeaders,
     CurrentRequest,
     CurrentWorker,
+    DependencyScope,
+    Depends,
     Progress,
     ProgressLike,
     TokenClaim,
@@ -32,6 +34,7 @@ __all__ = [
     "CurrentRequest",
     "CurrentWorker",
     "Dependency",
+    "DependencyScope",
     "Depends",
     "Progress",
     "ProgressLike",
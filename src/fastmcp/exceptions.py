@@ -28,6 +28,10 @@ class ToolError(FastMCPError):
     """Error in tool operations."""
 
 
+class ExecutorSaturatedError(ToolError):
+    """A tool call was rejected because its executor queue is full."""
+
+
 class PromptError(FastMCPError):
     """Error in prompt operations."""
 
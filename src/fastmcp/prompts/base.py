@@ -211,26 +211,33 @@ class Prompt(FastMCPComponent):
         self,
         **overrides: Any,
     ) -> SDKPrompt:
-        """Convert the prompt to an MCP prompt."""
-        arguments = [
-            SDKPromptArgument(
-                name=arg.name,
-                description=arg.description,
-                required=arg.required,
+        """Convert the prompt to an MCP prompt.
+
+        Calls without overrides are memoized on the component.
+        """
+
+        def build() -> SDKPrompt:
+            arguments = [
+                SDKPromptArgument(
+                    name=arg.name,
+                    description=arg.description,
+                    required=arg.required,
+                )
+                for arg in self.arguments or []
+            ]
+
+            return SDKPrompt(
+                name=overrides.get("name", self.name),
+                description=overrides.get("description", self.description),
+                arguments=arguments,
+                title=overrides.get("title", self.title),
+                icons=overrides.get("icons", self.icons),
+                _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
+                    "_meta", self.get_meta()
+                ),  # ty:ignore[unknown-argument]
             )
-            for arg in self.arguments or []
-        ]
 
-        return SDKPrompt(
-            name=overrides.get("name", self.name),
-            description=overrides.get("description", self.description),
-            arguments=arguments,
-            title=overrides.get("title", self.title),
-            icons=overrides.get("icons", self.icons),
-            _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
-                "_meta", self.get_meta()
-            ),  # ty:ignore[unknown-argument]
-        )
+        return self._memoized_wire(overrides, build)
 
     @classmethod
     def from_function(
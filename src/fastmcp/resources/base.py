@@ -406,20 +406,26 @@ class Resource(FastMCPComponent):
         self,
         **overrides: Any,
     ) -> SDKResource:
-        """Convert the resource to an SDKResource."""
-
-        return SDKResource(
-            name=overrides.get("name", self.name),
-            uri=overrides.get("uri", self.uri),
-            description=overrides.get("description", self.description),
-            mimeType=overrides.get("mimeType", self.mime_type),
-            title=overrides.get("title", self.title),
-            icons=overrides.get("icons", self.icons),
-            annotations=overrides.get("annotations", self.annotations),
-            _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
-                "_meta", self.get_meta()
-            ),  # ty:ignore[unknown-argument]
-        )
+        """Convert the resource to an SDKResource.
+
+        Calls without overrides are memoized on the component.
+        """
+
+        def build() -> SDKResource:
+            return SDKResource(
+                name=overrides.get("name", self.name),
+                uri=overrides.get("uri", self.uri),
+                description=overrides.get("description", self.description),
+                mimeType=overrides.get("mimeType", self.mime_type),
+                title=overrides.get("title", self.title),
+                icons=overrides.get("icons", self.icons),
+                annotations=overrides.get("annotations", self.annotations),
+                _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
+                    "_meta", self.get_meta()
+                ),  # ty:ignore[unknown-argument]
+            )
+
+        return self._memoized_wire(overrides, build)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(uri={self.uri!r}, name={self.name!r}, description={self.description!r}, tags={self.tags})"
@@ -38,12 +38,18 @@ from fastmcp.utilities.types import get_cached_typeadapter
 
 def extract_query_params(uri_template: str) -> set[str]:
     """Extract query parameter names from RFC 6570 `{?param1,param2}` syntax."""
+    return set(_query_param_names(uri_template))
+
+
+@functools.lru_cache(maxsize=5000)
+def _query_param_names(uri_template: str) -> frozenset[str]:
     match = re.search(r"\{\?([^}]+)\}", uri_template)
     if match:
-        return {p.strip() for p in match.group(1).split(",")}
-    return set()
+        return frozenset(p.strip() for p in match.group(1).split(","))
+    return frozenset()
 
 
+@functools.lru_cache(maxsize=5000)
 def build_regex(template: str) -> re.Pattern[str] | None:
     """Build regex pattern for URI template, handling RFC 6570 syntax.
 
@@ -57,6 +63,9 @@ def build_regex(template: str) -> re.Pattern[str] | None:
 
     Returns None if the template produces an invalid regex (e.g. parameter
     names with leading digits or duplicates from a remote server).
+
+    Compiled patterns are cached by template string, so repeated matching
+    against the same template doesn't rebuild the regex.
     """
     # Remove query parameter syntax for path matching
     template_without_query = re.sub(r"\{\?[^}]+\}", "", template)
@@ -103,7 +112,7 @@ def match_uri_template(uri: str, uri_template: str) -> dict[str, str] | None:
 
     # Extract query parameters if present in URI and template
     if query_string:
-        query_param_names = extract_query_params(uri_template)
+        query_param_names = _query_param_names(uri_template)
         parsed_query = parse_qs(query_string)
 
         for name in query_param_names:
@@ -313,20 +322,26 @@ class ResourceTemplate(FastMCPComponent):
         self,
         **overrides: Any,
     ) -> SDKResourceTemplate:
-        """Convert the resource template to an SDKResourceTemplate."""
-
-        return SDKResourceTemplate(
-            name=overrides.get("name", self.name),
-            uriTemplate=overrides.get("uriTemplate", self.uri_template),
-            description=overrides.get("description", self.description),
-            mimeType=overrides.get("mimeType", self.mime_type),
-            title=overrides.get("title", self.title),
-            icons=overrides.get("icons", self.icons),
-            annotations=overrides.get("annotations", self.annotations),
-            _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
-                "_meta", self.get_meta()
-            ),  # ty:ignore[unknown-argument]
-        )
+        """Convert the resource template to an SDKResourceTemplate.
+
+        Calls without overrides are memoized on the component.
+        """
+
+        def build() -> SDKResourceTemplate:
+            return SDKResourceTemplate(
+                name=overrides.get("name", self.name),
+                uriTemplate=overrides.get("uriTemplate", self.uri_template),
+                description=overrides.get("description", self.description),
+                mimeType=overrides.get("mimeType", self.mime_type),
+                title=overrides.get("title", self.title),
+                icons=overrides.get("icons", self.icons),
+                annotations=overrides.get("annotations", self.annotations),
+                _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
+                    "_meta", self.get_meta()
+                ),  # ty:ignore[unknown-argument]
+            )
+
+        return self._memoized_wire(overrides, build)
 
     @classmethod
     def from_mcp_template(cls, mcp_template: SDKResourceTemplate) -> ResourceTemplate:
@@ -0,0 +1,110 @@
+"""Segment-trie router for resolving URIs to resource templates.
+
+Matching a URI against every template's regex is O(templates) per lookup.
+`TemplateRouter` indexes templates by their `/`-separated path segments once,
+so a lookup walks the trie along the URI's segments and only runs the full
+regex match on the few templates that can possibly match.
+
+Supported template segments:
+- Literal segments (e.g. `users`) are followed by exact string match
+- Segments containing `{var}` consume exactly one URI segment
+- Segments containing `{var*}` consume the rest of the URI
+
+Query parameter blocks (`{?a,b}`) don't participate in routing; they're
+handled by `ResourceTemplate.matches()` during verification.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+from fastmcp.resources.template import ResourceTemplate, build_regex
+
+T = TypeVar("T", bound=ResourceTemplate)
+
+_QUERY_BLOCK = re.compile(r"\{\?[^}]+\}")
+_WILDCARD_VAR = re.compile(r"\{[^}]+\*\}")
+
+
+class _Node:
+    __slots__ = ("literals", "param", "terminal", "wildcards")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _Node] = {}
+        self.param: _Node | None = None
+        # Template indexes whose path ends at this node
+        self.terminal: list[int] = []
+        # Template indexes with a {var*} segment starting at this node
+        self.wildcards: list[int] = []
+
+
+class TemplateRouter(Generic[T]):
+    """Compiled router over a fixed set of resource templates.
+
+    Routers are immutable: build a new one when the template set changes.
+    Candidates are returned in the order the templates were given, so
+    callers that pick a winner (e.g. highest version) see the same order
+    as a linear scan.
+
+    Example:
+        ```python
+        router = TemplateRouter(templates)
+        matching = router.match("weather://london/current")
+        ```
+    """
+
+    def __init__(self, templates: Iterable[T]) -> None:
+        self._templates: list[T] = []
+        self._root = _Node()
+        for template in templates:
+            # Templates that can't compile never match, so don't route to them
+            if build_regex(template.uri_template) is None:
+                continue
+            self._insert(len(self._templates), template.uri_template)
+            self._templates.append(template)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def _insert(self, index: int, uri_template: str) -> None:
+        path = _QUERY_BLOCK.sub("", uri_template)
+        node = self._root
+        for segment in path.split("/"):
+            if _WILDCARD_VAR.search(segment):
+                node.wildcards.append(index)
+                return
+            if "{" in segment:
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                node = node.literals.setdefault(segment, _Node())
+        node.terminal.append(index)
+
+    def candidates(self, uri: str) -> list[T]:
+        """Return templates whose path structure could match `uri`.
+
+        Candidates are not verified against the full template pattern; use
+        `match()` to get only templates that actually match.
+        """
+        segments = uri.partition("?")[0].split("/")
+        found: list[int] = []
+        stack: list[tuple[_Node, int]] = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(segments):
+                found.extend(node.terminal)
+                continue
+            found.extend(node.wildcards)
+            child = node.literals.get(segments[depth])
+            if child is not None:
+                stack.append((child, depth + 1))
+            if node.param is not None:
+                stack.append((node.param, depth + 1))
+        return [self._templates[i] for i in sorted(found)]
+
+    def match(self, uri: str) -> list[T]:
+        """Return all templates that match `uri`, in registration order."""
+        return [t for t in self.candidates(uri) if t.matches(uri) is not None]
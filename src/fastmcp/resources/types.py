@@ -13,6 +13,7 @@ from typing_extensions import override
 
 from fastmcp.exceptions import ResourceError
 from fastmcp.resources.base import Resource, ResourceContent, ResourceResult
+from fastmcp.utilities.http import create_pooled_http_client
 from fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -121,7 +122,9 @@ class HttpResource(Resource):
     @override
     async def read(self) -> ResourceResult:
         """Read the HTTP content."""
-        async with httpx.AsyncClient() as client:
+        async with create_pooled_http_client(
+            timeout=httpx.Timeout(5.0), follow_redirects=False
+        ) as client:
             response = await client.get(self.url)
             _ = response.raise_for_status()
             return ResourceResult(
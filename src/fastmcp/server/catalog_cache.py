@@ -0,0 +1,82 @@
+"""Cache of post-transform component listings.
+
+Building a listing fans out across every provider, re-applies every
+transform and session visibility rule, and filters disabled components.
+For catalogs that only change on deploy or explicit enable/disable, that
+work produces the same result on every request.
+
+`CatalogCache` stores those listings keyed by the server's catalog
+generation (see `Provider.catalog_generation()`) and the session's
+visibility rules. Auth filtering is per-token and is always applied after
+the cache, so cached listings are never specific to a caller.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any, Literal, TypeVar
+
+C = TypeVar("C")
+
+CatalogKind = Literal["tools", "resources", "templates", "prompts"]
+
+
+def _rules_key(rules: Sequence[dict[str, Any]]) -> str:
+    return json.dumps(rules, sort_keys=True, default=str)
+
+
+class CatalogCache:
+    """Bounded LRU of component listings keyed by generation and session rules.
+
+    Entries from an older generation can never be hit again, so they're
+    dropped as soon as a listing for a newer generation is stored.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[CatalogKind, str], list[Any]] = OrderedDict()
+        self._generations: dict[CatalogKind, Hashable] = {}
+
+    def get(
+        self,
+        kind: CatalogKind,
+        generation: Hashable | None,
+        rules: Sequence[dict[str, Any]],
+    ) -> list[Any] | None:
+        """Return the cached listing, or None on a miss.
+
+        A None generation means the catalog is dynamic and is never cached.
+        The returned list is shared; callers must not mutate it.
+        """
+        if generation is None or self._generations.get(kind) != generation:
+            return None
+        key = (kind, _rules_key(rules))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        kind: CatalogKind,
+        generation: Hashable | None,
+        rules: Sequence[dict[str, Any]],
+        components: list[C],
+    ) -> None:
+        """Store a listing computed for the given generation and rules."""
+        if generation is None:
+            return
+        if self._generations.get(kind) != generation:
+            self._generations[kind] = generation
+            for stale in [k for k in self._entries if k[0] == kind]:
+                del self._entries[stale]
+        self._entries[(kind, _rules_key(rules))] = components
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached listings."""
+        self._entries.clear()
+        self._generations.clear()
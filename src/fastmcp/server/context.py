@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import warnings
 import weakref
-from collections.abc import Callable, Generator, Mapping, Sequence
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
@@ -792,6 +792,45 @@ class Context:
         """
         await self.session.send_notification(mcp.types.ServerNotification(notification))
 
+    async def invalidate_cache(
+        self,
+        *,
+        tool: str | None = None,
+        uri_prefix: str | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> int:
+        """Evict cached responses held by this server's response caching middleware.
+
+        Call this after a write so later calls don't see stale results. An entry
+        is evicted if it matches any of the given criteria.
+
+        Args:
+            tool: Evict every cached call to this tool.
+            uri_prefix: Evict every cached read of a resource URI starting with
+                this prefix.
+            tags: Evict entries whose tool or resource has any of these tags.
+
+        Returns:
+            The number of entries evicted.
+
+        Example:
+            ```python
+            @mcp.tool
+            async def update_order(order_id: str, ctx: Context) -> None:
+                await db.update(order_id)
+                await ctx.invalidate_cache(uri_prefix=f"orders://{order_id}")
+            ```
+        """
+        from fastmcp.server.middleware.caching import ResponseCachingMiddleware
+
+        evicted = 0
+        for middleware in self.fastmcp.middleware:
+            if isinstance(middleware, ResponseCachingMiddleware):
+                evicted += await middleware.invalidate(
+                    tool=tool, uri_prefix=uri_prefix, tags=tags
+                )
+        return evicted
+
     async def close_sse_stream(self) -> None:
         """Close the current response stream to trigger client reconnection.
 
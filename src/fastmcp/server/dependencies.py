@@ -17,8 +17,18 @@ from contextvars import ContextVar
 from datetime import datetime, timezone
 from functools import lru_cache
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Protocol, cast, get_type_hints, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Protocol,
+    TypeVar,
+    cast,
+    get_type_hints,
+    runtime_checkable,
+)
 
+import anyio
 from mcp.server.auth.middleware.auth_context import (
     get_access_token as _sdk_get_access_token,
 )
@@ -30,6 +40,7 @@ from mcp.server.lowlevel.server import request_ctx
 from packaging.version import Version
 from starlette.requests import Request
 from uncalled_for import Dependency, get_dependency_parameters
+from uncalled_for import Depends as _request_depends
 from uncalled_for.resolution import _Depends
 
 from fastmcp.exceptions import FastMCPError
@@ -47,6 +58,7 @@ if TYPE_CHECKING:
 
     from fastmcp.server.context import Context
     from fastmcp.server.server import FastMCP
+    from fastmcp.tools.executors import ThreadPool
 
 
 __all__ = [
@@ -58,6 +70,9 @@ __all__ = [
     "CurrentHeaders",
     "CurrentRequest",
     "CurrentWorker",
+    "DependencyScope",
+    "DependencyScopeCache",
+    "Depends",
     "Progress",
     "TaskContextInfo",
     "TaskContextSnapshot",
@@ -537,7 +552,10 @@ def get_access_token() -> AccessToken | None:
 
 @lru_cache(maxsize=5000)
 def without_injected_parameters(
-    fn: Callable[..., Any], *, run_in_thread: bool = True
+    fn: Callable[..., Any],
+    *,
+    run_in_thread: bool = True,
+    thread_pool: ThreadPool | None = None,
 ) -> Callable[..., Any]:
     """Create a wrapper function without injected parameters.
 
@@ -556,6 +574,8 @@ def without_injected_parameters(
             thread after resolving dependencies. Defaults to True. Set to False
             to call ``fn`` inline on the event loop thread — required for
             thread-affinity libraries (e.g. Windows COM). Ignored for async fns.
+        thread_pool: Pool to dispatch sync ``fn`` to instead of anyio's shared
+            worker threads. Only used when ``run_in_thread`` is True.
 
     Returns:
         Async wrapper function without injected parameters
@@ -591,7 +611,10 @@ def without_injected_parameters(
                 return await fn(**resolved_kwargs)
             elif run_in_thread:
                 # Run sync functions in threadpool to avoid blocking the event loop
-                result = await call_sync_fn_in_threadpool(fn, **resolved_kwargs)
+                if thread_pool is not None:
+                    result = await thread_pool.run_sync(fn, **resolved_kwargs)
+                else:
+                    result = await call_sync_fn_in_threadpool(fn, **resolved_kwargs)
                 # Handle sync wrappers that return awaitables (e.g., partial(async_fn))
                 if inspect.isawaitable(result):
                     result = await result
@@ -739,6 +762,138 @@ async def resolve_dependencies(
         yield resolved_kwargs
 
 
+# --- Scoped dependencies ---
+
+R = TypeVar("R")
+
+DependencyScope = Literal["request", "session", "server"]
+
+
+class DependencyScopeCache:
+    """Dependency values shared by every request within one scope.
+
+    Each factory is resolved at most once per scope. Context managers it
+    returns stay open until `aclose()`, which exits them in reverse order.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[Callable[..., Any], Any] = {}
+        self._locks: dict[Callable[..., Any], anyio.Lock] = {}
+        self._stack = AsyncExitStack()
+        self._closed = False
+
+    async def resolve(self, factory: Callable[..., Any]) -> Any:
+        """Return the scope's value for `factory`, resolving it on first use."""
+        if factory in self._values:
+            return self._values[factory]
+        lock = self._locks.setdefault(factory, anyio.Lock())
+        async with lock:
+            if factory in self._values:
+                return self._values[factory]
+            if self._closed:
+                raise RuntimeError("Dependency scope has already been closed")
+            # Resolve against the scope's own cache and exit stack so that
+            # context managers outlive the request that first needed them
+            cache_token = _Depends.cache.set({})
+            stack_token = _Depends.stack.set(self._stack)
+            try:
+                value = await _Depends(factory).__aenter__()
+            finally:
+                _Depends.stack.reset(stack_token)
+                _Depends.cache.reset(cache_token)
+            self._values[factory] = value
+            return value
+
+    async def aclose(self) -> None:
+        """Tear down every value resolved in this scope."""
+        self._closed = True
+        self._values.clear()
+        await self._stack.aclose()
+
+
+def _get_scope_cache(scope: DependencyScope) -> DependencyScopeCache | None:
+    if scope == "server":
+        try:
+            return get_server()._dependency_scope
+        except RuntimeError:
+            return None
+
+    from fastmcp.server.context import _current_context
+    from fastmcp.server.low_level import MiddlewareServerSession
+
+    context = _current_context.get()
+    if context is None:
+        return None
+    try:
+        session = context.session
+    except RuntimeError:
+        return None
+    if not isinstance(session, MiddlewareServerSession):
+        return None
+    return session.dependency_scope
+
+
+class _ScopedDepends(Dependency[R]):
+    """A Depends() whose value is shared across a session or server lifetime."""
+
+    def __init__(self, factory: Callable[..., Any], scope: DependencyScope):
+        self.factory = factory
+        self.scope = scope
+
+    async def __aenter__(self) -> R:
+        scope_cache = _get_scope_cache(self.scope)
+        if scope_cache is None:
+            # No running server or session to hold the value (e.g. a direct
+            # call outside the server lifespan): resolve it for this request
+            return await _Depends(self.factory).__aenter__()
+        return await scope_cache.resolve(self.factory)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+def Depends(
+    dependency: Callable[..., Any], *, scope: DependencyScope = "request"
+) -> Any:
+    """Declare a parameter whose value is produced by `dependency`.
+
+    Args:
+        dependency: A function, async function, or (async) context manager
+            factory. Its own parameters may use Depends() too.
+        scope: How long a resolved value is reused.
+            "request" resolves it for every call and tears it down afterwards.
+            "session" resolves it once per MCP session and tears it down when
+            the session ends. "server" resolves it once while the server is
+            running and tears it down when the server lifespan exits.
+            Outside a running session or server, wider scopes fall back to
+            "request".
+
+    Example:
+        ```python
+        from fastmcp.dependencies import Depends
+
+        @asynccontextmanager
+        async def db_pool():
+            async with create_pool(DSN) as pool:
+                yield pool
+
+        @mcp.tool
+        async def query(sql: str, pool=Depends(db_pool, scope="server")) -> list:
+            return await pool.fetch(sql)
+        ```
+    """
+    if scope == "request":
+        return _request_depends(dependency)
+    if scope not in ("session", "server"):
+        raise ValueError(f"Unknown dependency scope: {scope!r}")
+    return _ScopedDepends(dependency, scope)
+
+
 # --- Dependency classes ---
 # These must inherit from docket.dependencies.Dependency when docket is available
 # so that get_dependency_parameters can detect them.
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import time
 import weakref
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from types import TracebackType
 from typing import TYPE_CHECKING, Any
 
 import anyio
+import jsonschema
+import jsonschema.exceptions
+import jsonschema.protocols
+import jsonschema.validators
 import mcp.types
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcp import LoggingLevel, McpError
@@ -20,18 +29,90 @@ from mcp.server.lowlevel.server import (
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
 from mcp.server.stdio import stdio_server as stdio_server
+from mcp.shared.exceptions import UrlElicitationRequiredError
 from mcp.shared.message import SessionMessage
 from mcp.shared.session import RequestResponder
 from pydantic import AnyUrl
 
 from fastmcp.apps.config import UI_EXTENSION_ID
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
+    from fastmcp.server.dependencies import DependencyScopeCache
     from fastmcp.server.server import FastMCP
 
 logger = get_logger(__name__)
 
+ToolCallResult = (
+    list[mcp.types.ContentBlock]
+    | tuple[list[mcp.types.ContentBlock], dict[str, Any]]
+    | dict[str, Any]
+    | mcp.types.CallToolResult
+    | mcp.types.CreateTaskResult
+)
+
+_schema_validators: dict[str, jsonschema.protocols.Validator] = {}
+_MAX_SCHEMA_VALIDATORS = 1024
+# Seconds a tool definition is reused when the catalog has no generation
+_UNVERSIONED_DEFINITION_TTL = 5.0
+
+
+def get_schema_validator(schema: dict[str, Any]) -> jsonschema.protocols.Validator:
+    """Return a compiled validator for a JSON schema.
+
+    Validators are cached by a hash of the canonical schema, so tools that
+    share a schema share one validator and the schema is checked only once.
+    """
+    key = hashlib.sha256(
+        json.dumps(schema, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    validator = _schema_validators.get(key)
+    if validator is None:
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        if len(_schema_validators) >= _MAX_SCHEMA_VALIDATORS:
+            _schema_validators.pop(next(iter(_schema_validators)))
+        _schema_validators[key] = validator
+    return validator
+
+
+def _requested_version(meta: mcp.types.RequestParams.Meta | None) -> str | None:
+    """Return the tool version a request pinned in `_meta.fastmcp.version`."""
+    if meta is None:
+        return None
+    fastmcp_meta = meta.model_dump(exclude_none=True).get("fastmcp")
+    if not isinstance(fastmcp_meta, dict):
+        return None
+    return fastmcp_meta.get("version")
+
+
+def _first_error(
+    validator: jsonschema.protocols.Validator, instance: Any
+) -> jsonschema.ValidationError | None:
+    return jsonschema.exceptions.best_match(validator.iter_errors(instance))
+
+
+@dataclass(frozen=True)
+class _ToolDefinition:
+    """What the call_tool handler needs to know about a tool."""
+
+    input_validator: jsonschema.protocols.Validator | None
+    output_validator: jsonschema.protocols.Validator | None
+    # Catalog generation the tool was looked up at; None is reused only
+    # until _UNVERSIONED_DEFINITION_TTL has passed since created_at
+    generation: Hashable | None
+    created_at: float
+
+    def is_current(self, generation: Hashable | None) -> bool:
+        if generation is not None:
+            return self.generation == generation
+        return (
+            self.generation is None
+            and time.monotonic() - self.created_at < _UNVERSIONED_DEFINITION_TTL
+        )
+
 
 class MiddlewareServerSession(ServerSession):
     """ServerSession that routes initialization requests through FastMCP middleware."""
@@ -43,6 +124,8 @@ class MiddlewareServerSession(ServerSession):
         self._subscription_task_group: anyio.TaskGroup | None = None  # type: ignore[valid-type]  # ty:ignore[invalid-type-form]
         # Minimum logging level requested by the client via logging/setLevel
         self._minimum_logging_level: LoggingLevel | None = None
+        # Values of scope="session" Depends(), created on first use
+        self._dependency_scope: DependencyScopeCache | None = None
 
     @property
     def fastmcp(self) -> FastMCP:
@@ -52,6 +135,30 @@ class MiddlewareServerSession(ServerSession):
             raise RuntimeError("FastMCP instance is no longer available")
         return fastmcp
 
+    @property
+    def dependency_scope(self) -> DependencyScopeCache:
+        """Values of scope="session" dependencies, torn down when the session ends."""
+        if self._dependency_scope is None:
+            from fastmcp.server.dependencies import DependencyScopeCache
+
+            self._dependency_scope = DependencyScopeCache()
+        return self._dependency_scope
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        scope, self._dependency_scope = self._dependency_scope, None
+        if scope is not None:
+            with anyio.CancelScope(shield=True):
+                try:
+                    await scope.aclose()
+                except Exception:
+                    logger.exception("Error tearing down session-scoped dependencies")
+        return await super().__aexit__(exc_type, exc_val, exc_tb)
+
     def client_supports_extension(self, extension_id: str) -> bool:
         """Check if the connected client supports a given MCP extension.
 
@@ -108,7 +215,7 @@ class MiddlewareServerSession(ServerSession):
             responder.respond = capturing_respond  # type: ignore[method-assign]  # ty:ignore[invalid-assignment]
 
             async def call_original_handler(
-                ctx: MiddlewareContext,
+                context: MiddlewareContext,
             ) -> mcp.types.InitializeResult | None:
                 await super(MiddlewareServerSession, self)._received_request(responder)
                 if captured_response is not None and isinstance(
@@ -164,6 +271,11 @@ class LowLevelServer(_Server[LifespanResultT, RequestT]):
             resources_changed=True,
             tools_changed=True,
         )
+        # Validation data for called tools, keyed by name and requested
+        # version. Entries are reused while the server's catalog generation
+        # is unchanged, or briefly when the catalog has no generation.
+        self._tool_definitions: dict[tuple[str, str | None], _ToolDefinition] = {}
+        self._validate_tool_input = True
 
     @property
     def fastmcp(self) -> FastMCP:
@@ -223,6 +335,10 @@ class LowLevelServer(_Server[LifespanResultT, RequestT]):
             getattr(capabilities, "extensions", None) or {}
         )
         capabilities.extensions = {**existing_extensions, UI_EXTENSION_ID: {}}
+        if self.fastmcp._structured_content_only:
+            from fastmcp.tools.base import STRUCTURED_CONTENT_ONLY_EXTENSION_ID
+
+            capabilities.extensions[STRUCTURED_CONTENT_ONLY_EXTENSION_ID] = {}
 
         return capabilities
 
@@ -262,6 +378,135 @@ class LowLevelServer(_Server[LifespanResultT, RequestT]):
                         raise_exceptions,
                     )
 
+    def clear_tool_definitions(self) -> None:
+        """Forget cached tool validation data, e.g. after the tool list changed."""
+        self._tool_definitions.clear()
+
+    async def _get_tool_definition(
+        self, name: str, version: str | None = None
+    ) -> _ToolDefinition | None:
+        """Return validation data for one tool, looking up only that tool.
+
+        Unlike the SDK, which relists every tool on a cache miss, this asks
+        the server for the called tool alone, so calls to dynamic or proxied
+        tools never trigger a full listing. When the catalog has no
+        generation (dynamic or proxied providers), a definition is reused for
+        a few seconds so back-to-back calls don't each look the tool up twice.
+        """
+        generation = self.fastmcp.catalog_generation()
+        key = (name, version)
+        definition = self._tool_definitions.get(key)
+        if definition is not None and definition.is_current(generation):
+            return definition
+
+        tool = await self.fastmcp.get_tool(
+            name, version=VersionSpec(eq=version) if version else None
+        )
+        if tool is None:
+            self._tool_definitions.pop(key, None)
+            return None
+
+        input_validator = None
+        if self._validate_tool_input:
+            input_validator = get_schema_validator(tool.parameters)
+        output_validator = None
+        if tool.validate_output and tool.output_schema is not None:
+            output_validator = get_schema_validator(tool.output_schema)
+        definition = _ToolDefinition(
+            input_validator=input_validator,
+            output_validator=output_validator,
+            generation=generation,
+            created_at=time.monotonic(),
+        )
+        self._tool_definitions[key] = definition
+        return definition
+
+    def call_tool(
+        self, *, validate_input: bool = True
+    ) -> Callable[
+        [Callable[[str, dict[str, Any]], Awaitable[ToolCallResult]]],
+        Callable[[str, dict[str, Any]], Awaitable[ToolCallResult]],
+    ]:
+        """
+        Decorator for registering a call_tool handler.
+
+        Behaves like the SDK's call_tool decorator, except that tool
+        definitions come from a lookup of the called tool rather than a full
+        tool listing, schemas are compiled once and reused, and output
+        validation is skipped for tools with `validate_output=False`.
+        """
+
+        def decorator(
+            func: Callable[[str, dict[str, Any]], Awaitable[ToolCallResult]],
+        ) -> Callable[[str, dict[str, Any]], Awaitable[ToolCallResult]]:
+            self._validate_tool_input = validate_input
+            self.clear_tool_definitions()
+
+            async def handler(
+                req: mcp.types.CallToolRequest,
+            ) -> mcp.types.ServerResult:
+                try:
+                    name = req.params.name
+                    arguments = req.params.arguments or {}
+                    definition = await self._get_tool_definition(
+                        name, _requested_version(req.params.meta)
+                    )
+
+                    if definition is not None and definition.input_validator:
+                        error = _first_error(definition.input_validator, arguments)
+                        if error is not None:
+                            return self._make_error_result(
+                                f"Input validation error: {error.message}"
+                            )
+
+                    result = await func(name, arguments)
+
+                    if isinstance(
+                        result, mcp.types.CallToolResult | mcp.types.CreateTaskResult
+                    ):
+                        return mcp.types.ServerResult(result)
+                    if isinstance(result, tuple):
+                        content, structured = result
+                    elif isinstance(result, dict):
+                        structured = result
+                        content = [
+                            mcp.types.TextContent(
+                                type="text", text=json.dumps(result, indent=2)
+                            )
+                        ]
+                    else:
+                        content, structured = result, None
+
+                    if definition is not None and definition.output_validator:
+                        if structured is None:
+                            return self._make_error_result(
+                                "Output validation error: outputSchema defined "
+                                "but no structured output returned"
+                            )
+                        error = _first_error(definition.output_validator, structured)
+                        if error is not None:
+                            return self._make_error_result(
+                                f"Output validation error: {error.message}"
+                            )
+
+                    return mcp.types.ServerResult(
+                        mcp.types.CallToolResult(
+                            content=list(content),
+                            structuredContent=structured,
+                            isError=False,
+                        )
+                    )
+                except UrlElicitationRequiredError:
+                    # Surfaced as a -32042 error response by _handle_request
+                    raise
+                except Exception as e:
+                    return self._make_error_result(str(e))
+
+            self.request_handlers[mcp.types.CallToolRequest] = handler
+            return func
+
+        return decorator
+
     def read_resource(
         self,
     ) -> Callable[
@@ -1,10 +1,16 @@
 """A middleware for response caching."""
 
+import bisect
 import hashlib
-from collections.abc import Sequence
+import heapq
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
 from logging import Logger
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
 
+import anyio
 import mcp.types
 import pydantic_core
 from key_value.aio.adapters.pydantic import PydanticAdapter
@@ -20,9 +26,10 @@ from typing_extensions import NotRequired, Self, override
 
 from fastmcp.prompts.base import Message, Prompt, PromptResult
 from fastmcp.resources.base import Resource, ResourceContent, ResourceResult
-from fastmcp.server.dependencies import get_access_token
+from fastmcp.server.dependencies import get_access_token, get_server
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.tools.base import Tool, ToolResult
+from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import FastMCPBaseModel
 
@@ -50,6 +57,7 @@ class CachableResourceResult(FastMCPBaseModel):
 
     contents: list[CachableResourceContent]
     meta: dict[str, Any] | None = None
+    fresh_until: float | None = None
 
     def get_size(self) -> int:
         return len(self.model_dump_json())
@@ -82,6 +90,7 @@ class CachableToolResult(FastMCPBaseModel):
     content: list[mcp.types.ContentBlock]
     structured_content: dict[str, Any] | None
     meta: dict[str, Any] | None
+    fresh_until: float | None = None
 
     @classmethod
     def wrap(cls, value: ToolResult) -> Self:
@@ -161,14 +170,27 @@ class ListPromptsSettings(SharedMethodSettings):
     """Configuration options for Prompt-related caching."""
 
 
-class CallToolSettings(SharedMethodSettings):
+class CoalescingSettings(TypedDict):
+    """Config for sharing work between concurrent and expired requests.
+
+    `single_flight`: concurrent cache misses for the same key wait for one
+    computation instead of each calling through.
+    `stale_while_revalidate`: seconds past the TTL during which an expired
+    entry is still served while a single background refresh replaces it.
+    """
+
+    single_flight: NotRequired[bool]
+    stale_while_revalidate: NotRequired[int]
+
+
+class CallToolSettings(SharedMethodSettings, CoalescingSettings):
     """Configuration options for Tool-related caching."""
 
     included_tools: NotRequired[list[str]]
     excluded_tools: NotRequired[list[str]]
 
 
-class ReadResourceSettings(SharedMethodSettings):
+class ReadResourceSettings(SharedMethodSettings, CoalescingSettings):
     """Configuration options for Resource-related caching."""
 
 
@@ -176,6 +198,47 @@ class GetPromptSettings(SharedMethodSettings):
     """Configuration options for Prompt-related caching."""
 
 
+CoalescedT = TypeVar("CoalescedT", CachableToolResult, CachableResourceResult)
+
+_NO_RESULT: Any = object()
+
+
+class _Flight:
+    """A computation that concurrent cache misses for one key wait on."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = _NO_RESULT
+        self.error: Exception | None = None
+
+
+class LocalCacheSettings(TypedDict):
+    """Config for the in-process cache tier.
+
+    `max_entries` and `max_size` (bytes, measured by JSON size) bound the tier;
+    the least recently used entries are evicted first. `ttl` caps how long an
+    entry is served from process memory before the shared store is consulted
+    again.
+    """
+
+    max_entries: NotRequired[int]
+    max_size: NotRequired[int]
+    ttl: NotRequired[int]
+
+
+class LocalCacheCollectionStatistics(FastMCPBaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class LocalCacheStatistics(FastMCPBaseModel):
+    entries: int = 0
+    size: int = 0
+    read_resource: LocalCacheCollectionStatistics | None = Field(default=None)
+    call_tool: LocalCacheCollectionStatistics | None = Field(default=None)
+
+
 class ResponseCachingStatistics(FastMCPBaseModel):
     list_tools: KVStoreCollectionStatistics | None = Field(default=None)
     list_resources: KVStoreCollectionStatistics | None = Field(default=None)
@@ -183,6 +246,197 @@ class ResponseCachingStatistics(FastMCPBaseModel):
     read_resource: KVStoreCollectionStatistics | None = Field(default=None)
     get_prompt: KVStoreCollectionStatistics | None = Field(default=None)
     call_tool: KVStoreCollectionStatistics | None = Field(default=None)
+    local: LocalCacheStatistics | None = Field(default=None)
+
+
+@dataclass
+class _LocalEntry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class _LocalCache:
+    """A bounded LRU of unwrapped results, consulted before the shared store.
+
+    Entries are returned as-is, without copying or deserializing.
+    """
+
+    def __init__(self, max_entries: int, max_size: int, ttl: int):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.size = 0
+        self._entries: OrderedDict[tuple[str, str], _LocalEntry] = OrderedDict()
+        self._stats: dict[str, LocalCacheCollectionStatistics] = {}
+
+    def _collection_stats(self, collection: str) -> LocalCacheCollectionStatistics:
+        stats = self._stats.get(collection)
+        if stats is None:
+            stats = self._stats[collection] = LocalCacheCollectionStatistics()
+        return stats
+
+    def get(self, collection: str, key: str) -> Any | None:
+        stats = self._collection_stats(collection)
+        entry = self._entries.get((collection, key))
+        if entry is None:
+            stats.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove((collection, key))
+            stats.misses += 1
+            return None
+        self._entries.move_to_end((collection, key))
+        stats.hits += 1
+        return entry.value
+
+    def put(self, collection: str, key: str, value: Any, size: int, ttl: float) -> None:
+        if ttl <= 0 or size > self.max_size:
+            return
+        self._remove((collection, key))
+        while self._entries and (
+            len(self._entries) >= self.max_entries or self.size + size > self.max_size
+        ):
+            evicted_key, _ = next(iter(self._entries.items()))
+            self._remove(evicted_key)
+            self._collection_stats(evicted_key[0]).evictions += 1
+        self._entries[(collection, key)] = _LocalEntry(
+            value=value,
+            size=size,
+            expires_at=time.monotonic() + min(ttl, self.ttl),
+        )
+        self.size += size
+
+    def _remove(self, entry_key: tuple[str, str]) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def discard(self, collection: str, key: str) -> None:
+        self._remove((collection, key))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def statistics(self) -> LocalCacheStatistics:
+        return LocalCacheStatistics(
+            entries=len(self._entries),
+            size=self.size,
+            read_resource=self._stats.get("resources/read"),
+            call_tool=self._stats.get("tools/call"),
+        )
+
+
+_EntryKey = tuple[str, str]
+
+
+@dataclass
+class _IndexedEntry:
+    tool: str | None
+    uri: str | None
+    tags: set[str]
+    expires_at: float
+
+
+class _InvalidationIndex:
+    """Maps tool names, resource URIs and tags to the cache entries stored for them.
+
+    Lookups touch only the matching index buckets, never the cache store.
+    Entries are forgotten once their store TTL has passed.
+    """
+
+    def __init__(self) -> None:
+        self._by_tool: dict[str, set[_EntryKey]] = {}
+        self._by_uri: dict[str, set[_EntryKey]] = {}
+        self._by_tag: dict[str, set[_EntryKey]] = {}
+        # Sorted so that prefix matches are a bisect plus a contiguous scan
+        self._uris: list[str] = []
+        self._entries: dict[_EntryKey, _IndexedEntry] = {}
+        self._expiry: list[tuple[float, _EntryKey]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        entry: _EntryKey,
+        *,
+        tool: str | None = None,
+        uri: str | None = None,
+        tags: set[str],
+        ttl: float,
+    ) -> None:
+        now = time.monotonic()
+        self._prune(now)
+        self.discard(entry)
+        self._entries[entry] = _IndexedEntry(
+            tool=tool, uri=uri, tags=tags, expires_at=now + ttl
+        )
+        heapq.heappush(self._expiry, (now + ttl, entry))
+        if tool is not None:
+            self._by_tool.setdefault(tool, set()).add(entry)
+        if uri is not None:
+            if uri not in self._by_uri:
+                bisect.insort(self._uris, uri)
+                self._by_uri[uri] = set()
+            self._by_uri[uri].add(entry)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(entry)
+
+    def discard(self, entry: _EntryKey) -> None:
+        indexed = self._entries.pop(entry, None)
+        if indexed is None:
+            return
+        if indexed.tool is not None:
+            _discard_from(self._by_tool, indexed.tool, entry)
+        if indexed.uri is not None and _discard_from(self._by_uri, indexed.uri, entry):
+            del self._uris[bisect.bisect_left(self._uris, indexed.uri)]
+        for tag in indexed.tags:
+            _discard_from(self._by_tag, tag, entry)
+
+    def match(
+        self,
+        *,
+        tool: str | None = None,
+        uri_prefix: str | None = None,
+        tags: Iterable[str] = (),
+    ) -> set[_EntryKey]:
+        """Return the entries matching any of the given criteria."""
+        matched: set[_EntryKey] = set()
+        if tool is not None:
+            matched.update(self._by_tool.get(tool, ()))
+        if uri_prefix is not None:
+            start = bisect.bisect_left(self._uris, uri_prefix)
+            for uri in self._uris[start:]:
+                if not uri.startswith(uri_prefix):
+                    break
+                matched.update(self._by_uri[uri])
+        for tag in tags:
+            matched.update(self._by_tag.get(tag, ()))
+        return matched
+
+    def _prune(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            _, entry = heapq.heappop(self._expiry)
+            indexed = self._entries.get(entry)
+            # Re-stored entries have a later expiry and a later heap item
+            if indexed is not None and indexed.expires_at <= now:
+                self.discard(entry)
+
+
+def _discard_from(
+    buckets: dict[str, set[_EntryKey]], name: str, entry: _EntryKey
+) -> bool:
+    """Remove `entry` from a bucket, dropping the bucket once empty."""
+    bucket = buckets.get(name)
+    if bucket is None:
+        return False
+    bucket.discard(entry)
+    if bucket:
+        return False
+    del buckets[name]
+    return True
 
 
 class ResponseCachingMiddleware(Middleware):
@@ -212,6 +466,7 @@ class ResponseCachingMiddleware(Middleware):
         get_prompt_settings: GetPromptSettings | None = None,
         call_tool_settings: CallToolSettings | None = None,
         max_item_size: int = ONE_MB_IN_BYTES,
+        local_cache_settings: LocalCacheSettings | None = None,
     ):
         """Initialize the response caching middleware.
 
@@ -224,6 +479,13 @@ class ResponseCachingMiddleware(Middleware):
             get_prompt_settings: The settings for the get prompt method. If None, the default settings are used (1 hour TTL).
             call_tool_settings: The settings for the call tool method. If None, the default settings are used (1 hour TTL).
             max_item_size: The maximum size of items eligible for caching. Defaults to 1MB.
+            local_cache_settings: Enables an in-process LRU tier in front of `cache_storage` for tool
+                calls and resource reads. Hits are served without touching the store or deserializing.
+                If None, every lookup goes to `cache_storage`.
+
+        `call_tool_settings` and `read_resource_settings` also accept `single_flight` and
+        `stale_while_revalidate` (see `CoalescingSettings`) to stop concurrent misses and
+        expiries from all recomputing the same response.
         """
 
         self._backend: AsyncKeyValue = cache_storage or MemoryStore()
@@ -292,6 +554,23 @@ class ResponseCachingMiddleware(Middleware):
             default_collection="tools/call",
         )
 
+        self._local_cache: _LocalCache | None = None
+        if local_cache_settings is not None:
+            self._local_cache = _LocalCache(
+                max_entries=local_cache_settings.get("max_entries", 1024),
+                max_size=local_cache_settings.get("max_size", 64 * ONE_MB_IN_BYTES),
+                ttl=local_cache_settings.get("ttl", 60),
+            )
+
+        # In-flight computations and background refreshes, keyed by cache key
+        self._flights: dict[str, _Flight] = {}
+        self._refreshes: set[str] = set()
+
+        self._index = _InvalidationIndex()
+        # Bumped by every invalidate() so computations that started earlier
+        # don't store a result that may predate the invalidating write
+        self._generation = 0
+
     @override
     async def on_list_tools(
         self,
@@ -432,21 +711,43 @@ class ResponseCachingMiddleware(Middleware):
             msg=context.message, auth_key=_get_auth_partition_key()
         )
 
-        if cached_value := await self._call_tool_cache.get(key=cache_key):
-            return cached_value.unwrap()
+        if self._local_cache is not None:
+            local_value = self._local_cache.get("tools/call", cache_key)
+            if local_value is not None:
+                return local_value
 
-        tool_result: ToolResult = await call_next(context=context)
-        cachable_tool_result: CachableToolResult = CachableToolResult.wrap(
-            value=tool_result
-        )
+        generation = self._generation
 
-        await self._call_tool_cache.put(
+        async def compute() -> CachableToolResult:
+            tool_result: ToolResult = await call_next(context=context)
+            return CachableToolResult.wrap(value=tool_result)
+
+        async def index(ttl: float) -> None:
+            self._index.add(
+                ("tools/call", cache_key),
+                tool=tool_name,
+                tags=await _get_component_tags(context, tool=tool_name),
+                ttl=ttl,
+            )
+
+        cachable_tool_result: CachableToolResult = await self._get_or_compute(
+            cache=self._call_tool_cache,
             key=cache_key,
-            value=cachable_tool_result,
-            ttl=self._call_tool_settings.get("ttl", ONE_HOUR_IN_SECONDS),
+            settings=self._call_tool_settings,
+            compute=compute,
+            index=index,
         )
 
-        return cachable_tool_result.unwrap()
+        tool_result = cachable_tool_result.unwrap()
+        if generation == self._generation:
+            self._store_local(
+                collection="tools/call",
+                key=cache_key,
+                value=tool_result,
+                cached=cachable_tool_result,
+                settings=self._call_tool_settings,
+            )
+        return tool_result
 
     @override
     async def on_read_resource(
@@ -462,21 +763,45 @@ class ResponseCachingMiddleware(Middleware):
         cache_key: str = _make_read_resource_cache_key(
             msg=context.message, auth_key=_get_auth_partition_key()
         )
-        cached_value: CachableResourceResult | None
 
-        if cached_value := await self._read_resource_cache.get(key=cache_key):
-            return cached_value.unwrap()
+        if self._local_cache is not None:
+            local_value = self._local_cache.get("resources/read", cache_key)
+            if local_value is not None:
+                return local_value
+
+        generation = self._generation
+        uri = str(context.message.uri)
+
+        async def compute() -> CachableResourceResult:
+            value: ResourceResult = await call_next(context=context)
+            return CachableResourceResult.wrap(value)
 
-        value: ResourceResult = await call_next(context=context)
-        cached_value = CachableResourceResult.wrap(value)
+        async def index(ttl: float) -> None:
+            self._index.add(
+                ("resources/read", cache_key),
+                uri=uri,
+                tags=await _get_component_tags(context, uri=uri),
+                ttl=ttl,
+            )
 
-        await self._read_resource_cache.put(
+        cached_value: CachableResourceResult = await self._get_or_compute(
+            cache=self._read_resource_cache,
             key=cache_key,
-            value=cached_value,
-            ttl=self._read_resource_settings.get("ttl", ONE_HOUR_IN_SECONDS),
+            settings=self._read_resource_settings,
+            compute=compute,
+            index=index,
         )
 
-        return cached_value.unwrap()
+        resource_result = cached_value.unwrap()
+        if generation == self._generation:
+            self._store_local(
+                collection="resources/read",
+                key=cache_key,
+                value=resource_result,
+                cached=cached_value,
+                settings=self._read_resource_settings,
+            )
+        return resource_result
 
     @override
     async def on_get_prompt(
@@ -507,6 +832,174 @@ class ResponseCachingMiddleware(Middleware):
 
         return cached_value.unwrap()
 
+    async def _get_or_compute(
+        self,
+        cache: PydanticAdapter[CoalescedT],
+        key: str,
+        settings: CallToolSettings | ReadResourceSettings,
+        compute: Callable[[], Awaitable[CoalescedT]],
+        index: Callable[[float], Awaitable[None]],
+    ) -> CoalescedT:
+        """Return the cached value for `key`, computing and storing it on a miss.
+
+        Honors the `single_flight` and `stale_while_revalidate` settings.
+        `index` is called with the store TTL whenever a value is stored.
+        """
+        ttl = settings.get("ttl", ONE_HOUR_IN_SECONDS)
+        stale_ttl = settings.get("stale_while_revalidate", 0)
+
+        async def compute_and_store() -> CoalescedT:
+            generation = self._generation
+            value = await compute()
+            if generation != self._generation:
+                # Invalidated while computing; the value may already be stale
+                return value
+            if stale_ttl:
+                value.fresh_until = time.time() + ttl
+            await index(ttl + stale_ttl)
+            await cache.put(key=key, value=value, ttl=ttl + stale_ttl)
+            return value
+
+        cached_value = await cache.get(key=key)
+        if cached_value is not None:
+            fresh_until = cached_value.fresh_until
+            if stale_ttl and fresh_until is not None and fresh_until < time.time():
+                self._start_refresh(key, compute_and_store)
+            return cached_value
+
+        if settings.get("single_flight"):
+            return await self._single_flight(key, compute_and_store)
+        return await compute_and_store()
+
+    async def _single_flight(
+        self, key: str, compute: Callable[[], Awaitable[CoalescedT]]
+    ) -> CoalescedT:
+        """Run `compute` once for all concurrent callers with the same key."""
+        flight = self._flights.get(key)
+        if flight is not None:
+            await flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if flight.result is _NO_RESULT:
+                # The leader was cancelled; take over the computation
+                return await self._single_flight(key, compute)
+            return flight.result
+
+        flight = self._flights[key] = _Flight()
+        try:
+            flight.result = await compute()
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            del self._flights[key]
+            flight.done.set()
+
+    def _start_refresh(self, key: str, compute: Callable[[], Awaitable[Any]]) -> None:
+        """Recompute an expired entry in the background, once per key.
+
+        The refresh runs in the server lifespan's task group, so it is
+        cancelled on shutdown. Without a running lifespan the stale entry is
+        served until it expires and is then recomputed inline.
+        """
+        if key in self._refreshes:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._single_flight(key, compute)
+            except Exception:
+                logger.warning(
+                    "Background cache refresh failed; serving stale entry",
+                    exc_info=True,
+                )
+            finally:
+                self._refreshes.discard(key)
+
+        try:
+            server = get_server()
+        except RuntimeError:
+            return
+        if server._start_background(refresh):
+            self._refreshes.add(key)
+
+    def _store_local(
+        self,
+        collection: str,
+        key: str,
+        value: ToolResult | ResourceResult,
+        cached: CachableToolResult | CachableResourceResult,
+        settings: CallToolSettings | ReadResourceSettings,
+    ) -> None:
+        """Keep an unwrapped result in the in-process tier, if it is enabled.
+
+        The entry never outlives the freshness of the shared entry it mirrors,
+        so stale-while-revalidate keeps working through the shared store.
+        """
+        if self._local_cache is None:
+            return
+        ttl: float = settings.get("ttl", ONE_HOUR_IN_SECONDS)
+        if cached.fresh_until is not None:
+            ttl = cached.fresh_until - time.time()
+        self._local_cache.put(
+            collection=collection,
+            key=key,
+            value=value,
+            size=len(cached.model_dump_json()),
+            ttl=ttl,
+        )
+
+    async def invalidate(
+        self,
+        *,
+        tool: str | None = None,
+        uri_prefix: str | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> int:
+        """Evict cached tool calls and resource reads.
+
+        An entry is evicted if it matches any of the given criteria. Entries
+        are found through an index kept by this middleware, so only entries
+        stored by this process are evicted; entries another process wrote to
+        a shared store expire by TTL as usual.
+
+        Args:
+            tool: Evict every cached call to this tool.
+            uri_prefix: Evict every cached read of a resource URI starting
+                with this prefix.
+            tags: Evict entries whose tool or resource has any of these tags.
+
+        Returns:
+            The number of entries evicted.
+        """
+        tags = set(tags or ())
+        if tool is None and uri_prefix is None and not tags:
+            raise ValueError("invalidate() requires tool, uri_prefix, or tags")
+
+        self._generation += 1
+        entries = self._index.match(tool=tool, uri_prefix=uri_prefix, tags=tags)
+        caches: dict[str, PydanticAdapter[Any]] = {
+            "tools/call": self._call_tool_cache,
+            "resources/read": self._read_resource_cache,
+        }
+        for entry in entries:
+            collection, key = entry
+            self._index.discard(entry)
+            if self._local_cache is not None:
+                self._local_cache.discard(collection, key)
+            await caches[collection].delete(key=key)
+        return len(entries)
+
+    def clear_local_cache(self) -> None:
+        """Drop every entry in the in-process tier.
+
+        The shared store is left untouched. Call this when components change
+        and cached responses in this process must not be served again.
+        """
+        if self._local_cache is not None:
+            self._local_cache.clear()
+
     def _matches_tool_cache_settings(self, tool_name: str) -> bool:
         """Check if the tool matches the cache settings for tool calls."""
 
@@ -529,9 +1022,32 @@ class ResponseCachingMiddleware(Middleware):
             read_resource=self._stats.statistics.collections.get("resources/read"),
             get_prompt=self._stats.statistics.collections.get("prompts/get"),
             call_tool=self._stats.statistics.collections.get("tools/call"),
+            local=(
+                self._local_cache.statistics()
+                if self._local_cache is not None
+                else None
+            ),
         )
 
 
+async def _get_component_tags(
+    context: MiddlewareContext[Any], *, tool: str | None = None, uri: str | None = None
+) -> set[str]:
+    """Look up the tags of the tool or resource a request targets."""
+    fastmcp_context = context.fastmcp_context
+    if fastmcp_context is None:
+        return set()
+    server = fastmcp_context.fastmcp
+    component: FastMCPComponent | None = None
+    if tool is not None:
+        component = await server.get_tool(tool)
+    elif uri is not None:
+        component = await server.get_resource(uri)
+        if component is None:
+            component = await server.get_resource_template(uri)
+    return set(component.tags) if component is not None else set()
+
+
 def _get_arguments_str(arguments: dict[str, Any] | None) -> str:
     """Get a string representation of the arguments."""
 
@@ -9,6 +9,7 @@ from typing_extensions import override
 from fastmcp.resources.template import ResourceTemplate
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.tools.base import Tool
+from fastmcp.utilities.components import DerivedComponentCache
 from fastmcp.utilities.json_schema import dereference_refs
 
 
@@ -18,8 +19,19 @@ class DereferenceRefsMiddleware(Middleware):
     Some MCP clients (e.g., VS Code Copilot) don't handle JSON Schema $ref
     properly. This middleware inlines all $ref definitions so schemas are
     self-contained. Enabled by default via ``FastMCP(dereference_schemas=True)``.
+
+    Dereferenced copies are cached per source component while the source is
+    alive and rebuilt when any of its fields is reassigned, so repeated
+    listings of the same catalog neither re-resolve schemas nor re-copy
+    components.
     """
 
+    cacheable_listings = True
+
+    def __init__(self) -> None:
+        self._tools = DerivedComponentCache()
+        self._templates = DerivedComponentCache()
+
     @override
     async def on_list_tools(
         self,
@@ -27,7 +39,7 @@ class DereferenceRefsMiddleware(Middleware):
         call_next: CallNext[mt.ListToolsRequest, Sequence[Tool]],
     ) -> Sequence[Tool]:
         tools = await call_next(context)
-        return [_dereference_tool(tool) for tool in tools]
+        return [self._tools.get(tool, _dereference_tool) for tool in tools]
 
     @override
     async def on_list_resource_templates(
@@ -38,7 +50,9 @@ class DereferenceRefsMiddleware(Middleware):
         ],
     ) -> Sequence[ResourceTemplate]:
         templates = await call_next(context)
-        return [_dereference_resource_template(t) for t in templates]
+        return [
+            self._templates.get(t, _dereference_resource_template) for t in templates
+        ]
 
 
 def _dereference_tool(tool: Tool) -> Tool:
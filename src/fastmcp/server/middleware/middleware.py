@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import ContextVar
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     Literal,
     Protocol,
@@ -63,6 +65,111 @@ class MiddlewareContext(Generic[T]):
         return replace(self, **kwargs)
 
 
+# Maps MCP methods to the method-specific hook that handles them.
+_METHOD_HOOKS: dict[str, str] = {
+    "initialize": "on_initialize",
+    "tools/call": "on_call_tool",
+    "resources/read": "on_read_resource",
+    "prompts/get": "on_get_prompt",
+    "tools/list": "on_list_tools",
+    "resources/list": "on_list_resources",
+    "resources/templates/list": "on_list_resource_templates",
+    "prompts/list": "on_list_prompts",
+}
+
+_TYPE_HOOKS: dict[str, str] = {
+    "request": "on_request",
+    "notification": "on_notification",
+}
+
+# The innermost call_next for the chain currently executing. Compiled chains
+# are shared across requests, so the per-request handler is threaded through
+# a context variable rather than baked into the chain.
+_chain_terminal: ContextVar[CallNext[Any, Any]] = ContextVar("_chain_terminal")
+
+
+async def _call_terminal(context: MiddlewareContext[Any]) -> Any:
+    return await _chain_terminal.get()(context)
+
+
+def _uses_default_dispatch(middleware: object) -> bool:
+    """Whether a middleware relies on Middleware's own hook dispatching."""
+    if not isinstance(middleware, Middleware):
+        return False
+    cls = type(middleware)
+    return (
+        cls.__call__ is Middleware.__call__
+        and cls._dispatch_handler is Middleware._dispatch_handler
+    )
+
+
+def _wrap_middleware(
+    middleware: Middleware,
+    call_next: CallNext[Any, Any],
+    method: str | None,
+    type: str,
+) -> CallNext[Any, Any]:
+    """Wrap call_next with the hooks a middleware runs for a method and type.
+
+    Hooks the middleware doesn't override are pass-throughs, so they're
+    skipped entirely instead of adding a layer to the chain.
+    """
+    if not _uses_default_dispatch(middleware):
+        return partial(middleware, call_next=call_next)
+
+    hook_names = ["on_message"]
+    if type in _TYPE_HOOKS:
+        hook_names.append(_TYPE_HOOKS[type])
+    if method in _METHOD_HOOKS:
+        hook_names.append(_METHOD_HOOKS[method])
+
+    handler = call_next
+    for name in reversed(hook_names):
+        hook = getattr(middleware, name)
+        if getattr(hook, "__func__", None) is getattr(Middleware, name):
+            continue
+        handler = partial(hook, call_next=handler)
+    return handler
+
+
+def compile_middleware_chain(
+    middleware: Sequence[Middleware],
+    *,
+    method: str | None,
+    type: str,
+) -> Callable[[MiddlewareContext[Any], CallNext[Any, Any]], Awaitable[Any]]:
+    """Compile a middleware chain for one MCP method and message type.
+
+    The returned callable is equivalent to nesting each middleware's
+    `__call__` around `call_next`, but the hook dispatch is resolved once
+    up front so the chain can be reused for every request with the same
+    method and type.
+
+    Args:
+        middleware: Middleware in execution order (outermost first).
+        method: The MCP method, e.g. "tools/call".
+        type: The message type, "request" or "notification".
+
+    Returns:
+        A callable taking the middleware context and the request's
+        innermost call_next.
+    """
+    chain: CallNext[Any, Any] = _call_terminal
+    for mw in reversed(middleware):
+        chain = _wrap_middleware(mw, chain, method, type)
+
+    async def run(
+        context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        token = _chain_terminal.set(call_next)
+        try:
+            return await chain(context)
+        finally:
+            _chain_terminal.reset(token)
+
+    return run
+
+
 def make_middleware_wrapper(
     middleware: Middleware, call_next: CallNext[T, R]
 ) -> CallNext[T, R]:
@@ -79,6 +186,11 @@ def make_middleware_wrapper(
 class Middleware:
     """Base class for FastMCP middleware with dispatching hooks."""
 
+    # Whether listings passing through this middleware depend only on the
+    # components listed, not on request state. A server caches the listings
+    # of a mounted server only while all of its middleware sets this.
+    cacheable_listings: ClassVar[bool] = False
+
     async def __call__(
         self,
         context: MiddlewareContext[T],
@@ -1,11 +1,10 @@
 """Rate limiting middleware for protecting FastMCP servers from abuse."""
 
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, deque
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Generic, Protocol, TypeVar, runtime_checkable
 
-import anyio
 from mcp import McpError
 from mcp.types import ErrorData
 
@@ -33,29 +32,36 @@ class TokenBucketRateLimiter:
         self.refill_rate = refill_rate
         self.tokens = capacity
         self.last_refill = time.time()
-        self._lock = anyio.Lock()
 
     async def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens from the bucket.
 
+        The update never awaits, so it is atomic on the event loop without
+        a lock.
+
         Args:
             tokens: Number of tokens to consume
 
         Returns:
             True if tokens were available and consumed, False otherwise
         """
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_refill
-
-            # Add tokens based on elapsed time
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
-            self.last_refill = now
-
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            return False
+        now = time.time()
+        elapsed = now - self.last_refill
+
+        # Add tokens based on elapsed time
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
+
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def is_idle(self, now: float) -> bool:
+        """True once the bucket has refilled completely since its last use."""
+        return self.tokens + (now - self.last_refill) * self.refill_rate >= (
+            self.capacity
+        )
 
 
 class SlidingWindowRateLimiter:
@@ -71,22 +77,193 @@ class SlidingWindowRateLimiter:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.requests = deque()
-        self._lock = anyio.Lock()
 
     async def is_allowed(self) -> bool:
-        """Check if a request is allowed."""
-        async with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
+        """Check if a request is allowed.
+
+        The update never awaits, so it is atomic on the event loop without
+        a lock.
+        """
+        now = time.time()
+        cutoff = now - self.window_seconds
+
+        # Remove old requests outside the window
+        while self.requests and self.requests[0] < cutoff:
+            self.requests.popleft()
+
+        if len(self.requests) < self.max_requests:
+            self.requests.append(now)
+            return True
+        return False
+
+    def is_idle(self, now: float) -> bool:
+        """True once every recorded request has left the window."""
+        return not self.requests or self.requests[-1] < now - self.window_seconds
+
+
+class _IdleAware(Protocol):
+    def is_idle(self, now: float) -> bool: ...
+
+
+LimiterT = TypeVar("LimiterT", bound=_IdleAware)
+
+
+class ClientLimiters(Generic[LimiterT]):
+    """Per-client limiters with bounded memory.
+
+    Limiters are created on first use. A limiter that has gone idle (a full
+    bucket, or an empty window) is indistinguishable from a new one, so it is
+    dropped; beyond `max_clients`, the least recently used limiter is dropped
+    even if it is not idle.
+    """
+
+    def __init__(self, factory: Callable[[], LimiterT], max_clients: int = 10_000):
+        if max_clients < 1:
+            raise ValueError(f"max_clients must be at least 1, got {max_clients}")
+        self.factory = factory
+        self.max_clients = max_clients
+        self._limiters: OrderedDict[str, LimiterT] = OrderedDict()
+
+    def __getitem__(self, client_id: str) -> LimiterT:
+        limiter = self._limiters.get(client_id)
+        if limiter is None:
+            limiter = self._limiters[client_id] = self.factory()
+        else:
+            self._limiters.move_to_end(client_id)
+        self._evict(keep=client_id)
+        return limiter
+
+    def __contains__(self, client_id: object) -> bool:
+        return client_id in self._limiters
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def _evict(self, keep: str) -> None:
+        now = time.time()
+        while len(self._limiters) > 1:
+            oldest_id, oldest = next(iter(self._limiters.items()))
+            if oldest_id == keep:
+                break
+            if len(self._limiters) <= self.max_clients and not oldest.is_idle(now):
+                break
+            del self._limiters[oldest_id]
+
+
+@runtime_checkable
+class RateLimitStore(Protocol):
+    """Shared counter storage for rate limiting across server replicas.
+
+    `increment` must be atomic: concurrent increments of one key from any
+    replica must all be counted.
+    """
+
+    async def increment(self, key: str, amount: int, ttl: float) -> int:
+        """Add `amount` to the counter at `key` and return the new value.
+
+        A missing key counts as 0. The key may be dropped `ttl` seconds after
+        it was last incremented.
+        """
+        ...
+
+    async def get(self, key: str) -> int:
+        """Return the counter at `key`, or 0 if it does not exist."""
+        ...
+
+
+class InMemoryRateLimitStore:
+    """A `RateLimitStore` local to this process."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, tuple[int, float]] = {}
+        self._prune_at = 1024
+
+    async def increment(self, key: str, amount: int, ttl: float) -> int:
+        now = time.time()
+        if len(self._counters) >= self._prune_at:
+            self._counters = {
+                k: entry for k, entry in self._counters.items() if entry[1] > now
+            }
+            self._prune_at = max(1024, 2 * len(self._counters))
+        value, expires_at = self._counters.get(key, (0, 0.0))
+        if expires_at <= now:
+            value = 0
+        value += amount
+        self._counters[key] = (value, now + ttl)
+        return value
+
+    async def get(self, key: str) -> int:
+        value, expires_at = self._counters.get(key, (0, 0.0))
+        return value if expires_at > time.time() else 0
 
-            # Remove old requests outside the window
-            while self.requests and self.requests[0] < cutoff:
-                self.requests.popleft()
 
-            if len(self.requests) < self.max_requests:
-                self.requests.append(now)
-                return True
-            return False
+class RedisRateLimitStore:
+    """A `RateLimitStore` backed by Redis, shared by every replica using it.
+
+    Args:
+        client: A `redis.asyncio.Redis` client (or any client with the same
+            `pipeline`/`get` API).
+
+    Example:
+        ```python
+        from redis.asyncio import Redis
+
+        store = RedisRateLimitStore(Redis.from_url("redis://localhost:6379"))
+        mcp.add_middleware(RateLimitingMiddleware(store=store, get_client_id=...))
+        ```
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    async def increment(self, key: str, amount: int, ttl: float) -> int:
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incrby(key, amount)
+            pipe.expire(key, max(1, int(ttl + 0.5)))
+            value, _ = await pipe.execute()
+        return int(value)
+
+    async def get(self, key: str) -> int:
+        value = await self.client.get(key)
+        return int(value) if value is not None else 0
+
+
+class DistributedRateLimiter:
+    """Sliding window rate limiter whose counts live in a `RateLimitStore`.
+
+    Counts are kept per fixed window. The request rate over the sliding
+    window is estimated from the current window's count plus the previous
+    window's count, weighted by how much of it still overlaps. Each check
+    is one atomic increment and one read, however many requests are made.
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        max_requests: int,
+        window_seconds: float,
+        key_prefix: str = "fastmcp:ratelimit",
+    ):
+        self.store = store
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.key_prefix = key_prefix
+
+    async def is_allowed(self, client_id: str) -> bool:
+        """Count a request for `client_id` and return whether it is allowed."""
+        now = time.time()
+        window = int(now // self.window_seconds)
+        key = f"{self.key_prefix}:{client_id}:{window}"
+
+        current = await self.store.increment(key, 1, ttl=2 * self.window_seconds)
+        previous = await self.store.get(f"{self.key_prefix}:{client_id}:{window - 1}")
+        overlap = 1 - (now % self.window_seconds) / self.window_seconds
+        if previous * overlap + current <= self.max_requests:
+            return True
+
+        # Rejected requests don't count against the budget
+        await self.store.increment(key, -1, ttl=2 * self.window_seconds)
+        return False
 
 
 class RateLimitingMiddleware(Middleware):
@@ -116,6 +293,8 @@ class RateLimitingMiddleware(Middleware):
         burst_capacity: int | None = None,
         get_client_id: Callable[[MiddlewareContext], str] | None = None,
         global_limit: bool = False,
+        max_clients: int = 10_000,
+        store: RateLimitStore | None = None,
     ):
         """Initialize rate limiting middleware.
 
@@ -124,6 +303,12 @@ class RateLimitingMiddleware(Middleware):
             burst_capacity: Maximum burst capacity. If None, defaults to 2x max_requests_per_second
             get_client_id: Function to extract client ID from context. If None, uses global limiting
             global_limit: If True, apply limit globally; if False, per-client
+            max_clients: Maximum number of per-client buckets kept in memory. Idle buckets
+                are always dropped; beyond this, the least recently used are dropped too.
+            store: Shared counter storage, so that every replica using the same store
+                enforces one budget. The token bucket is then approximated by a sliding
+                window of `burst_capacity` requests per `burst_capacity / max_requests_per_second`
+                seconds. If None, limits are enforced in this process only.
         """
         self.max_requests_per_second = max_requests_per_second
         self.burst_capacity = burst_capacity or int(max_requests_per_second * 2)
@@ -131,10 +316,11 @@ class RateLimitingMiddleware(Middleware):
         self.global_limit = global_limit
 
         # Storage for rate limiters per client
-        self.limiters: dict[str, TokenBucketRateLimiter] = defaultdict(
+        self.limiters: ClientLimiters[TokenBucketRateLimiter] = ClientLimiters(
             lambda: TokenBucketRateLimiter(
                 self.burst_capacity, self.max_requests_per_second
-            )
+            ),
+            max_clients=max_clients,
         )
 
         # Global rate limiter
@@ -143,6 +329,14 @@ class RateLimitingMiddleware(Middleware):
                 self.burst_capacity, self.max_requests_per_second
             )
 
+        self.distributed_limiter: DistributedRateLimiter | None = None
+        if store is not None:
+            self.distributed_limiter = DistributedRateLimiter(
+                store,
+                max_requests=self.burst_capacity,
+                window_seconds=self.burst_capacity / self.max_requests_per_second,
+            )
+
     def _get_client_identifier(self, context: MiddlewareContext) -> str:
         """Get client identifier for rate limiting."""
         if self.get_client_id:
@@ -151,7 +345,15 @@ class RateLimitingMiddleware(Middleware):
 
     async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
         """Apply rate limiting to requests."""
-        if self.global_limit:
+        if self.distributed_limiter is not None:
+            client_id = (
+                "global" if self.global_limit else self._get_client_identifier(context)
+            )
+            if not await self.distributed_limiter.is_allowed(client_id):
+                if self.global_limit:
+                    raise RateLimitError("Global rate limit exceeded")
+                raise RateLimitError(f"Rate limit exceeded for client: {client_id}")
+        elif self.global_limit:
             # Global rate limiting
             allowed = await self.global_limiter.consume()
             if not allowed:
@@ -193,6 +395,8 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
         max_requests: int,
         window_minutes: int = 1,
         get_client_id: Callable[[MiddlewareContext], str] | None = None,
+        max_clients: int = 10_000,
+        store: RateLimitStore | None = None,
     ):
         """Initialize sliding window rate limiting middleware.
 
@@ -200,16 +404,31 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
             max_requests: Maximum requests allowed in the time window
             window_minutes: Time window in minutes
             get_client_id: Function to extract client ID from context
+            max_clients: Maximum number of per-client windows kept in memory. Idle windows
+                are always dropped; beyond this, the least recently used are dropped too.
+            store: Shared counter storage, so that every replica using the same store
+                enforces one budget. The window is then estimated from per-window counts
+                instead of individual timestamps. If None, limits are enforced in this
+                process only.
         """
         self.max_requests = max_requests
         self.window_seconds = window_minutes * 60
         self.get_client_id = get_client_id
 
         # Storage for rate limiters per client
-        self.limiters: dict[str, SlidingWindowRateLimiter] = defaultdict(
-            lambda: SlidingWindowRateLimiter(self.max_requests, self.window_seconds)
+        self.limiters: ClientLimiters[SlidingWindowRateLimiter] = ClientLimiters(
+            lambda: SlidingWindowRateLimiter(self.max_requests, self.window_seconds),
+            max_clients=max_clients,
         )
 
+        self.distributed_limiter: DistributedRateLimiter | None = None
+        if store is not None:
+            self.distributed_limiter = DistributedRateLimiter(
+                store,
+                max_requests=self.max_requests,
+                window_seconds=self.window_seconds,
+            )
+
     def _get_client_identifier(self, context: MiddlewareContext) -> str:
         """Get client identifier for rate limiting."""
         if self.get_client_id:
@@ -219,9 +438,10 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
     async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
         """Apply sliding window rate limiting to requests."""
         client_id = self._get_client_identifier(context)
-        limiter = self.limiters[client_id]
-
-        allowed = await limiter.is_allowed()
+        if self.distributed_limiter is not None:
+            allowed = await self.distributed_limiter.is_allowed(client_id)
+        else:
+            allowed = await self.limiters[client_id].is_allowed()
         if not allowed:
             raise RateLimitError(
                 f"Rate limit exceeded: {self.max_requests} requests per "
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import math
 import weakref
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import AsyncExitStack, asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any
 
@@ -33,6 +35,48 @@ class LifespanMixin:
         """
         return self._docket
 
+    def _start_background(self: FastMCP, func: Callable[[], Awaitable[Any]]) -> bool:
+        """Run `func` in the lifespan's background task group.
+
+        The task runs in a copy of the caller's context, so request-scoped
+        state (access token, current server) is still visible to it, and it is
+        cancelled when the server shuts down. Returns False if the lifespan
+        is not running.
+        """
+        if self._background_work is None:
+            return False
+        self._background_work.send_nowait((contextvars.copy_context(), func))
+        return True
+
+    @asynccontextmanager
+    async def _background_lifespan(self: FastMCP) -> AsyncIterator[None]:
+        """Own the task group that runs work handed to `_start_background`.
+
+        The task group lives in its own task rather than around the yield,
+        because the server may exit its lifespan from a different task than
+        the one that entered it.
+        """
+        send, receive = anyio.create_memory_object_stream[
+            tuple[contextvars.Context, Callable[[], Awaitable[Any]]]
+        ](math.inf)
+
+        async def run() -> None:
+            async with anyio.create_task_group() as tg, receive:
+                async for context, func in receive:
+                    # start_soon copies the current context into the new task
+                    context.run(tg.start_soon, func)
+
+        worker = asyncio.create_task(run())
+        self._background_work = send
+        try:
+            yield
+        finally:
+            self._background_work = None
+            send.close()
+            worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+
     @asynccontextmanager
     async def _docket_lifespan(self: FastMCP) -> AsyncIterator[None]:
         """Manage Docket instance and Worker for background task execution.
@@ -138,6 +182,19 @@ class LifespanMixin:
             # Reset server ContextVar
             _current_server.reset(server_token)
 
+    @asynccontextmanager
+    async def _dependency_scope_lifespan(self: FastMCP) -> AsyncIterator[None]:
+        """Hold the values of scope="server" dependencies while the server runs."""
+        from fastmcp.server.dependencies import DependencyScopeCache
+
+        scope = DependencyScopeCache()
+        self._dependency_scope = scope
+        try:
+            yield
+        finally:
+            self._dependency_scope = None
+            await scope.aclose()
+
     @asynccontextmanager
     async def _lifespan_manager(self: FastMCP) -> AsyncIterator[None]:
         async with self._lifespan_lock:
@@ -175,6 +232,13 @@ class LifespanMixin:
             for provider in self.providers:
                 await stack.enter_async_context(provider.lifespan())
 
+            # Background work may use providers, so it is cancelled first
+            await stack.enter_async_context(self._background_lifespan())
+
+            # Entered last so server-scoped dependencies are torn down before
+            # the provider and user lifespans they may rely on
+            await stack.enter_async_context(self._dependency_scope_lifespan())
+
             self._started.set()
             try:
                 yield
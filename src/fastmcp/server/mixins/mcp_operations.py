@@ -13,34 +13,115 @@ from pydantic import AnyUrl
 from fastmcp.exceptions import DisabledError, NotFoundError
 from fastmcp.server.tasks.config import TaskMeta
 from fastmcp.utilities.logging import get_logger
-from fastmcp.utilities.pagination import paginate_sequence
+from fastmcp.utilities.pagination import CursorState
 from fastmcp.utilities.versions import VersionSpec, dedupe_with_versions
 
 if TYPE_CHECKING:
+    from fastmcp.prompts.base import Prompt
+    from fastmcp.resources.base import Resource
+    from fastmcp.resources.template import ResourceTemplate
     from fastmcp.server.server import FastMCP
+    from fastmcp.tools.base import Tool
 
 logger = get_logger(__name__)
 
-PaginateT = TypeVar("PaginateT")
 
+def _client_wants_structured_only(server: FastMCP) -> bool:
+    """Whether tool results may omit the text mirror of structured content.
 
-def _apply_pagination(
-    items: Sequence[PaginateT],
-    cursor: str | None,
-    page_size: int | None,
-) -> tuple[list[PaginateT], str | None]:
-    """Apply pagination to items, raising McpError for invalid cursors.
-
-    If page_size is None, returns all items without pagination.
+    Requires the server to opt in and the client to advertise
+    STRUCTURED_CONTENT_ONLY_EXTENSION_ID in its capabilities.
     """
-    if page_size is None:
-        return list(items), None
+    if not server._structured_content_only:
+        return False
+    from fastmcp.server.low_level import MiddlewareServerSession
+    from fastmcp.tools.base import STRUCTURED_CONTENT_ONLY_EXTENSION_ID
+
     try:
-        return paginate_sequence(items, cursor, page_size)
+        session = server._mcp_server.request_context.session
+    except LookupError:
+        return False
+    return isinstance(
+        session, MiddlewareServerSession
+    ) and session.client_supports_extension(STRUCTURED_CONTENT_ONLY_EXTENSION_ID)
+
+
+ItemT = TypeVar("ItemT")
+SDKItemT = TypeVar("SDKItemT")
+
+
+def _decode_cursor(cursor: str | None) -> CursorState | None:
+    """Decode a request cursor, raising McpError if it is malformed."""
+    if not cursor:
+        return None
+    try:
+        return CursorState.decode(cursor)
     except ValueError as e:
         raise McpError(mcp.types.ErrorData(code=-32602, message=str(e))) from e
 
 
+def _snapshot_owner(server: FastMCP) -> tuple[str | None, str | None]:
+    """Identify the session and token a listing snapshot belongs to."""
+    from fastmcp.server.context import Context
+    from fastmcp.server.dependencies import get_access_token
+
+    try:
+        session_id = Context(fastmcp=server).session_id
+    except RuntimeError:
+        session_id = None
+    token = get_access_token()
+    return session_id, token.token if token is not None else None
+
+
+async def _paginate_listing(
+    server: FastMCP,
+    kind: str,
+    cursor: str | None,
+    load: Callable[[], Awaitable[Sequence[ItemT]]],
+    key: Callable[[ItemT], str],
+    convert: Callable[[ItemT], SDKItemT],
+) -> tuple[list[SDKItemT], str | None]:
+    """Return one page of a listing converted to SDK types.
+
+    If list_page_size is None, loads and converts everything. Otherwise every
+    page loads the listing for the current caller, so middleware and auth
+    run on each request, and only the items on the page are converted. The
+    first page stores the listing's key order as a snapshot owned by the
+    caller's session and token; later cursors slice that order and keep the
+    keys still present in the caller's listing, so pages stay consistent
+    without exposing another caller's catalog.
+    """
+    page_size = server._list_page_size
+    if page_size is None:
+        return [convert(item) for item in await load()], None
+
+    state = _decode_cursor(cursor)
+    offset = state.offset if state is not None else 0
+    snapshot_id = state.snapshot if state is not None else None
+
+    items = await load()
+    by_key = {key(item): item for item in items}
+    owner = _snapshot_owner(server)
+    keys = (
+        server._list_snapshots.get(kind, snapshot_id, owner)
+        if snapshot_id is not None
+        else None
+    )
+    if keys is None:
+        keys = list(by_key)
+        snapshot_id = None
+
+    end = offset + page_size
+    page = [convert(by_key[k]) for k in keys[offset:end] if k in by_key]
+
+    next_cursor = None
+    if end < len(keys):
+        if snapshot_id is None:
+            snapshot_id = server._list_snapshots.add(kind, keys, owner)
+        next_cursor = CursorState(offset=end, snapshot=snapshot_id).encode()
+    return page, next_cursor
+
+
 class MCPOperationsMixin:
     """Mixin providing MCP protocol handler setup and wire-format handlers.
 
@@ -55,12 +136,13 @@ class MCPOperationsMixin:
         """Set up core MCP protocol handlers.
 
         List handlers use SDK decorators that pass the request object to our handler
-        (needed for pagination cursor). The SDK also populates caches like _tool_cache.
+        (needed for pagination cursor).
 
         Exception: list_resource_templates SDK decorator doesn't pass the request,
         so we register that handler directly.
 
-        The call_tool decorator is from the SDK (supports CreateTaskResult + validate_input).
+        The call_tool decorator is from LowLevelServer, which validates against
+        compiled schemas of the called tool instead of relisting every tool.
         The read_resource and get_prompt decorators are from LowLevelServer to add
         CreateTaskResult support until the SDK provides it natively.
         """
@@ -107,14 +189,18 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_tools")
 
-        tools = dedupe_with_versions(list(await server.list_tools()), lambda t: t.name)
-        sdk_tools = [tool.to_mcp_tool(name=tool.name) for tool in tools]
+        async def load() -> list[Tool]:
+            return dedupe_with_versions(
+                list(await server.list_tools()), lambda t: t.name
+            )
 
         # SDK may pass None for internal cache refresh despite type hint
         cursor = (
             request.params.cursor if request is not None and request.params else None
         )
-        page, next_cursor = _apply_pagination(sdk_tools, cursor, server._list_page_size)
+        page, next_cursor = await _paginate_listing(
+            server, "tools", cursor, load, lambda t: t.name, lambda t: t.to_mcp_tool()
+        )
         return mcp.types.ListToolsResult(tools=page, nextCursor=next_cursor)
 
     async def _list_resources_mcp(
@@ -127,16 +213,19 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_resources")
 
-        resources = dedupe_with_versions(
-            list(await server.list_resources()), lambda r: str(r.uri)
-        )
-        sdk_resources = [
-            resource.to_mcp_resource(uri=str(resource.uri)) for resource in resources
-        ]
+        async def load() -> list[Resource]:
+            return dedupe_with_versions(
+                list(await server.list_resources()), lambda r: str(r.uri)
+            )
 
         cursor = request.params.cursor if request.params else None
-        page, next_cursor = _apply_pagination(
-            sdk_resources, cursor, server._list_page_size
+        page, next_cursor = await _paginate_listing(
+            server,
+            "resources",
+            cursor,
+            load,
+            lambda r: str(r.uri),
+            lambda r: r.to_mcp_resource(),
         )
         return mcp.types.ListResourcesResult(resources=page, nextCursor=next_cursor)
 
@@ -150,16 +239,19 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_resource_templates")
 
-        templates = dedupe_with_versions(
-            list(await server.list_resource_templates()), lambda t: t.uri_template
-        )
-        sdk_templates = [
-            template.to_mcp_template(uriTemplate=template.uri_template)
-            for template in templates
-        ]
+        async def load() -> list[ResourceTemplate]:
+            return dedupe_with_versions(
+                list(await server.list_resource_templates()), lambda t: t.uri_template
+            )
+
         cursor = request.params.cursor if request.params else None
-        page, next_cursor = _apply_pagination(
-            sdk_templates, cursor, server._list_page_size
+        page, next_cursor = await _paginate_listing(
+            server,
+            "templates",
+            cursor,
+            load,
+            lambda t: t.uri_template,
+            lambda t: t.to_mcp_template(),
         )
         return mcp.types.ListResourceTemplatesResult(
             resourceTemplates=page, nextCursor=next_cursor
@@ -175,13 +267,19 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_prompts")
 
-        prompts = dedupe_with_versions(
-            list(await server.list_prompts()), lambda p: p.name
-        )
-        sdk_prompts = [prompt.to_mcp_prompt(name=prompt.name) for prompt in prompts]
+        async def load() -> list[Prompt]:
+            return dedupe_with_versions(
+                list(await server.list_prompts()), lambda p: p.name
+            )
+
         cursor = request.params.cursor if request.params else None
-        page, next_cursor = _apply_pagination(
-            sdk_prompts, cursor, server._list_page_size
+        page, next_cursor = await _paginate_listing(
+            server,
+            "prompts",
+            cursor,
+            load,
+            lambda p: p.name,
+            lambda p: p.to_mcp_prompt(),
         )
         return mcp.types.ListPromptsResult(prompts=page, nextCursor=next_cursor)
 
@@ -238,7 +336,9 @@ class MCPOperationsMixin:
 
             if isinstance(result, mcp.types.CreateTaskResult):
                 return result
-            return result.to_mcp_result()
+            return result.to_mcp_result(
+                structured_only=_client_wants_structured_only(server)
+            )
 
         except DisabledError as e:
             raise NotFoundError(f"Unknown tool: {key!r}") from e
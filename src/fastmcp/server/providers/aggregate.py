@@ -21,7 +21,7 @@ Example:
 from __future__ import annotations
 
 import logging
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Hashable, Sequence
 from contextlib import AsyncExitStack, asynccontextmanager
 from typing import TYPE_CHECKING, TypeVar
 
@@ -74,6 +74,7 @@ class AggregateProvider(Provider):
         """
         super().__init__()
         self.providers: list[Provider] = list(providers or [])
+        self._catalog_generation = 0
 
     def add_provider(self, provider: Provider, *, namespace: str = "") -> None:
         """Add a provider with optional namespace.
@@ -103,6 +104,23 @@ class AggregateProvider(Provider):
 
         self.providers.append(provider)
 
+    def catalog_generation(self) -> Hashable | None:
+        """Combine this provider's generation with every child provider's.
+
+        Returns None if any child is dynamic, since the aggregate listing
+        can then change at any time.
+        """
+        own = super().catalog_generation()
+        if own is None:
+            return None
+        parts: list[Hashable] = [own]
+        for provider in self.providers:
+            generation = provider.catalog_generation()
+            if generation is None:
+                return None
+            parts.append((id(provider), generation))
+        return tuple(parts)
+
     def _collect_list_results(
         self, results: list[Sequence[T] | BaseException], operation: str
     ) -> list[T]:
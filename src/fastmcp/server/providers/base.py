@@ -28,7 +28,7 @@ Example:
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Hashable, Sequence
 from contextlib import asynccontextmanager
 from functools import partial
 from typing import TYPE_CHECKING, Literal, cast
@@ -64,10 +64,19 @@ class Provider:
     Error handling:
         - `list_*` methods: Errors are logged and the provider returns empty (graceful degradation).
           This allows other providers to still contribute their components.
+
+    Catalog caching:
+        - Servers cache listings only while every provider and transform
+          reports a `catalog_generation()`. Providers whose components are
+          fixed or locally managed set `_catalog_generation` to an int and
+          call `_bump_catalog_generation()` whenever their listings change.
+          The default (None) marks the provider as dynamic, so listings that
+          include it are recomputed on every request.
     """
 
     def __init__(self) -> None:
         self._transforms: list[Transform] = []
+        self._catalog_generation: int | None = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -77,6 +86,32 @@ class Provider:
         """All transforms applied to components from this provider."""
         return list(self._transforms)
 
+    def _bump_catalog_generation(self) -> None:
+        """Record that this provider's own listings may have changed."""
+        if self._catalog_generation is not None:
+            self._catalog_generation += 1
+
+    def catalog_generation(self) -> Hashable | None:
+        """Return a token that changes whenever this provider's listings can change.
+
+        Combines the provider's own generation with the identity and
+        generation of each transform, so adding a transform (or a transform
+        bumping its own counter) also changes the token.
+
+        Returns:
+            A hashable token, or None if listings can change at any time and
+            must not be cached.
+        """
+        if self._catalog_generation is None:
+            return None
+        parts: list[Hashable] = [self._catalog_generation]
+        for transform in self._transforms:
+            generation = transform.catalog_generation
+            if generation is None:
+                return None
+            parts.append((id(transform), generation))
+        return tuple(parts)
+
     def add_transform(self, transform: Transform) -> None:
         """Add a transform to this provider.
 
@@ -10,8 +10,8 @@ executed.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Sequence
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Hashable, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING, Any, overload
 
 import mcp.types
@@ -34,6 +34,22 @@ if TYPE_CHECKING:
     from fastmcp.server.server import FastMCP
 
 
+@contextmanager
+def _parent_applies_auth() -> Iterator[None]:
+    """List a mounted server without filtering for the current caller.
+
+    Wrapped components carry their auth checks, which the parent applies to
+    every listing, so the listing it caches is the same for every caller.
+    """
+    from fastmcp.server.server import _listing_auth_deferred
+
+    token = _listing_auth_deferred.set(True)
+    try:
+        yield
+    finally:
+        _listing_auth_deferred.reset(token)
+
+
 # -----------------------------------------------------------------------------
 # FastMCPProvider component classes
 # -----------------------------------------------------------------------------
@@ -78,6 +94,7 @@ class FastMCPProviderTool(Tool):
             meta=tool.get_meta(),
             title=tool.title,
             icons=tool.icons,
+            auth=tool.auth,
         )
 
     @overload
@@ -184,6 +201,7 @@ class FastMCPProviderResource(Resource):
             meta=resource.get_meta(),
             title=resource.title,
             icons=resource.icons,
+            auth=resource.auth,
         )
 
     @overload
@@ -256,6 +274,7 @@ class FastMCPProviderPrompt(Prompt):
             meta=prompt.get_meta(),
             title=prompt.title,
             icons=prompt.icons,
+            auth=prompt.auth,
         )
 
     @overload
@@ -363,6 +382,7 @@ class FastMCPProviderResourceTemplate(ResourceTemplate):
             meta=template.get_meta(),
             title=template.title,
             icons=template.icons,
+            auth=template.auth,
         )
 
     async def create_resource(self, uri: str, params: dict[str, Any]) -> Resource:
@@ -517,6 +537,25 @@ class FastMCPProvider(Provider):
         """
         super().__init__()
         self.server = server
+        self._catalog_generation = 0
+
+    def catalog_generation(self) -> Hashable | None:
+        """Combine the mounted server's generation with this provider's transforms.
+
+        Listings run the mounted server's middleware, so they're only cached
+        while every middleware on it declares `cacheable_listings`.
+        """
+        if not all(
+            getattr(mw, "cacheable_listings", False) for mw in self.server.middleware
+        ):
+            return None
+        inner = self.server.catalog_generation()
+        if inner is None:
+            return None
+        own = super().catalog_generation()
+        if own is None:
+            return None
+        return (inner, own)
 
     # -------------------------------------------------------------------------
     # Tool methods
@@ -529,7 +568,8 @@ class FastMCPProvider(Provider):
         Wraps each tool as a FastMCPProviderTool that delegates execution to
         the nested server's middleware.
         """
-        raw_tools = await self.server.list_tools()
+        with _parent_applies_auth():
+            raw_tools = await self.server.list_tools()
         return [FastMCPProviderTool.wrap(self.server, t) for t in raw_tools]
 
     async def _get_tool(
@@ -577,7 +617,8 @@ class FastMCPProvider(Provider):
         Wraps each resource as a FastMCPProviderResource that delegates reading
         to the nested server's middleware.
         """
-        raw_resources = await self.server.list_resources()
+        with _parent_applies_auth():
+            raw_resources = await self.server.list_resources()
         return [FastMCPProviderResource.wrap(self.server, r) for r in raw_resources]
 
     async def _get_resource(
@@ -605,7 +646,8 @@ class FastMCPProvider(Provider):
         Returns FastMCPProviderResourceTemplate instances that create
         FastMCPProviderResources when materialized.
         """
-        raw_templates = await self.server.list_resource_templates()
+        with _parent_applies_auth():
+            raw_templates = await self.server.list_resource_templates()
         return [
             FastMCPProviderResourceTemplate.wrap(self.server, t) for t in raw_templates
         ]
@@ -635,7 +677,8 @@ class FastMCPProvider(Provider):
         Returns FastMCPProviderPrompt instances that delegate rendering to the
         wrapped server's middleware.
         """
-        raw_prompts = await self.server.list_prompts()
+        with _parent_applies_auth():
+            raw_prompts = await self.server.list_prompts()
         return [FastMCPProviderPrompt.wrap(self.server, p) for p in raw_prompts]
 
     async def _get_prompt(
@@ -28,7 +28,7 @@ Example:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Hashable, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -106,7 +106,7 @@ class FileSystemProvider(LocalProvider):
     def _load_components(self) -> None:
         """Discover and register all components from the filesystem."""
         if self._loaded:
-            self._components.clear()
+            self._clear_components()
 
         if not self._root.exists():
             logger.warning("FileSystemProvider root does not exist: %s", self._root)
@@ -146,6 +146,12 @@ class FileSystemProvider(LocalProvider):
             f"FileSystemProvider loaded {len(self._components)} components from {self._root}"
         )
 
+    def catalog_generation(self) -> Hashable | None:
+        """Reload mode re-reads the filesystem on every request, so it's uncacheable."""
+        if self._reload:
+            return None
+        return super().catalog_generation()
+
     def _register_component(self, component: FastMCPComponent) -> None:
         """Register a single component based on its type."""
         if isinstance(component, Tool):
@@ -298,6 +298,10 @@ def extract_components(module: ModuleType) -> list[FastMCPComponent]:
                     timeout=meta.timeout,
                     auth=meta.auth,
                     run_in_thread=meta.run_in_thread,
+                    executor=meta.executor,
+                    execution_mode=meta.execution_mode,
+                    stream=meta.stream,
+                    validate_output=meta.validate_output,
                 )
                 components.append(tool)
             elif isinstance(meta, ResourceMeta):
@@ -31,7 +31,9 @@ from fastmcp.exceptions import FastMCPDeprecationWarning
 from fastmcp.server.auth.authorization import AuthCheck
 from fastmcp.server.tasks.config import TaskConfig
 from fastmcp.tools.base import Tool
-from fastmcp.tools.function_tool import FunctionTool
+from fastmcp.tools.executors import ExecutorPolicy
+from fastmcp.tools.function_tool import FunctionTool, ToolExecutionMode
+from fastmcp.tools.streaming import StreamConfig
 from fastmcp.utilities.types import NotSet, NotSetT
 
 try:
@@ -166,6 +168,10 @@ class ToolDecoratorMixin:
                     timeout=fmeta.timeout,
                     auth=fmeta.auth,
                     run_in_thread=fmeta.run_in_thread,
+                    executor=fmeta.executor,
+                    execution_mode=fmeta.execution_mode,
+                    stream=fmeta.stream,
+                    validate_output=fmeta.validate_output,
                 )
             else:
                 tool = Tool.from_function(tool)
@@ -196,6 +202,10 @@ class ToolDecoratorMixin:
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool = True,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode = "thread",
+        stream: bool | StreamConfig = False,
+        validate_output: bool = True,
     ) -> F: ...
 
     @overload
@@ -219,6 +229,10 @@ class ToolDecoratorMixin:
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool = True,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode = "thread",
+        stream: bool | StreamConfig = False,
+        validate_output: bool = True,
     ) -> Callable[[F], F]: ...
 
     # NOTE: This method mirrors fastmcp.tools.tool() but adds registration,
@@ -245,6 +259,10 @@ class ToolDecoratorMixin:
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool = True,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode = "thread",
+        stream: bool | StreamConfig = False,
+        validate_output: bool = True,
     ) -> (
         Callable[[AnyFunction], FunctionTool]
         | FunctionTool
@@ -273,6 +291,10 @@ class ToolDecoratorMixin:
             enabled: Whether the tool is enabled (default True). If False, adds to blocklist.
             task: Optional task configuration for background execution
             serializer: Deprecated. Return ToolResult from your tools for full control over serialization.
+            executor: Optional thread pool and concurrency limits for the tool
+            execution_mode: "thread" (default) or "process" for CPU-bound sync tools
+            stream: Send chunks from a generator tool to the client as they are yielded
+            validate_output: Check structured results against the output schema
 
         Returns:
             The registered FunctionTool or a decorator function.
@@ -350,6 +372,10 @@ class ToolDecoratorMixin:
                     timeout=timeout,
                     auth=auth,
                     run_in_thread=run_in_thread,
+                    executor=executor,
+                    execution_mode=execution_mode,
+                    stream=stream,
+                    validate_output=validate_output,
                 )
                 self._add_component(tool_obj)
                 if not enabled:
@@ -376,6 +402,10 @@ class ToolDecoratorMixin:
                     auth=auth,
                     enabled=enabled,
                     run_in_thread=run_in_thread,
+                    executor=executor,
+                    execution_mode=execution_mode,
+                    stream=stream,
+                    validate_output=validate_output,
                 )
                 target = fn.__func__ if hasattr(fn, "__func__") else fn
                 target.__fastmcp__ = metadata  # type: ignore[attr-defined]  # ty:ignore[unresolved-attribute]
@@ -420,4 +450,8 @@ class ToolDecoratorMixin:
             timeout=timeout,
             auth=auth,
             run_in_thread=run_in_thread,
+            executor=executor,
+            execution_mode=execution_mode,
+            stream=stream,
+            validate_output=validate_output,
         )
@@ -24,12 +24,14 @@ server2 = FastMCP("Server2", providers=[provider])
 
 from __future__ import annotations
 
+import bisect
 from collections.abc import Sequence
 from typing import Literal, TypeVar
 
 from fastmcp.prompts.base import Prompt
 from fastmcp.resources.base import Resource
 from fastmcp.resources.template import ResourceTemplate
+from fastmcp.resources.template_router import TemplateRouter
 from fastmcp.server.providers.base import Provider
 from fastmcp.server.providers.local_provider.decorators import (
     PromptDecoratorMixin,
@@ -103,8 +105,20 @@ class LocalProvider(
         """
         super().__init__()
         self._on_duplicate = on_duplicate
+        self._catalog_generation = 0
         # Unified component storage - keyed by prefixed key (e.g., "tool:name", "resource:uri")
         self._components: dict[str, FastMCPComponent] = {}
+        # Secondary indexes maintained by _add_component/_remove_component.
+        # Per-type views preserve registration order for list operations.
+        self._tools: dict[str, Tool] = {}
+        self._resources: dict[str, Resource] = {}
+        self._templates: dict[str, ResourceTemplate] = {}
+        self._prompts: dict[str, Prompt] = {}
+        # (type, name/uri) -> components sorted ascending by version, so the
+        # highest version is always the last entry.
+        self._versions: dict[tuple[type, str], list[FastMCPComponent]] = {}
+        # Compiled URI router over _templates, rebuilt lazily after changes
+        self._template_router: TemplateRouter[ResourceTemplate] | None = None
 
     # =========================================================================
     # Storage methods
@@ -149,12 +163,9 @@ class LocalProvider(
         is_versioned = component.version is not None
 
         # Check all existing components of the same type and logical name
-        for existing in self._components.values():
-            if not isinstance(existing, comp_type):
-                continue
-
-            _, existing_name = self._get_component_identity(existing)
-            if existing_name != logical_name:
+        for existing in self._versions.get((comp_type, logical_name), ()):
+            if existing.key == component.key:
+                # Being replaced, so it can't conflict
                 continue
 
             existing_versioned = existing.version is not None
@@ -197,7 +208,10 @@ class LocalProvider(
         # Check for versioned/unversioned mixing before adding
         self._check_version_mixing(component)
 
+        if existing:
+            self._unindex_component(existing)
         self._components[component.key] = component
+        self._index_component(component)
         return component
 
     def _remove_component(self, key: str) -> None:
@@ -214,6 +228,77 @@ class LocalProvider(
             raise KeyError(f"Component {key!r} not found")
 
         del self._components[key]
+        self._unindex_component(component)
+
+    def _clear_components(self) -> None:
+        """Remove all components from unified storage and its indexes."""
+        self._components.clear()
+        self._tools.clear()
+        self._resources.clear()
+        self._templates.clear()
+        self._prompts.clear()
+        self._versions.clear()
+        self._template_router = None
+        self._bump_catalog_generation()
+
+    def _type_view(
+        self, component: FastMCPComponent
+    ) -> dict[str, FastMCPComponent] | None:
+        """Return the per-type view dict that holds this component, if any."""
+        if isinstance(component, Tool):
+            return self._tools  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
+        elif isinstance(component, ResourceTemplate):
+            return self._templates  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
+        elif isinstance(component, Resource):
+            return self._resources  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
+        elif isinstance(component, Prompt):
+            return self._prompts  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
+        return None
+
+    def _index_component(self, component: FastMCPComponent) -> None:
+        """Add a stored component to the per-type views and version index."""
+        view = self._type_view(component)
+        if view is not None:
+            view[component.key] = component
+        if isinstance(component, ResourceTemplate):
+            self._template_router = None
+        versions = self._versions.setdefault(
+            self._get_component_identity(component), []
+        )
+        # insort_left places equal versions before existing ones, so the
+        # earliest-registered component wins ties (matching max() semantics)
+        bisect.insort_left(versions, component, key=version_sort_key)
+        self._bump_catalog_generation()
+
+    def _unindex_component(self, component: FastMCPComponent) -> None:
+        """Remove a component from the per-type views and version index."""
+        self._bump_catalog_generation()
+        view = self._type_view(component)
+        if view is not None:
+            view.pop(component.key, None)
+        if isinstance(component, ResourceTemplate):
+            self._template_router = None
+        identity = self._get_component_identity(component)
+        versions = self._versions.get(identity)
+        if versions is None:
+            return
+        versions[:] = [c for c in versions if c is not component]
+        if not versions:
+            del self._versions[identity]
+
+    def _get_versioned(
+        self, identity: tuple[type, str], version: VersionSpec | None
+    ) -> FastMCPComponent | None:
+        """Return the highest version for an identity that matches ``version``."""
+        versions = self._versions.get(identity)
+        if not versions:
+            return None
+        if not version:
+            return versions[-1]
+        for component in reversed(versions):
+            if version.matches(component.version):
+                return component
+        return None
 
     def _get_component(self, key: str) -> FastMCPComponent | None:
         """Get a component by its prefixed key.
@@ -238,11 +323,7 @@ class LocalProvider(
         """
         if version is None:
             # Remove all versions
-            keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, Tool) and c.name == name
-            ]
+            keys_to_remove = [c.key for c in self._versions.get((Tool, name), ())]
             if not keys_to_remove:
                 raise KeyError(f"Tool {name!r} not found")
             for key in keys_to_remove:
@@ -266,11 +347,7 @@ class LocalProvider(
         """
         if version is None:
             # Remove all versions
-            keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, Resource) and str(c.uri) == uri
-            ]
+            keys_to_remove = [c.key for c in self._versions.get((Resource, uri), ())]
             if not keys_to_remove:
                 raise KeyError(f"Resource {uri!r} not found")
             for key in keys_to_remove:
@@ -295,9 +372,7 @@ class LocalProvider(
         if version is None:
             # Remove all versions
             keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, ResourceTemplate) and c.uri_template == uri_template
+                c.key for c in self._versions.get((ResourceTemplate, uri_template), ())
             ]
             if not keys_to_remove:
                 raise KeyError(f"Template {uri_template!r} not found")
@@ -324,11 +399,7 @@ class LocalProvider(
         """
         if version is None:
             # Remove all versions
-            keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, Prompt) and c.name == name
-            ]
+            keys_to_remove = [c.key for c in self._versions.get((Prompt, name), ())]
             if not keys_to_remove:
                 raise KeyError(f"Prompt {name!r} not found")
             for key in keys_to_remove:
@@ -346,7 +417,7 @@ class LocalProvider(
 
     async def _list_tools(self) -> Sequence[Tool]:
         """Return all tools."""
-        return [v for v in self._components.values() if isinstance(v, Tool)]
+        return list(self._tools.values())
 
     async def _get_tool(
         self, name: str, version: VersionSpec | None = None
@@ -357,20 +428,11 @@ class LocalProvider(
             name: The tool name.
             version: Optional version filter. If None, returns highest version.
         """
-        matching = [
-            v
-            for v in self._components.values()
-            if isinstance(v, Tool) and v.name == name
-        ]
-        if version:
-            matching = [t for t in matching if version.matches(t.version)]
-        if not matching:
-            return None
-        return max(matching, key=version_sort_key)  # type: ignore[type-var]  # ty:ignore[invalid-return-type]
+        return self._get_versioned((Tool, name), version)  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
 
     async def _list_resources(self) -> Sequence[Resource]:
         """Return all resources."""
-        return [v for v in self._components.values() if isinstance(v, Resource)]
+        return list(self._resources.values())
 
     async def _get_resource(
         self, uri: str, version: VersionSpec | None = None
@@ -381,20 +443,11 @@ class LocalProvider(
             uri: The resource URI.
             version: Optional version filter. If None, returns highest version.
         """
-        matching = [
-            v
-            for v in self._components.values()
-            if isinstance(v, Resource) and str(v.uri) == uri
-        ]
-        if version:
-            matching = [r for r in matching if version.matches(r.version)]
-        if not matching:
-            return None
-        return max(matching, key=version_sort_key)  # type: ignore[type-var]  # ty:ignore[invalid-return-type]
+        return self._get_versioned((Resource, uri), version)  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
 
     async def _list_resource_templates(self) -> Sequence[ResourceTemplate]:
         """Return all resource templates."""
-        return [v for v in self._components.values() if isinstance(v, ResourceTemplate)]
+        return list(self._templates.values())
 
     async def _get_resource_template(
         self, uri: str, version: VersionSpec | None = None
@@ -405,13 +458,10 @@ class LocalProvider(
             uri: The URI to match against templates.
             version: Optional version filter. If None, returns highest version.
         """
-        # Find all templates that match the URI
-        matching = [
-            component
-            for component in self._components.values()
-            if isinstance(component, ResourceTemplate)
-            and component.matches(uri) is not None
-        ]
+        router = self._template_router
+        if router is None:
+            router = self._template_router = TemplateRouter(self._templates.values())
+        matching = router.match(uri)
         if version:
             matching = [t for t in matching if version.matches(t.version)]
         if not matching:
@@ -420,7 +470,7 @@ class LocalProvider(
 
     async def _list_prompts(self) -> Sequence[Prompt]:
         """Return all prompts."""
-        return [v for v in self._components.values() if isinstance(v, Prompt)]
+        return list(self._prompts.values())
 
     async def _get_prompt(
         self, name: str, version: VersionSpec | None = None
@@ -431,16 +481,7 @@ class LocalProvider(
             name: The prompt name.
             version: Optional version filter. If None, returns highest version.
         """
-        matching = [
-            v
-            for v in self._components.values()
-            if isinstance(v, Prompt) and v.name == name
-        ]
-        if version:
-            matching = [p for p in matching if version.matches(p.version)]
-        if not matching:
-            return None
-        return max(matching, key=version_sort_key)  # type: ignore[type-var]  # ty:ignore[invalid-return-type]
+        return self._get_versioned((Prompt, name), version)  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
 
     # =========================================================================
     # Task registration
@@ -12,6 +12,7 @@ from jsonschema_path import SchemaPath
 
 from fastmcp.prompts import Prompt
 from fastmcp.resources import Resource, ResourceTemplate
+from fastmcp.resources.template_router import TemplateRouter
 from fastmcp.server.providers.base import Provider
 from fastmcp.server.providers.openapi.components import (
     OpenAPIResource,
@@ -99,6 +100,8 @@ class OpenAPIProvider(Provider):
                 response structure while still returning structured JSON.
         """
         super().__init__()
+        # Components are built once from the spec, so listings are stable
+        self._catalog_generation = 0
 
         self._owns_client = client is None
         if client is None:
@@ -119,6 +122,7 @@ class OpenAPIProvider(Provider):
         self._tools: dict[str, OpenAPITool] = {}
         self._resources: dict[str, OpenAPIResource] = {}
         self._templates: dict[str, OpenAPIResourceTemplate] = {}
+        self._template_router: TemplateRouter[OpenAPIResourceTemplate] | None = None
 
         # Create openapi-core Spec and RequestDirector
         try:
@@ -375,6 +379,7 @@ class OpenAPIProvider(Provider):
                 )
 
         self._templates[template.uri_template] = template
+        self._template_router = None
 
     # -------------------------------------------------------------------------
     # Provider interface
@@ -418,7 +423,10 @@ class OpenAPIProvider(Provider):
         self, uri: str, version: VersionSpec | None = None
     ) -> ResourceTemplate | None:
         """Get a resource template that matches the given URI."""
-        matching = [t for t in self._templates.values() if t.matches(uri) is not None]
+        router = self._template_router
+        if router is None:
+            router = self._template_router = TemplateRouter(self._templates.values())
+        matching = router.match(uri)
         if not matching:
             return None
         if version is not None:
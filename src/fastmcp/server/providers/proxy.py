@@ -7,14 +7,23 @@ classes that forward execution to remote servers.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import contextvars
+import copy
 import inspect
+import math
 import time
-from collections.abc import Awaitable, Callable, Sequence
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import quote
 
+import anyio
 import mcp.types
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcp import ServerSession
 from mcp.client.session import ClientSession
 from mcp.server.lowlevel.server import request_ctx
@@ -31,6 +40,7 @@ from pydantic.networks import AnyUrl
 from fastmcp.client.client import Client, FastMCP1Server
 from fastmcp.client.elicitation import ElicitResult
 from fastmcp.client.logging import LogMessage
+from fastmcp.client.messages import MessageHandler
 from fastmcp.client.roots import RootsList
 from fastmcp.client.telemetry import client_span
 from fastmcp.client.transports import ClientTransportT
@@ -41,7 +51,7 @@ from fastmcp.prompts.base import PromptArgument
 from fastmcp.resources import Resource, ResourceTemplate
 from fastmcp.resources.base import ResourceContent, ResourceResult
 from fastmcp.server.context import Context
-from fastmcp.server.dependencies import get_context
+from fastmcp.server.dependencies import get_context, get_http_headers
 from fastmcp.server.providers.base import Provider
 from fastmcp.server.server import FastMCP
 from fastmcp.server.tasks.config import TaskConfig
@@ -157,8 +167,16 @@ class ProxyTool(Tool):
                                 task_metadata.model_dump(exclude_none=True)
                             )
 
+                # A pooled session is shared, so its session-level progress
+                # handler cannot tell whose call a notification belongs to.
+                progress_handler = (
+                    ctx.report_progress if client in _pooled_clients else None
+                )
                 result = await client.call_tool_mcp(
-                    name=backend_name, arguments=arguments, meta=meta
+                    name=backend_name,
+                    arguments=arguments,
+                    meta=meta,
+                    progress_handler=progress_handler,
                 )
             if result.isError:
                 first = result.content[0] if result.content else None
@@ -487,25 +505,390 @@ class ProxyPrompt(Prompt):
         }
 
 
+# -----------------------------------------------------------------------------
+# Session Pooling
+# -----------------------------------------------------------------------------
+
+# Clients handed out by a ProxySessionPool. Their sessions are shared between
+# callers, so per-call state such as progress must be routed explicitly.
+_pooled_clients: weakref.WeakSet[Client] = weakref.WeakSet()
+
+
+class _PooledSession:
+    """One open backend session held by a ProxySessionPool."""
+
+    __slots__ = ("checked_at", "client", "created_at", "uses")
+
+    def __init__(self, client: Client, now: float):
+        self.client = client
+        self.created_at = now
+        self.checked_at = now
+        self.uses = 0
+
+    @property
+    def in_flight(self) -> int:
+        # The pool itself holds one level of the client's nesting counter
+        return max(0, self.client._session_state.nesting_counter - 1)
+
+    def is_alive(self) -> bool:
+        task = self.client._session_state.session_task
+        return task is not None and not task.done()
+
+
+class _SessionPartition:
+    """Sessions opened with the same forwarded headers."""
+
+    __slots__ = ("headers", "lock", "sessions")
+
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+        self.lock = anyio.Lock()
+        self.sessions: list[_PooledSession] = []
+
+
+class ProxySessionPool:
+    """Initialized backend sessions shared by concurrent proxied requests.
+
+    Without a pool, every proxied call opens a fresh client session and pays
+    the MCP ``initialize`` handshake, plus connection setup for HTTP
+    backends. A pool keeps up to ``size`` sessions open and hands each
+    request the least busy one; concurrent requests on a session are
+    multiplexed by JSON-RPC request id.
+
+    Sessions are replaced when their connection has failed, when they are
+    older than ``max_age`` seconds, or when a ``ping`` fails after they have
+    been idle for ``ping_interval`` seconds.
+
+    For HTTP backends that forward incoming headers, sessions are
+    partitioned by the values of ``partition_headers`` (by default the
+    caller's ``authorization`` header), so a request only ever uses a session
+    opened with its own credentials. Only those headers are forwarded through
+    pooled sessions; other incoming headers vary per request and cannot be
+    applied to a shared connection.
+
+    Sessions are opened outside any request context. Backend log messages
+    and server-initiated requests (sampling, elicitation, roots) cannot be
+    attributed to a single caller and are therefore not forwarded; progress
+    notifications are forwarded per call. Do not pool stateful backends.
+
+    Example:
+        ```python
+        from fastmcp.server.providers.proxy import (
+            FastMCPProxy,
+            ProxyClient,
+            ProxySessionPool,
+        )
+
+        base = ProxyClient("http://localhost:8000/mcp")
+        proxy = FastMCPProxy(
+            client_factory=base.new,
+            session_pool=ProxySessionPool(size=8),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 4,
+        max_age: float | None = 300.0,
+        ping_interval: float | None = 30.0,
+        ping_timeout: float = 5.0,
+        partition_headers: Sequence[str] = ("authorization",),
+        max_partitions: int = 64,
+    ):
+        """Initialize a ProxySessionPool.
+
+        Args:
+            size: Maximum number of open sessions per partition.
+            max_age: Seconds after which a session is replaced. None keeps
+                sessions until they fail.
+            ping_interval: Seconds a session may sit idle before it is pinged
+                on its next use. None disables health checks.
+            ping_timeout: Seconds to wait for a health-check ping.
+            partition_headers: Incoming headers that must match for two
+                requests to share a session.
+            max_partitions: Maximum number of partitions. The least recently
+                used partition is closed when a new one would exceed this.
+        """
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        if max_partitions < 1:
+            raise ValueError(f"max_partitions must be at least 1, got {max_partitions}")
+        self.size = size
+        self.max_age = max_age
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.partition_headers = frozenset(h.lower() for h in partition_headers)
+        self.max_partitions = max_partitions
+        self._client_factory: ClientFactoryT | None = None
+        self._partitions: OrderedDict[
+            tuple[tuple[str, str], ...], _SessionPartition
+        ] = OrderedDict()
+
+    def bind(self, client_factory: ClientFactoryT) -> ClientFactoryT:
+        """Return a client factory that draws connected clients from the pool.
+
+        Each pooled session is a `Client.new()` copy of a client returned by
+        `client_factory`.
+        """
+        if self._client_factory is not None:
+            raise ValueError("ProxySessionPool is already bound to a client factory")
+        self._client_factory = client_factory
+
+        async def pooled_client_factory() -> Client:
+            return await self.acquire()
+
+        return pooled_client_factory
+
+    async def acquire(self) -> Client:
+        """Return a connected client for the current request.
+
+        The client is already entered by the pool, so `async with client:`
+        only adds a reference and never performs a handshake. That reference
+        is counted here, so concurrent callers spread across sessions even
+        before they enter their clients.
+        """
+        partition = await self._get_partition()
+        while True:
+            session = await self._lease(partition)
+            if session is not None:
+                return session.client
+
+    async def _lease(self, partition: _SessionPartition) -> _PooledSession | None:
+        """Pick the least busy session and count a reference for the caller.
+
+        Returns None if the chosen session closed before it could be leased.
+        """
+        now = time.monotonic()
+        for session in list(partition.sessions):
+            if not session.is_alive() or (
+                self.max_age is not None and now - session.created_at > self.max_age
+            ):
+                await self._retire(partition, session)
+
+        while partition.sessions:
+            session = min(partition.sessions, key=lambda s: (s.in_flight, s.uses))
+            if session.in_flight and len(partition.sessions) < self.size:
+                break  # every session is busy and there is room for another
+            if await self._check(partition, session):
+                return await self._reserve(partition, session)
+
+        async with partition.lock:
+            # Another request may have opened a session while we waited
+            idle = [s for s in partition.sessions if not s.in_flight]
+            if idle or len(partition.sessions) >= self.size:
+                session = min(
+                    idle or partition.sessions, key=lambda s: (s.in_flight, s.uses)
+                )
+            else:
+                session = _PooledSession(
+                    await self._open(partition.headers), time.monotonic()
+                )
+                partition.sessions.append(session)
+            # Leased under the lock so the next waiter sees the session busy
+            return await self._reserve(partition, session)
+
+    async def _reserve(
+        self, partition: _SessionPartition, session: _PooledSession
+    ) -> _PooledSession | None:
+        if session.client._reserve_reference():
+            session.uses += 1
+            return session
+        await self._retire(partition, session)
+        return None
+
+    async def close(self) -> None:
+        """Close every pooled session. The pool reopens sessions on next use."""
+        while self._partitions:
+            _, partition = self._partitions.popitem()
+            await self._close_partition(partition)
+
+    async def _get_partition(self) -> _SessionPartition:
+        headers = {
+            name: value
+            for name, value in get_http_headers(
+                include=set(self.partition_headers)
+            ).items()
+            if name in self.partition_headers
+        }
+        key = tuple(sorted(headers.items()))
+        partition = self._partitions.get(key)
+        if partition is not None:
+            self._partitions.move_to_end(key)
+            return partition
+        partition = _SessionPartition(headers)
+        self._partitions[key] = partition
+        while len(self._partitions) > self.max_partitions:
+            _, evicted = self._partitions.popitem(last=False)
+            await self._close_partition(evicted)
+        return partition
+
+    async def _check(
+        self, partition: _SessionPartition, session: _PooledSession
+    ) -> bool:
+        """Ping a session that has been idle too long; retire it if unhealthy."""
+        now = time.monotonic()
+        if (
+            self.ping_interval is None
+            or session.in_flight
+            or now - session.checked_at < self.ping_interval
+        ):
+            return True
+        healthy = False
+        with anyio.move_on_after(self.ping_timeout):
+            try:
+                healthy = await session.client.ping()
+            except Exception as e:
+                logger.debug(f"Pooled proxy session failed health check: {e}")
+        if healthy:
+            session.checked_at = time.monotonic()
+            return True
+        await self._retire(partition, session)
+        return False
+
+    async def _open(self, headers: dict[str, str]) -> Client:
+        if self._client_factory is None:
+            raise RuntimeError("ProxySessionPool is not bound to a client factory")
+        template = self._client_factory()
+        if inspect.isawaitable(template):
+            template = cast(Client, await template)
+        client = template.new()
+
+        from fastmcp.client.transports.http import StreamableHttpTransport
+        from fastmcp.client.transports.sse import SSETransport
+
+        transport = client.transport
+        if (
+            isinstance(transport, StreamableHttpTransport | SSETransport)
+            and transport.forward_incoming_headers
+        ):
+            # The session outlives this request, so pin the partition's
+            # headers instead of reading them from whichever request is
+            # current when the transport connects.
+            transport = copy.copy(transport)
+            transport.headers = headers | transport.headers
+            transport.forward_incoming_headers = False
+            client.transport = transport
+
+        # Connect from a task started in an empty context so the session's
+        # background tasks do not capture this request's context and hand it
+        # to later callers.
+        errors: list[Exception] = []
+
+        async def connect() -> None:
+            try:
+                await client._connect()
+            except Exception as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            contextvars.Context().run(tg.start_soon, connect)
+        if errors:
+            raise errors[0]
+        _pooled_clients.add(client)
+        return client
+
+    async def _retire(
+        self, partition: _SessionPartition, session: _PooledSession
+    ) -> None:
+        if session in partition.sessions:
+            partition.sessions.remove(session)
+        # Releases the pool's reference; in-flight requests finish first
+        with anyio.CancelScope(shield=True):
+            try:
+                await session.client._disconnect()
+            except Exception as e:
+                logger.debug(f"Error closing pooled proxy session: {e}")
+
+    async def _close_partition(self, partition: _SessionPartition) -> None:
+        for session in list(partition.sessions):
+            await self._retire(partition, session)
+
+
 # -----------------------------------------------------------------------------
 # ProxyProvider
 # -----------------------------------------------------------------------------
 
 
 class _CacheEntry:
-    """A cached sequence of components with a monotonic timestamp."""
+    """A cached sequence of components with a monotonic timestamp.
+
+    When `key` is given, components are also indexed by it so lookups by
+    name or URI don't scan the whole list.
+    """
 
-    __slots__ = ("items", "timestamp")
+    __slots__ = ("index", "items", "timestamp")
 
-    def __init__(self, items: Sequence[Any], timestamp: float):
+    def __init__(
+        self,
+        items: Sequence[Any],
+        timestamp: float,
+        key: Callable[[Any], str] | None = None,
+    ):
         self.items = items
         self.timestamp = timestamp
+        self.index: dict[str, list[Any]] = {}
+        if key is not None:
+            for item in items:
+                self.index.setdefault(key(item), []).append(item)
 
     def is_fresh(self, ttl: float) -> bool:
         return (time.monotonic() - self.timestamp) < ttl
 
+    def invalidate(self) -> None:
+        self.timestamp = float("-inf")
+
 
 _DEFAULT_CACHE_TTL: float = 300.0
+_WATCH_PING_INTERVAL: float = 30.0
+_WATCH_MAX_BACKOFF: float = 60.0
+# Consecutive failed background refreshes after which a cached list expires
+_MAX_REFRESH_FAILURES: int = 3
+
+# Cache attribute and list method for each component kind
+_CACHE_KINDS: dict[str, tuple[str, str]] = {
+    "tools": ("_tools_cache", "_list_tools"),
+    "resources": ("_resources_cache", "_list_resources"),
+    "templates": ("_templates_cache", "_list_resource_templates"),
+    "prompts": ("_prompts_cache", "_list_prompts"),
+}
+
+
+def _select_version(matching: list[Any], version: VersionSpec | None) -> Any | None:
+    if version:
+        matching = [c for c in matching if version.matches(c.version)]
+    if not matching:
+        return None
+    return max(matching, key=version_sort_key)
+
+
+class _ListChangedHandler(MessageHandler):
+    """Invalidates a ProxyProvider's caches on backend list_changed notifications."""
+
+    def __init__(self, provider: ProxyProvider):
+        self._provider = weakref.ref(provider)
+
+    def _invalidate(self, *kinds: str) -> None:
+        provider = self._provider()
+        if provider is not None:
+            for kind in kinds:
+                provider._invalidate(kind)
+
+    async def on_tool_list_changed(
+        self, message: mcp.types.ToolListChangedNotification
+    ) -> None:
+        self._invalidate("tools")
+
+    async def on_resource_list_changed(
+        self, message: mcp.types.ResourceListChangedNotification
+    ) -> None:
+        self._invalidate("resources", "templates")
+
+    async def on_prompt_list_changed(
+        self, message: mcp.types.PromptListChangedNotification
+    ) -> None:
+        self._invalidate("prompts")
 
 
 class ProxyProvider(Provider):
@@ -524,8 +907,18 @@ class ProxyProvider(Provider):
     per-session visibility and auth filtering are applied after cache lookup
     by the server layer.  The cache is refreshed whenever a ``list_*`` call
     is made, and entries expire after ``cache_ttl`` seconds (default 300).
-    Set ``cache_ttl=0`` to disable caching.  Disabling is recommended for
-    backends whose component lists change dynamically.
+    While the server is running, an expired list keeps serving lookups while
+    it is refreshed in the background, so only the first lookup waits on the
+    backend.  After several consecutive failed refreshes the list is dropped
+    and the next lookup fetches it inline.  Backends whose client forwards
+    the incoming request's headers are always refetched inline, because a
+    background refresh has no request to take headers from.  Set
+    ``cache_ttl=0`` to disable caching.
+
+    For backends whose component lists change dynamically, set
+    ``watch_changes=True``: the provider then keeps one backend session open
+    for its lifespan and refreshes a list as soon as the backend sends the
+    matching ``notifications/*/list_changed``.
 
     Example:
         ```python
@@ -547,6 +940,8 @@ class ProxyProvider(Provider):
         self,
         client_factory: ClientFactoryT,
         cache_ttl: float | None = None,
+        session_pool: ProxySessionPool | None = None,
+        watch_changes: bool = False,
     ):
         """Initialize a ProxyProvider.
 
@@ -557,14 +952,32 @@ class ProxyProvider(Provider):
             cache_ttl: How long (in seconds) to cache component lists for
                       individual lookups.  Defaults to 300.  Set to 0 to
                       disable caching.
+            session_pool: Keep backend sessions open and share them between
+                         requests instead of connecting for every call.
+                         Only for backends without per-session state.
+            watch_changes: Hold a backend session open during the provider's
+                          lifespan and refresh cached lists when the backend
+                          reports that they changed.
         """
         super().__init__()
+        self.session_pool = session_pool
+        self._watch_client_factory = client_factory
+        if session_pool is not None:
+            client_factory = session_pool.bind(client_factory)
         self.client_factory = client_factory
+        self.watch_changes = watch_changes
         self._cache_ttl = cache_ttl if cache_ttl is not None else _DEFAULT_CACHE_TTL
         self._tools_cache: _CacheEntry[Tool] | None = None
         self._resources_cache: _CacheEntry[Resource] | None = None
         self._templates_cache: _CacheEntry[ResourceTemplate] | None = None
         self._prompts_cache: _CacheEntry[Prompt] | None = None
+        # Set while the lifespan runs the background refresh worker
+        self._refresh_requests: MemoryObjectSendStream[str] | None = None
+        self._refreshing: set[str] = set()
+        self._refresh_again: set[str] = set()
+        self._refresh_failures: dict[str, int] = {}
+        # False when backend clients forward incoming headers (see lifespan)
+        self._background_refresh = False
 
     async def _get_client(self) -> Client:
         """Gets a client instance by calling the sync or async factory."""
@@ -573,6 +986,151 @@ class ProxyProvider(Provider):
             client = cast(Client, await client)
         return client
 
+    # -------------------------------------------------------------------------
+    # Cache methods
+    # -------------------------------------------------------------------------
+
+    async def _cached(self, kind: str) -> _CacheEntry:
+        """Return the cached list for `kind`, refreshing it if needed.
+
+        Only a missing list (or a disabled cache) is fetched inline. While
+        the lifespan is running, an expired list is returned as is and
+        refreshed in the background; outside it, the list is refetched inline.
+        """
+        attr, list_method = _CACHE_KINDS[kind]
+        cache = getattr(self, attr)
+        if (
+            cache is None
+            or self._cache_ttl <= 0
+            or (not cache.is_fresh(self._cache_ttl) and not self._start_refresh(kind))
+        ):
+            await getattr(self, list_method)()
+            cache = getattr(self, attr)
+        return cache
+
+    def _start_refresh(self, kind: str) -> bool:
+        """Queue a background refetch of a component list, once per kind.
+
+        Returns False if no background worker is running or lists must be
+        fetched in the requesting context.
+        """
+        if self._refresh_requests is None or not self._background_refresh:
+            return False
+        if kind in self._refreshing:
+            # The running fetch may predate the change that triggered this
+            self._refresh_again.add(kind)
+            return True
+        self._refreshing.add(kind)
+        self._refresh_requests.send_nowait(kind)
+        return True
+
+    async def _refresh(self, kind: str) -> None:
+        attr, list_method = _CACHE_KINDS[kind]
+        try:
+            while True:
+                self._refresh_again.discard(kind)
+                await getattr(self, list_method)()
+                if kind not in self._refresh_again:
+                    break
+        except Exception:
+            failures = self._refresh_failures.get(kind, 0) + 1
+            if failures < _MAX_REFRESH_FAILURES:
+                self._refresh_failures[kind] = failures
+                logger.warning(
+                    f"Background refresh of proxied {kind} failed; serving the cached list",
+                    exc_info=True,
+                )
+            else:
+                # Stop serving a list the backend can no longer confirm; the
+                # next lookup fetches inline and surfaces the error.
+                self._refresh_failures.pop(kind, None)
+                setattr(self, attr, None)
+                logger.warning(
+                    f"Background refresh of proxied {kind} failed {failures} times "
+                    "in a row; dropping the cached list",
+                    exc_info=True,
+                )
+        else:
+            self._refresh_failures.pop(kind, None)
+        finally:
+            self._refreshing.discard(kind)
+
+    async def _can_refresh_in_background(self) -> bool:
+        """Whether lists can be fetched outside the request that needs them.
+
+        Not when backend clients forward the incoming request's HTTP headers,
+        or when the client factory can't be inspected.
+        """
+        from fastmcp.client.transports.http import StreamableHttpTransport
+        from fastmcp.client.transports.sse import SSETransport
+
+        try:
+            client = self._watch_client_factory()
+            if inspect.isawaitable(client):
+                client = cast(Client, await client)
+        except Exception:
+            logger.debug(
+                "Could not inspect the proxy client; refreshing lists inline",
+                exc_info=True,
+            )
+            return False
+        transport = client.transport
+        return not (
+            isinstance(transport, StreamableHttpTransport | SSETransport)
+            and transport.forward_incoming_headers
+        )
+
+    async def _run_background(self, requests: MemoryObjectReceiveStream[str]) -> None:
+        """Run queued refreshes and, if enabled, the list_changed watcher."""
+        async with anyio.create_task_group() as tg:
+            if self.watch_changes:
+                tg.start_soon(self._watch_list_changed)
+            async with requests:
+                async for kind in requests:
+                    tg.start_soon(self._refresh, kind)
+
+    def _invalidate(self, kind: str) -> None:
+        """Mark the cached list for `kind` as expired and queue a refetch."""
+        cache = getattr(self, _CACHE_KINDS[kind][0])
+        if cache is None:
+            return
+        cache.invalidate()
+        self._start_refresh(kind)
+
+    async def _watch_list_changed(self) -> None:
+        """Keep a backend session open to receive list_changed notifications.
+
+        Reconnects with exponential backoff if the session fails. Lists are
+        refetched after a reconnect because notifications may have been
+        missed while the session was down.
+        """
+        handler = _ListChangedHandler(self)
+        delay = 1.0
+        connected_before = False
+        while True:
+            try:
+                client = self._watch_client_factory()
+                if inspect.isawaitable(client):
+                    client = cast(Client, await client)
+                client = client.new()
+                client._session_kwargs["message_handler"] = handler
+                async with client:
+                    delay = 1.0
+                    if connected_before:
+                        for kind in _CACHE_KINDS:
+                            self._invalidate(kind)
+                    connected_before = True
+                    while True:
+                        await anyio.sleep(_WATCH_PING_INTERVAL)
+                        await client.ping()
+            except Exception:
+                logger.debug(
+                    f"list_changed watch session failed; reconnecting in {delay}s",
+                    exc_info=True,
+                )
+            await anyio.sleep(delay)
+            delay = min(delay * 2, _WATCH_MAX_BACKOFF)
+
     # -------------------------------------------------------------------------
     # Tool methods
     # -------------------------------------------------------------------------
@@ -591,23 +1149,14 @@ class ProxyProvider(Provider):
                 tools = []
             else:
                 raise
-        self._tools_cache = _CacheEntry(tools, time.monotonic())
+        self._tools_cache = _CacheEntry(tools, time.monotonic(), key=lambda t: t.name)
         return tools
 
     async def _get_tool(
         self, name: str, version: VersionSpec | None = None
     ) -> Tool | None:
-        cache = self._tools_cache
-        if cache is None or not cache.is_fresh(self._cache_ttl):
-            await self._list_tools()
-            cache = self._tools_cache
-        assert cache is not None
-        matching = [t for t in cache.items if t.name == name]
-        if version:
-            matching = [t for t in matching if version.matches(t.version)]
-        if not matching:
-            return None
-        return max(matching, key=version_sort_key)  # type: ignore[type-var]  # ty:ignore[invalid-return-type]
+        cache = await self._cached("tools")
+        return _select_version(cache.index.get(name, []), version)
 
     # -------------------------------------------------------------------------
     # Resource methods
@@ -628,23 +1177,16 @@ class ProxyProvider(Provider):
                 resources = []
             else:
                 raise
-        self._resources_cache = _CacheEntry(resources, time.monotonic())
+        self._resources_cache = _CacheEntry(
+            resources, time.monotonic(), key=lambda r: str(r.uri)
+        )
         return resources
 
     async def _get_resource(
         self, uri: str, version: VersionSpec | None = None
     ) -> Resource | None:
-        cache = self._resources_cache
-        if cache is None or not cache.is_fresh(self._cache_ttl):
-            await self._list_resources()
-            cache = self._resources_cache
-        assert cache is not None
-        matching = [r for r in cache.items if str(r.uri) == uri]
-        if version:
-            matching = [r for r in matching if version.matches(r.version)]
-        if not matching:
-            return None
-        return max(matching, key=version_sort_key)  # type: ignore[type-var]  # ty:ignore[invalid-return-type]
+        cache = await self._cached("resources")
+        return _select_version(cache.index.get(uri, []), version)
 
     # -------------------------------------------------------------------------
     # Resource template methods
@@ -671,17 +1213,9 @@ class ProxyProvider(Provider):
     async def _get_resource_template(
         self, uri: str, version: VersionSpec | None = None
     ) -> ResourceTemplate | None:
-        cache = self._templates_cache
-        if cache is None or not cache.is_fresh(self._cache_ttl):
-            await self._list_resource_templates()
-            cache = self._templates_cache
-        assert cache is not None
+        cache = await self._cached("templates")
         matching = [t for t in cache.items if t.matches(uri) is not None]
-        if version:
-            matching = [t for t in matching if version.matches(t.version)]
-        if not matching:
-            return None
-        return max(matching, key=version_sort_key)  # type: ignore[type-var]  # ty:ignore[invalid-return-type]
+        return _select_version(matching, version)
 
     # -------------------------------------------------------------------------
     # Prompt methods
@@ -702,23 +1236,16 @@ class ProxyProvider(Provider):
                 prompts = []
             else:
                 raise
-        self._prompts_cache = _CacheEntry(prompts, time.monotonic())
+        self._prompts_cache = _CacheEntry(
+            prompts, time.monotonic(), key=lambda p: p.name
+        )
         return prompts
 
     async def _get_prompt(
         self, name: str, version: VersionSpec | None = None
     ) -> Prompt | None:
-        cache = self._prompts_cache
-        if cache is None or not cache.is_fresh(self._cache_ttl):
-            await self._list_prompts()
-            cache = self._prompts_cache
-        assert cache is not None
-        matching = [p for p in cache.items if p.name == name]
-        if version:
-            matching = [p for p in matching if version.matches(p.version)]
-        if not matching:
-            return None
-        return max(matching, key=version_sort_key)  # type: ignore[type-var]  # ty:ignore[invalid-return-type]
+        cache = await self._cached("prompts")
+        return _select_version(cache.index.get(name, []), version)
 
     # -------------------------------------------------------------------------
     # Task methods
@@ -733,8 +1260,34 @@ class ProxyProvider(Provider):
         """
         return []
 
-    # lifespan() uses default implementation (empty context manager)
-    # because client cleanup is handled per-request
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[None]:
+        """Run background cache refreshes and close pooled sessions.
+
+        The refresh worker (and the list_changed watcher, with
+        `watch_changes`) runs in its own task rather than a task group around
+        the yield, because the server may exit its lifespan from a different
+        task than the one that entered it. Lists of backends that forward
+        incoming headers are not refreshed there, since the worker runs
+        outside any request.
+        """
+        send, receive = anyio.create_memory_object_stream[str](math.inf)
+        self._background_refresh = await self._can_refresh_in_background()
+        self._refresh_requests = send
+        background = asyncio.create_task(self._run_background(receive))
+        try:
+            yield
+        finally:
+            self._refresh_requests = None
+            send.close()
+            background.cancel()
+            with suppress(asyncio.CancelledError):
+                await background
+            self._refreshing.clear()
+            self._refresh_again.clear()
+            self._refresh_failures.clear()
+            if self.session_pool is not None:
+                await self.session_pool.close()
 
 
 # -----------------------------------------------------------------------------
@@ -837,6 +1390,8 @@ class FastMCPProxy(FastMCP):
         self,
         *,
         client_factory: ClientFactoryT,
+        session_pool: ProxySessionPool | None = None,
+        watch_changes: bool = False,
         **kwargs,
     ):
         """Initialize the proxy server.
@@ -848,11 +1403,17 @@ class FastMCPProxy(FastMCP):
             client_factory: A callable that returns a Client instance when called.
                            This gives you full control over session creation and reuse.
                            Can be either a synchronous or asynchronous function.
+            session_pool: Optional pool of warm backend sessions shared
+                         between requests. See `ProxySessionPool`.
+            watch_changes: Refresh cached component lists when the backend
+                          sends list_changed notifications. See `ProxyProvider`.
             **kwargs: Additional settings for the FastMCP server.
         """
         super().__init__(**kwargs)
         self.client_factory = client_factory
-        provider: Provider = ProxyProvider(client_factory)
+        provider: Provider = ProxyProvider(
+            client_factory, session_pool=session_pool, watch_changes=watch_changes
+        )
         self.add_provider(provider)
 
 
@@ -6,7 +6,7 @@ with an additional transform. Created by `Provider.wrap_transform()`.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Hashable, Sequence
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
@@ -42,10 +42,21 @@ class _WrappedProvider(Provider):
         """
         super().__init__()
         self._inner = inner
+        self._catalog_generation = 0
         # Add the transform to this provider's transform list
         # It will be applied via the normal transform chain
         self._transforms.append(transform)
 
+    def catalog_generation(self) -> Hashable | None:
+        """Combine the inner provider's generation with the wrapper's transforms."""
+        inner = self._inner.catalog_generation()
+        if inner is None:
+            return None
+        own = super().catalog_generation()
+        if own is None:
+            return None
+        return (inner, own)
+
     def __repr__(self) -> str:
         return f"_WrappedProvider({self._inner!r}, transforms={self._transforms!r})"
 
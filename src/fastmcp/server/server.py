@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import logging
 import re
 import secrets
 import warnings
@@ -17,6 +16,7 @@ from contextlib import (
     AbstractAsyncContextManager,
     asynccontextmanager,
 )
+from contextvars import ContextVar
 from dataclasses import replace
 from functools import partial
 from pathlib import Path
@@ -64,9 +64,11 @@ from fastmcp.prompts.function_prompt import FunctionPrompt
 from fastmcp.resources.base import Resource, ResourceResult
 from fastmcp.resources.template import ResourceTemplate
 from fastmcp.server.auth import AuthCheck, AuthContext, AuthProvider, run_auth_checks
+from fastmcp.server.catalog_cache import CatalogCache
 from fastmcp.server.lifespan import Lifespan
 from fastmcp.server.low_level import LowLevelServer
-from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.server.middleware.middleware import compile_middleware_chain
 from fastmcp.server.mixins import LifespanMixin, MCPOperationsMixin, TransportMixin
 from fastmcp.server.providers import LocalProvider, Provider
 from fastmcp.server.providers.aggregate import AggregateProvider
@@ -76,13 +78,21 @@ from fastmcp.server.transforms import (
     ToolTransform,
     Transform,
 )
-from fastmcp.server.transforms.visibility import apply_session_transforms, is_enabled
+from fastmcp.server.transforms.visibility import (
+    SessionVisibilityCache,
+    apply_session_transforms,
+    get_current_session_rules,
+    is_enabled,
+)
 from fastmcp.settings import DuplicateBehavior as DuplicateBehaviorSetting
 from fastmcp.tools.base import Tool, ToolResult
-from fastmcp.tools.function_tool import FunctionTool
+from fastmcp.tools.executors import ExecutorPolicy
+from fastmcp.tools.function_tool import FunctionTool, ToolExecutionMode
+from fastmcp.tools.streaming import StreamConfig
 from fastmcp.tools.tool_transform import ToolTransformConfig
 from fastmcp.utilities.components import FastMCPComponent, _coerce_version
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.pagination import ListingSnapshots
 from fastmcp.utilities.types import FastMCPBaseModel, NotSet, NotSetT
 from fastmcp.utilities.versions import (
     VersionSpec,
@@ -90,10 +100,15 @@ from fastmcp.utilities.versions import (
 )
 
 if TYPE_CHECKING:
+    import contextvars
+
+    from anyio.streams.memory import MemoryObjectSendStream
+
     from fastmcp.client import Client
     from fastmcp.client.client import FastMCP1Server
     from fastmcp.client.sampling import SamplingHandler
     from fastmcp.client.transports import ClientTransport, ClientTransportT
+    from fastmcp.server.dependencies import DependencyScopeCache
     from fastmcp.server.providers.openapi import ComponentFn as OpenAPIComponentFn
     from fastmcp.server.providers.openapi import RouteMap
     from fastmcp.server.providers.openapi import RouteMapFn as OpenAPIRouteMapFn
@@ -102,18 +117,6 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-# The MCP SDK warns "Tool X not listed, no validation will be performed"
-# for every call to app-only tools (hidden from list_tools by design).
-# This fires even when validate_input=False. Suppress it.
-class _SuppressUnlistedToolWarning(logging.Filter):
-    def filter(self, record: logging.LogRecord) -> bool:
-        return "not listed, no validation" not in record.getMessage()
-
-
-logging.getLogger("mcp.server.lowlevel.server").addFilter(
-    _SuppressUnlistedToolWarning()
-)
-
 F = TypeVar("F", bound=Callable[..., Any])
 
 DuplicateBehavior = Literal["warn", "error", "replace", "ignore"]
@@ -182,6 +185,53 @@ def _get_auth_context() -> tuple[bool, Any]:
     return (False, get_access_token())
 
 
+# Set while a parent server lists this server through a FastMCPProvider. The
+# parent runs each component's auth checks itself, so listings handed to it
+# must not be filtered for (and cached on behalf of) a single caller.
+_listing_auth_deferred: ContextVar[bool] = ContextVar(
+    "_listing_auth_deferred", default=False
+)
+
+
+def _get_listing_auth_context() -> tuple[bool, Any]:
+    """Get the auth context used to filter listings.
+
+    Like `_get_auth_context`, but skips auth while a parent server that
+    applies the checks itself is listing this server.
+    """
+    if _listing_auth_deferred.get():
+        return (True, None)
+    return _get_auth_context()
+
+
+_TOOL_ROUTES_KEY = "_fastmcp:tool_routes"
+
+
+def _request_tool_routes() -> dict[tuple[Any, ...], Tool] | None:
+    """Get the request-scoped cache of resolved tool routes.
+
+    A call to a mounted tool resolves the tool once while the parent looks it
+    up, and again when the child server handles the delegated call. Both
+    happen within the same request, and Context shares its request-scoped
+    state with nested contexts, so the resolution from the first lookup can
+    be reused by the second. Returns None outside a request context.
+    """
+    from fastmcp.server.context import _current_context
+
+    ctx = _current_context.get()
+    if ctx is None:
+        return None
+    return ctx._request_state.setdefault(_TOOL_ROUTES_KEY, {})
+
+
+def _tool_route_key(
+    server: FastMCP[Any], name: str, version: VersionSpec | None
+) -> tuple[Any, ...]:
+    if version is None:
+        return (id(server), name, None)
+    return (id(server), name, version.gte, version.lt, version.eq)
+
+
 def _is_model_visible(tool: Tool) -> bool:
     """Check whether a tool should be visible to the model.
 
@@ -302,6 +352,7 @@ class FastMCP(
         dereference_schemas: bool = True,
         strict_input_validation: bool | None = None,
         list_page_size: int | None = None,
+        structured_content_only: bool = False,
         tasks: bool | None = None,
         session_state_store: AsyncKeyValue | None = None,
         sampling_handler: SamplingHandler | None = None,
@@ -323,6 +374,8 @@ class FastMCP(
         # Docket and Worker instances (set during lifespan for cross-task access)
         self._docket = None
         self._worker = None
+        # Values of scope="server" Depends(), while the lifespan is running
+        self._dependency_scope: DependencyScopeCache | None = None
 
         self._additional_http_routes: list[BaseRoute] = []
 
@@ -360,6 +413,10 @@ class FastMCP(
             raise ValueError("list_page_size must be a positive integer")
         self._list_page_size: int | None = list_page_size
 
+        # Omit the JSON text mirror of structured tool results for clients
+        # that advertise STRUCTURED_CONTENT_ONLY_EXTENSION_ID
+        self._structured_content_only: bool = structured_content_only
+
         # Handle Lifespan instances (they're callable) or regular lifespan functions
         if lifespan is not None:
             self._lifespan: LifespanCallable[LifespanResultT] = cast(
@@ -372,6 +429,13 @@ class FastMCP(
         self._lifespan_ref_count: int = 0
         self._lifespan_lock: asyncio.Lock = asyncio.Lock()
         self._started: asyncio.Event = asyncio.Event()
+        # Set while the lifespan runs the background task group
+        self._background_work: (
+            MemoryObjectSendStream[
+                tuple[contextvars.Context, Callable[[], Awaitable[Any]]]
+            ]
+            | None
+        ) = None
 
         # Generate random ID if no name provided
         self._mcp_server: LowLevelServer[LifespanResultT, Any] = LowLevelServer[
@@ -411,6 +475,24 @@ class FastMCP(
         )
 
         self.middleware: list[Middleware] = list(middleware or [])
+        # Compiled chains keyed by (method, type), along with the middleware
+        # they were compiled from so direct edits to the list are picked up
+        self._middleware_chains: dict[
+            tuple[str | None, str],
+            Callable[[MiddlewareContext[Any], CallNext[Any, Any]], Awaitable[Any]],
+        ] = {}
+        self._compiled_middleware: tuple[Middleware, ...] = ()
+        # Post-transform listings keyed by catalog generation and session
+        # visibility rules; auth filtering still runs on every request
+        self._catalog_cache = CatalogCache()
+        # Listings referenced by pagination cursors, so later pages slice the
+        # listing from the first page instead of rebuilding it
+        self._list_snapshots = ListingSnapshots()
+        # Compiled per-session visibility rules, written through on change so
+        # requests don't re-read them from the (possibly remote) state store
+        self._session_visibility = SessionVisibilityCache(
+            ttl=fastmcp.settings.session_visibility_cache_ttl
+        )
 
         if dereference_schemas:
             from fastmcp.server.middleware.dereference import (
@@ -472,16 +554,30 @@ class FastMCP(
     async def _run_middleware(
         self,
         context: MiddlewareContext[Any],
-        call_next: Callable[[MiddlewareContext[Any]], Awaitable[Any]],
+        call_next: CallNext[Any, Any],
     ) -> Any:
-        """Builds and executes the middleware chain."""
-        chain = call_next
-        for mw in reversed(self.middleware):
-            chain = partial(mw, call_next=chain)
-        return await chain(context)
+        """Executes the middleware chain, compiling it once per method."""
+        middleware = self.middleware
+        if not middleware:
+            return await call_next(context)
+        compiled = self._compiled_middleware
+        if len(compiled) != len(middleware) or any(
+            a is not b for a, b in zip(compiled, middleware, strict=True)
+        ):
+            self._middleware_chains.clear()
+            self._compiled_middleware = tuple(middleware)
+        key = (context.method, context.type)
+        chain = self._middleware_chains.get(key)
+        if chain is None:
+            chain = compile_middleware_chain(
+                middleware, method=context.method, type=context.type
+            )
+            self._middleware_chains[key] = chain
+        return await chain(context, call_next)
 
     def add_middleware(self, middleware: Middleware) -> None:
         self.middleware.append(middleware)
+        self._middleware_chains.clear()
 
     def add_provider(self, provider: Provider, *, namespace: str = "") -> None:
         """Add a provider for dynamic tools, resources, and prompts.
@@ -629,18 +725,23 @@ class FastMCP(
             with server_span("tools/list", "tools/list", self.name, "tool", ""):
                 # Get all tools, apply session transforms, then filter enabled
                 # and model-visible (app-only tools are hidden from the model).
-                tools = list(await super().list_tools())
-                tools = await apply_session_transforms(tools)
-                tools = [t for t in tools if is_enabled(t) and _is_model_visible(t)]
-
-                # Rewrite per-tool Prefab renderer URIs based on the tool's
-                # mount-point address. The walk pairs each tool with the
-                # provider that yielded it, computes the hashed URI, and
-                # produces a model_copy with the URI in place. Original
-                # Tool objects are not mutated.
-                tools = self._rewrite_prefab_uris(tools)
-
-                skip_auth, token = _get_auth_context()
+                generation = self.catalog_generation()
+                rules = await get_current_session_rules()
+                tools = self._catalog_cache.get("tools", generation, rules)
+                if tools is None:
+                    tools = list(await super().list_tools())
+                    tools = await apply_session_transforms(tools, rules=rules)
+                    tools = [t for t in tools if is_enabled(t) and _is_model_visible(t)]
+
+                    # Rewrite per-tool Prefab renderer URIs based on the tool's
+                    # mount-point address. The walk pairs each tool with the
+                    # provider that yielded it, computes the hashed URI, and
+                    # produces a model_copy with the URI in place. Original
+                    # Tool objects are not mutated.
+                    tools = self._rewrite_prefab_uris(tools)
+                    self._catalog_cache.set("tools", generation, rules, tools)
+
+                skip_auth, token = _get_listing_auth_context()
                 authorized: list[Tool] = []
                 for tool in tools:
                     if not skip_auth and tool.auth is not None:
@@ -684,6 +785,33 @@ class FastMCP(
 
         return tool
 
+    async def _resolve_tool(
+        self, name: str, version: VersionSpec | None
+    ) -> Tool | None:
+        """Resolve a tool through providers and transforms, once per request.
+
+        Successful resolutions are cached in request-scoped state, so when a
+        parent server resolves a mounted tool and then delegates the call,
+        the child reuses the route instead of walking its providers again.
+        Session transforms and visibility are still applied by the caller on
+        every lookup. Misses are not cached, so tools added mid-request are
+        still found.
+        """
+        routes = _request_tool_routes()
+        key = _tool_route_key(self, name, version)
+        if routes is not None:
+            cached = routes.get(key)
+            if cached is not None:
+                return cached
+
+        tool = await super().get_tool(name, version)
+        if tool is not None and routes is not None:
+            routes[key] = tool
+            # Delegated calls pin the exact version that was resolved
+            if version is None and tool.version is not None:
+                routes[_tool_route_key(self, name, VersionSpec(eq=tool.version))] = tool
+        return tool
+
     async def get_tool(
         self, name: str, version: VersionSpec | None = None
     ) -> Tool | None:
@@ -703,7 +831,7 @@ class FastMCP(
         Returns:
             The tool if found and enabled, None otherwise.
         """
-        tool = await super().get_tool(name, version)
+        tool = await self._resolve_tool(name, version)
         if tool is None:
             return None
 
@@ -766,20 +894,25 @@ class FastMCP(
                 "resources/list", "resources/list", self.name, "resource", ""
             ):
                 # Get all resources, apply session transforms, then filter enabled
-                resources = list(await super().list_resources())
-                resources = await apply_session_transforms(resources)
-                resources = [r for r in resources if is_enabled(r)]
-
-                # Append synthetic Prefab renderer resources — one per
-                # prefab tool, hashed by mount address. These don't live on
-                # any provider's storage; they're computed on demand.
-                from fastmcp.server.providers.prefab_synthesis import (
-                    synthesize_prefab_resources,
-                )
+                generation = self.catalog_generation()
+                rules = await get_current_session_rules()
+                resources = self._catalog_cache.get("resources", generation, rules)
+                if resources is None:
+                    resources = list(await super().list_resources())
+                    resources = await apply_session_transforms(resources, rules=rules)
+                    resources = [r for r in resources if is_enabled(r)]
+
+                    # Append synthetic Prefab renderer resources — one per
+                    # prefab tool, hashed by mount address. These don't live on
+                    # any provider's storage; they're computed on demand.
+                    from fastmcp.server.providers.prefab_synthesis import (
+                        synthesize_prefab_resources,
+                    )
 
-                resources.extend(await synthesize_prefab_resources(self))
+                    resources.extend(await synthesize_prefab_resources(self))
+                    self._catalog_cache.set("resources", generation, rules, resources)
 
-                skip_auth, token = _get_auth_context()
+                skip_auth, token = _get_listing_auth_context()
                 authorized: list[Resource] = []
                 for resource in resources:
                     if not skip_auth and resource.auth is not None:
@@ -907,11 +1040,16 @@ class FastMCP(
                 "",
             ):
                 # Get all templates, apply session transforms, then filter enabled
-                templates = list(await super().list_resource_templates())
-                templates = await apply_session_transforms(templates)
-                templates = [t for t in templates if is_enabled(t)]
-
-                skip_auth, token = _get_auth_context()
+                generation = self.catalog_generation()
+                rules = await get_current_session_rules()
+                templates = self._catalog_cache.get("templates", generation, rules)
+                if templates is None:
+                    templates = list(await super().list_resource_templates())
+                    templates = await apply_session_transforms(templates, rules=rules)
+                    templates = [t for t in templates if is_enabled(t)]
+                    self._catalog_cache.set("templates", generation, rules, templates)
+
+                skip_auth, token = _get_listing_auth_context()
                 authorized: list[ResourceTemplate] = []
                 for template in templates:
                     if not skip_auth and template.auth is not None:
@@ -1033,11 +1171,16 @@ class FastMCP(
             # Core logic: list prompts
             with server_span("prompts/list", "prompts/list", self.name, "prompt", ""):
                 # Get all prompts, apply session transforms, then filter enabled
-                prompts = list(await super().list_prompts())
-                prompts = await apply_session_transforms(prompts)
-                prompts = [p for p in prompts if is_enabled(p)]
-
-                skip_auth, token = _get_auth_context()
+                generation = self.catalog_generation()
+                rules = await get_current_session_rules()
+                prompts = self._catalog_cache.get("prompts", generation, rules)
+                if prompts is None:
+                    prompts = list(await super().list_prompts())
+                    prompts = await apply_session_transforms(prompts, rules=rules)
+                    prompts = [p for p in prompts if is_enabled(p)]
+                    self._catalog_cache.set("prompts", generation, rules, prompts)
+
+                skip_auth, token = _get_listing_auth_context()
                 authorized: list[Prompt] = []
                 for prompt in prompts:
                     if not skip_auth and prompt.auth is not None:
@@ -1619,6 +1762,10 @@ class FastMCP(
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool = True,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode = "thread",
+        stream: bool | StreamConfig = False,
+        validate_output: bool = True,
     ) -> F: ...
 
     @overload
@@ -1641,6 +1788,10 @@ class FastMCP(
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool = True,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode = "thread",
+        stream: bool | StreamConfig = False,
+        validate_output: bool = True,
     ) -> Callable[[F], F]: ...
 
     def tool(
@@ -1662,6 +1813,10 @@ class FastMCP(
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool = True,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode = "thread",
+        stream: bool | StreamConfig = False,
+        validate_output: bool = True,
     ) -> (
         Callable[[AnyFunction], FunctionTool]
         | FunctionTool
@@ -1690,6 +1845,10 @@ class FastMCP(
             exclude_args: Optional list of argument names to exclude from the tool schema.
                 Deprecated: Use `Depends()` for dependency injection instead.
             meta: Optional meta information about the tool
+            executor: Optional thread pool and concurrency limits for the tool
+            execution_mode: "thread" (default) or "process" for CPU-bound sync tools
+            stream: Send chunks from a generator tool to the client as they are yielded
+            validate_output: Check structured results against the output schema
 
         Examples:
             Register a tool with a custom name:
@@ -1740,6 +1899,10 @@ class FastMCP(
             timeout=timeout,
             auth=auth,
             run_in_thread=run_in_thread,
+            executor=executor,
+            execution_mode=execution_mode,
+            stream=stream,
+            validate_output=validate_output,
         )
 
         return result
@@ -20,7 +20,7 @@ Example:
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Sequence
+from collections.abc import Awaitable, Hashable, Sequence
 from typing import TYPE_CHECKING, Protocol
 
 from fastmcp.utilities.versions import VersionSpec
@@ -85,9 +85,20 @@ class Transform:
         ```
     """
 
+    # Counter bumped whenever this transform's list output can change. None
+    # means the output may depend on request state, so listings that pass
+    # through this transform are never cached. Transforms whose output is a
+    # pure function of their input set this to 0.
+    _catalog_generation: int | None = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
+    @property
+    def catalog_generation(self) -> Hashable | None:
+        """Generation of this transform's list output, or None if uncacheable."""
+        return self._catalog_generation
+
     # -------------------------------------------------------------------------
     # Tools
     # -------------------------------------------------------------------------
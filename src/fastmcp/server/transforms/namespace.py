@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from fastmcp.server.transforms import (
     GetPromptNext,
@@ -13,6 +13,7 @@ from fastmcp.server.transforms import (
     GetToolNext,
     Transform,
 )
+from fastmcp.utilities.components import DerivedComponentCache
 from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
     from fastmcp.resources.template import ResourceTemplate
     from fastmcp.tools.base import Tool
 
+NamedT = TypeVar("NamedT", "Tool", "Prompt")
+
 # Pattern for matching URIs: protocol://path
 _URI_PATTERN = re.compile(r"^([^:]+://)(.*?)$")
 
@@ -41,6 +44,8 @@ class Namespace(Transform):
         ```
     """
 
+    _catalog_generation = 0
+
     def __init__(self, prefix: str) -> None:
         """Initialize Namespace transform.
 
@@ -49,6 +54,8 @@ class Namespace(Transform):
         """
         self._prefix = prefix
         self._name_prefix = f"{prefix}_"
+        # Namespaced copies keyed by source component, reused across listings
+        self._copies = DerivedComponentCache()
 
     def __repr__(self) -> str:
         return f"Namespace({self._prefix!r})"
@@ -90,15 +97,40 @@ class Namespace(Transform):
             return None
         return None
 
+    # -------------------------------------------------------------------------
+    # Cached copies
+    # -------------------------------------------------------------------------
+
+    def _with_name(self, component: NamedT) -> NamedT:
+        """Return the cached copy of a tool or prompt with a namespaced name."""
+        return self._copies.get(
+            component,
+            lambda c: c.model_copy(update={"name": self._transform_name(c.name)}),
+        )
+
+    def _with_uri(self, resource: Resource) -> Resource:
+        """Return the cached copy of a resource with a namespaced URI."""
+        return self._copies.get(
+            resource,
+            lambda r: r.model_copy(update={"uri": self._transform_uri(str(r.uri))}),
+        )
+
+    def _with_uri_template(self, template: ResourceTemplate) -> ResourceTemplate:
+        """Return the cached copy of a template with a namespaced URI template."""
+        return self._copies.get(
+            template,
+            lambda t: t.model_copy(
+                update={"uri_template": self._transform_uri(t.uri_template)}
+            ),
+        )
+
     # -------------------------------------------------------------------------
     # Tools
     # -------------------------------------------------------------------------
 
     async def list_tools(self, tools: Sequence[Tool]) -> Sequence[Tool]:
         """Prefix tool names with namespace."""
-        return [
-            t.model_copy(update={"name": self._transform_name(t.name)}) for t in tools
-        ]
+        return [self._with_name(t) for t in tools]
 
     async def get_tool(
         self, name: str, call_next: GetToolNext, *, version: VersionSpec | None = None
@@ -109,6 +141,8 @@ class Namespace(Transform):
             return None
         tool = await call_next(original, version=version)
         if tool:
+            if tool.name == original:
+                return self._with_name(tool)
             return tool.model_copy(update={"name": name})
         return None
 
@@ -118,10 +152,7 @@ class Namespace(Transform):
 
     async def list_resources(self, resources: Sequence[Resource]) -> Sequence[Resource]:
         """Add namespace path segment to resource URIs."""
-        return [
-            r.model_copy(update={"uri": self._transform_uri(str(r.uri))})
-            for r in resources
-        ]
+        return [self._with_uri(r) for r in resources]
 
     async def get_resource(
         self,
@@ -136,6 +167,8 @@ class Namespace(Transform):
             return None
         resource = await call_next(original, version=version)
         if resource:
+            if str(resource.uri) == original:
+                return self._with_uri(resource)
             return resource.model_copy(update={"uri": uri})
         return None
 
@@ -147,10 +180,7 @@ class Namespace(Transform):
         self, templates: Sequence[ResourceTemplate]
     ) -> Sequence[ResourceTemplate]:
         """Add namespace path segment to template URIs."""
-        return [
-            t.model_copy(update={"uri_template": self._transform_uri(t.uri_template)})
-            for t in templates
-        ]
+        return [self._with_uri_template(t) for t in templates]
 
     async def get_resource_template(
         self,
@@ -165,9 +195,7 @@ class Namespace(Transform):
             return None
         template = await call_next(original, version=version)
         if template:
-            return template.model_copy(
-                update={"uri_template": self._transform_uri(template.uri_template)}
-            )
+            return self._with_uri_template(template)
         return None
 
     # -------------------------------------------------------------------------
@@ -176,9 +204,7 @@ class Namespace(Transform):
 
     async def list_prompts(self, prompts: Sequence[Prompt]) -> Sequence[Prompt]:
         """Prefix prompt names with namespace."""
-        return [
-            p.model_copy(update={"name": self._transform_name(p.name)}) for p in prompts
-        ]
+        return [self._with_name(p) for p in prompts]
 
     async def get_prompt(
         self, name: str, call_next: GetPromptNext, *, version: VersionSpec | None = None
@@ -189,5 +215,7 @@ class Namespace(Transform):
             return None
         prompt = await call_next(original, version=version)
         if prompt:
+            if prompt.name == original:
+                return self._with_name(prompt)
             return prompt.model_copy(update={"name": name})
         return None
@@ -21,7 +21,7 @@ Example:
 from __future__ import annotations
 
 import json
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from typing import TYPE_CHECKING, Annotated, Any
 
 from mcp.types import TextContent
@@ -68,10 +68,27 @@ class PromptsAsTools(Transform):
                 " visibility. Pass your FastMCP server: PromptsAsTools(mcp)"
             )
         self._provider = provider
+        self._resolving_generation = False
 
     def __repr__(self) -> str:
         return f"PromptsAsTools({self._provider!r})"
 
+    @property
+    def catalog_generation(self) -> Hashable | None:
+        """Follow the generation of the wrapped server.
+
+        When this transform is installed on the server it wraps, the server's
+        generation already covers it, so the nested lookup reports 0 instead
+        of recursing.
+        """
+        if self._resolving_generation:
+            return 0
+        self._resolving_generation = True
+        try:
+            return self._provider.catalog_generation()
+        finally:
+            self._resolving_generation = False
+
     async def list_tools(self, tools: Sequence[Tool]) -> Sequence[Tool]:
         """Add prompt tools to the tool list."""
         return [
@@ -22,7 +22,7 @@ from __future__ import annotations
 
 import base64
 import json
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from typing import TYPE_CHECKING, Annotated, Any
 
 from mcp.types import ToolAnnotations
@@ -71,10 +71,27 @@ class ResourcesAsTools(Transform):
                 " visibility. Pass your FastMCP server: ResourcesAsTools(mcp)"
             )
         self._provider = provider
+        self._resolving_generation = False
 
     def __repr__(self) -> str:
         return f"ResourcesAsTools({self._provider!r})"
 
+    @property
+    def catalog_generation(self) -> Hashable | None:
+        """Follow the generation of the wrapped server.
+
+        When this transform is installed on the server it wraps, the server's
+        generation already covers it, so the nested lookup reports 0 instead
+        of recursing.
+        """
+        if self._resolving_generation:
+            return 0
+        self._resolving_generation = True
+        try:
+            return self._provider.catalog_generation()
+        finally:
+            self._resolving_generation = False
+
     async def list_tools(self, tools: Sequence[Tool]) -> Sequence[Tool]:
         """Add resource tools to the tool list."""
         return [
@@ -30,6 +30,8 @@ class ToolTransform(Transform):
         ```
     """
 
+    _catalog_generation = 0
+
     def __init__(self, transforms: dict[str, ToolTransformConfig]) -> None:
         """Initialize ToolTransform.
 
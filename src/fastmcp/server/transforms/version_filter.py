@@ -47,6 +47,8 @@ class VersionFilter(Transform):
             should pass through the filter. Defaults to True.
     """
 
+    _catalog_generation = 0
+
     def __init__(
         self,
         *,
@@ -7,6 +7,8 @@ Final filtering happens at the Provider level.
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
@@ -21,6 +23,7 @@ from fastmcp.server.transforms import (
     GetToolNext,
     Transform,
 )
+from fastmcp.utilities.components import DerivedComponentCache
 from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
@@ -57,6 +60,8 @@ class Visibility(Transform):
         ```
     """
 
+    _catalog_generation = 0
+
     def __init__(
         self,
         enabled: bool,
@@ -88,6 +93,7 @@ class Visibility(Transform):
         self.tags = tags  # e.g., {"internal", "deprecated"}
         self.components = components  # e.g., {"tool", "prompt"}
         self.match_all = match_all
+        self._marked = DerivedComponentCache()
 
     def __repr__(self) -> str:
         action = "enable" if self._enabled else "disable"
@@ -174,11 +180,15 @@ class Visibility(Transform):
         """Set visibility state in component metadata if rule matches.
 
         Returns a copy of the component with updated metadata to avoid
-        mutating shared objects cached in providers.
+        mutating shared objects cached in providers. Copies are cached per
+        source component, so repeated listings reuse the same copy.
         """
         if not self._matches(component):
             return component
+        return self._marked.get(component, self._build_marked)
 
+    def _build_marked(self, component: T) -> T:
+        """Build a copy of the component carrying this rule's visibility mark."""
         if component.meta is None:
             new_meta = {_FASTMCP_KEY: {_INTERNAL_KEY: {"visibility": self._enabled}}}
         else:
@@ -297,9 +307,77 @@ if TYPE_CHECKING:
     from fastmcp.server.context import Context
 
 
+class SessionVisibilityCache:
+    """In-process cache of each session's visibility rules and transforms.
+
+    Session rules live in the server's state store, which may be remote.
+    Reading them on every list/get/call would cost a store round trip per
+    request, so rules are cached here per session along with their compiled
+    Visibility transforms. `save_visibility_rules` writes through, so changes
+    made via `Context.enable_components` and friends are seen immediately.
+
+    Entries expire after `ttl` seconds and the least recently used sessions
+    are dropped beyond `max_sessions`, after which rules are re-read from the
+    store. Rules written to the store by another process are only picked up
+    once the local entry expires, so `ttl` is kept short (see the
+    `session_visibility_cache_ttl` setting).
+    """
+
+    def __init__(self, max_sessions: int = 10_000, ttl: float = 5) -> None:
+        self._max_sessions = max_sessions
+        self._ttl = ttl
+        self._entries: OrderedDict[
+            str, tuple[list[dict[str, Any]], list[Visibility], float]
+        ] = OrderedDict()
+
+    def get(
+        self, session_id: str
+    ) -> tuple[list[dict[str, Any]], list[Visibility]] | None:
+        """Return cached (rules, transforms) for a session, or None on a miss."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry[2] < time.monotonic():
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return entry[0], entry[1]
+
+    def set(self, session_id: str, rules: list[dict[str, Any]]) -> list[Visibility]:
+        """Cache a session's rules and return their compiled transforms."""
+        transforms = create_visibility_transforms(rules)
+        self._entries[session_id] = (rules, transforms, time.monotonic() + self._ttl)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_sessions:
+            self._entries.popitem(last=False)
+        return transforms
+
+    def clear(self) -> None:
+        """Drop all cached sessions."""
+        self._entries.clear()
+
+
+async def _load_session_visibility(
+    context: Context,
+) -> tuple[list[dict[str, Any]], list[Visibility]]:
+    """Load a session's rules and transforms, reading the store only on a miss."""
+    cache = context.fastmcp._session_visibility
+    session_id = context.session_id
+    cached = cache.get(session_id)
+    if cached is not None:
+        return cached
+    rules = await context.get_state("_visibility_rules") or []
+    return rules, cache.set(session_id, rules)
+
+
 async def get_visibility_rules(context: Context) -> list[dict[str, Any]]:
-    """Load visibility rule dicts from session state."""
-    return await context.get_state("_visibility_rules") or []
+    """Load visibility rule dicts from session state.
+
+    The returned list is shared with the session cache; callers must not
+    mutate it.
+    """
+    rules, _ = await _load_session_visibility(context)
+    return rules
 
 
 async def save_visibility_rules(
@@ -318,6 +396,7 @@ async def save_visibility_rules(
             If provided, only sends notifications for specified types.
     """
     await context.set_state("_visibility_rules", rules)
+    context.fastmcp._session_visibility.set(context.session_id, rules)
 
     # Send notifications based on components hint
     # Note: MCP has no separate template notification - templates use ResourceListChangedNotification
@@ -365,8 +444,8 @@ async def get_session_transforms(context: Context) -> list[Visibility]:
     except RuntimeError:
         return []
 
-    rules = await get_visibility_rules(context)
-    return create_visibility_transforms(rules)
+    _, transforms = await _load_session_visibility(context)
+    return transforms
 
 
 async def enable_components(
@@ -419,8 +498,7 @@ async def enable_components(
     }
 
     # Add and save (notifications sent by save_visibility_rules)
-    rules.append(rule)
-    await save_visibility_rules(context, rules, components=components)
+    await save_visibility_rules(context, [*rules, rule], components=components)
 
 
 async def disable_components(
@@ -473,8 +551,7 @@ async def disable_components(
     }
 
     # Add and save (notifications sent by save_visibility_rules)
-    rules.append(rule)
-    await save_visibility_rules(context, rules, components=components)
+    await save_visibility_rules(context, [*rules, rule], components=components)
 
 
 async def reset_visibility(context: Context) -> None:
@@ -494,8 +571,43 @@ async def reset_visibility(context: Context) -> None:
 ComponentT = TypeVar("ComponentT", bound="FastMCPComponent")
 
 
+async def get_current_session_rules() -> list[dict[str, Any]]:
+    """Load visibility rule dicts for the current request's session.
+
+    Returns an empty list when there is no active context or session.
+    """
+    from fastmcp.server.context import _current_context
+
+    current_ctx = _current_context.get()
+    if current_ctx is None:
+        return []
+    try:
+        _ = current_ctx.session_id
+    except RuntimeError:
+        return []
+    return await get_visibility_rules(current_ctx)
+
+
+def _transforms_for_rules(
+    context: Context | None, rules: list[dict[str, Any]]
+) -> list[Visibility]:
+    """Get transforms for rules, reusing the session's compiled ones if current."""
+    if not rules:
+        return []
+    if context is not None:
+        try:
+            cached = context.fastmcp._session_visibility.get(context.session_id)
+        except RuntimeError:
+            cached = None
+        if cached is not None and cached[0] is rules:
+            return cached[1]
+    return create_visibility_transforms(rules)
+
+
 async def apply_session_transforms(
     components: Sequence[ComponentT],
+    *,
+    rules: list[dict[str, Any]] | None = None,
 ) -> Sequence[ComponentT]:
     """Apply session-specific visibility transforms to components.
 
@@ -505,6 +617,8 @@ async def apply_session_transforms(
 
     Args:
         components: The components to apply session transforms to.
+        rules: Session rules already loaded by the caller. If None, they're
+            loaded from the current session's state.
 
     Returns:
         The components with session transforms applied.
@@ -512,10 +626,12 @@ async def apply_session_transforms(
     from fastmcp.server.context import _current_context
 
     current_ctx = _current_context.get()
-    if current_ctx is None:
-        return components
-
-    session_transforms = await get_session_transforms(current_ctx)
+    if rules is not None:
+        session_transforms = _transforms_for_rules(current_ctx, rules)
+    else:
+        if current_ctx is None:
+            return components
+        session_transforms = await get_session_transforms(current_ctx)
     if not session_transforms:
         return components
 
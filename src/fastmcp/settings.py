@@ -310,6 +310,22 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    session_visibility_cache_ttl: Annotated[
+        float,
+        Field(
+            description=inspect.cleandoc(
+                """
+                How long, in seconds, a server reuses a session's visibility
+                rules before re-reading them from the state store. Changes
+                made through the session's own Context apply immediately;
+                this bounds how long rules written by another process (for
+                example another worker sharing a remote state store) can be
+                missed.
+                """
+            ),
+        ),
+    ] = 5
+
     server_dependencies: list[str] = Field(
         default_factory=list,
         description="List of dependencies to install in the server environment",
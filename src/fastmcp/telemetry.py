@@ -26,6 +26,8 @@ from typing import Any
 from opentelemetry import context as otel_context
 from opentelemetry import propagate, trace
 from opentelemetry.context import Context
+from opentelemetry.metrics import Meter
+from opentelemetry.metrics import get_meter as otel_get_meter
 from opentelemetry.trace import Span, Status, StatusCode, Tracer
 from opentelemetry.trace import get_tracer as otel_get_tracer
 
@@ -47,6 +49,18 @@ def get_tracer(version: str | None = None) -> Tracer:
     return otel_get_tracer(INSTRUMENTATION_NAME, version)
 
 
+def get_meter(version: str | None = None) -> Meter:
+    """Get the FastMCP meter for recording metrics.
+
+    Args:
+        version: Optional version string for the instrumentation
+
+    Returns:
+        A meter instance. Returns a no-op meter if no SDK is configured.
+    """
+    return otel_get_meter(INSTRUMENTATION_NAME, version or "")
+
+
 def inject_trace_context(
     meta: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
@@ -116,6 +130,7 @@ __all__ = [
     "TRACE_PARENT_KEY",
     "TRACE_STATE_KEY",
     "extract_trace_context",
+    "get_meter",
     "get_tracer",
     "inject_trace_context",
     "record_span_error",
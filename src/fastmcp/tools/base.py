@@ -23,7 +23,7 @@ from mcp.types import (
     ToolExecution,
 )
 from mcp.types import Tool as MCPTool
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from pydantic.json_schema import SkipJsonSchema
 
 from fastmcp.exceptions import FastMCPDeprecationWarning
@@ -51,7 +51,9 @@ if TYPE_CHECKING:
     from docket import Docket
     from docket.execution import Execution
 
-    from fastmcp.tools.function_tool import FunctionTool
+    from fastmcp.tools.executors import ExecutorPolicy
+    from fastmcp.tools.function_tool import FunctionTool, ToolExecutionMode
+    from fastmcp.tools.streaming import StreamConfig
     from fastmcp.tools.tool_transform import ArgTransform, TransformedTool
 
 # Re-export from function_tool module
@@ -61,6 +63,11 @@ logger = get_logger(__name__)
 
 ToolResultSerializerType: TypeAlias = Callable[[Any], str]
 
+# Client capability extension: clients that list this in
+# ``capabilities.extensions`` read ``structuredContent`` and do not need the
+# JSON text block that mirrors it.
+STRUCTURED_CONTENT_ONLY_EXTENSION_ID = "fastmcp/structured-content-only"
+
 
 def default_serializer(data: Any) -> str:
     return pydantic_core.to_json(data, fallback=str).decode()
@@ -77,6 +84,10 @@ class ToolResult(BaseModel):
         default=None, description="Runtime metadata about the tool execution"
     )
 
+    # True when the only content block is the JSON text of structured_content,
+    # so it can be dropped for clients that read structured content directly.
+    _text_mirrors_structured: bool = PrivateAttr(default=False)
+
     def __init__(
         self,
         content: list[ContentBlock] | Any | None = None,
@@ -121,20 +132,49 @@ class ToolResult(BaseModel):
             content=converted_content, structured_content=structured_content, meta=meta
         )
 
+    @classmethod
+    def _from_structured(
+        cls,
+        text: str,
+        structured_content: dict[str, Any] | None,
+        meta: dict[str, Any] | None = None,
+    ) -> ToolResult:
+        """Build a result from already-serialized output, skipping normalization.
+
+        `text` must be the JSON serialization of the value behind
+        `structured_content`, which must already be JSON-compatible.
+        """
+        result = cls.model_construct(
+            content=[TextContent(type="text", text=text)],
+            structured_content=structured_content,
+            meta=meta,
+        )
+        result._text_mirrors_structured = structured_content is not None
+        return result
+
     def to_mcp_result(
-        self,
+        self, *, structured_only: bool = False
     ) -> (
         list[ContentBlock] | tuple[list[ContentBlock], dict[str, Any]] | CallToolResult
     ):
+        """Convert to the MCP SDK result shape.
+
+        Args:
+            structured_only: Omit the text block when it only mirrors
+                `structured_content`.
+        """
+        content = self.content
+        if structured_only and self._text_mirrors_structured:
+            content = []
         if self.meta is not None:
             return CallToolResult(
                 structuredContent=self.structured_content,
-                content=self.content,
+                content=content,
                 _meta=self.meta,  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field  # ty:ignore[unknown-argument]
             )
         if self.structured_content is None:
-            return self.content
-        return self.content, self.structured_content
+            return content
+        return content, self.structured_content
 
 
 class Tool(FastMCPComponent):
@@ -172,6 +212,16 @@ class Tool(FastMCPComponent):
             description="Execution timeout in seconds. If None, no timeout is applied."
         ),
     ] = None
+    validate_output: Annotated[
+        bool,
+        Field(
+            exclude=True,
+            description=(
+                "Whether the server checks structured results against "
+                "output_schema before returning them."
+            ),
+        ),
+    ] = True
 
     @model_validator(mode="after")
     def _validate_tool_name(self) -> Tool:
@@ -183,36 +233,43 @@ class Tool(FastMCPComponent):
         self,
         **overrides: Any,
     ) -> MCPTool:
-        """Convert the FastMCP tool to an MCP tool."""
-        title = None
-
-        if self.title:
-            title = self.title
-        elif self.annotations and self.annotations.title:
-            title = self.annotations.title
-
-        mcp_tool = MCPTool(
-            name=overrides.get("name", self.name),
-            title=overrides.get("title", title),
-            description=overrides.get("description", self.description),
-            inputSchema=overrides.get("inputSchema", self.parameters),
-            outputSchema=overrides.get("outputSchema", self.output_schema),
-            icons=overrides.get("icons", self.icons),
-            annotations=overrides.get("annotations", self.annotations),
-            execution=overrides.get("execution", self.execution),
-            _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
-                "_meta", self.get_meta()
-            ),  # ty:ignore[unknown-argument]
-        )
+        """Convert the FastMCP tool to an MCP tool.
 
-        if (
-            self.task_config.supports_tasks()
-            and "execution" not in overrides
-            and not self.execution
-        ):
-            mcp_tool.execution = ToolExecution(taskSupport=self.task_config.mode)
+        Calls without overrides are memoized on the component.
+        """
 
-        return mcp_tool
+        def build() -> MCPTool:
+            title = None
+
+            if self.title:
+                title = self.title
+            elif self.annotations and self.annotations.title:
+                title = self.annotations.title
+
+            mcp_tool = MCPTool(
+                name=overrides.get("name", self.name),
+                title=overrides.get("title", title),
+                description=overrides.get("description", self.description),
+                inputSchema=overrides.get("inputSchema", self.parameters),
+                outputSchema=overrides.get("outputSchema", self.output_schema),
+                icons=overrides.get("icons", self.icons),
+                annotations=overrides.get("annotations", self.annotations),
+                execution=overrides.get("execution", self.execution),
+                _meta=overrides.get(  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
+                    "_meta", self.get_meta()
+                ),  # ty:ignore[unknown-argument]
+            )
+
+            if (
+                self.task_config.supports_tasks()
+                and "execution" not in overrides
+                and not self.execution
+            ):
+                mcp_tool.execution = ToolExecution(taskSupport=self.task_config.mode)
+
+            return mcp_tool
+
+        return self._memoized_wire(overrides, build)
 
     @classmethod
     def from_function(
@@ -234,6 +291,10 @@ class Tool(FastMCPComponent):
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool | None = None,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode | None = None,
+        stream: bool | StreamConfig | None = None,
+        validate_output: bool | None = None,
     ) -> FunctionTool:
         """Create a Tool from a function."""
         from fastmcp.tools.function_tool import FunctionTool
@@ -255,6 +316,10 @@ class Tool(FastMCPComponent):
             timeout=timeout,
             auth=auth,
             run_in_thread=run_in_thread,
+            executor=executor,
+            execution_mode=execution_mode,
+            stream=stream,
+            validate_output=validate_output,
         )
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
@@ -290,6 +355,11 @@ class Tool(FastMCPComponent):
                     fastmcp_app_name=_get_fastmcp_app_name(self),
                 )
 
+        if self.serializer is None and _is_plain_value(raw_value):
+            result = self._convert_plain_result(raw_value)
+            if result is not None:
+                return result
+
         content = _convert_to_content(raw_value, serializer=self.serializer)
 
         # Bytes can't be represented as structured JSON content
@@ -326,6 +396,35 @@ class Tool(FastMCPComponent):
             meta={"fastmcp": {"wrap_result": True}} if wrap_result else None,
         )
 
+    def _convert_plain_result(self, raw_value: Any) -> ToolResult | None:
+        """Serialize a plain value once and derive both result forms from it.
+
+        The JSON bytes become the text block as-is and are parsed back for
+        structured content, instead of walking the value once per form.
+        Returns None if the value is not JSON-serializable without fallbacks.
+        """
+        try:
+            data = pydantic_core.to_json(raw_value)
+        except (pydantic_core.PydanticSerializationError, UnicodeDecodeError):
+            return None
+        text = data.decode()
+
+        if self.output_schema is None:
+            # No schema - only use structured_content for JSON objects
+            if not data.startswith(b"{"):
+                return ToolResult._from_structured(text, None)
+            return ToolResult._from_structured(text, pydantic_core.from_json(data))
+
+        structured = pydantic_core.from_json(data)
+        if self.output_schema.get("x-fastmcp-wrap-result"):
+            return ToolResult._from_structured(
+                text, {"result": structured}, meta={"fastmcp": {"wrap_result": True}}
+            )
+        if not isinstance(structured, dict):
+            # Let the general path report the schema mismatch
+            return None
+        return ToolResult._from_structured(text, structured)
+
     @overload
     async def _run(
         self,
@@ -555,6 +654,23 @@ def _prefab_to_tool_result(app: Any, fastmcp_app_name: str | None = None) -> Too
     )
 
 
+def _is_plain_value(value: Any) -> bool:
+    """Whether a tool return value converts to a single JSON text block.
+
+    Strings, bytes, None and anything containing content blocks or media
+    helpers have their own content conversion rules.
+    """
+    if value is None or isinstance(
+        value, str | bytes | ContentBlock | Image | Audio | File
+    ):
+        return False
+    if isinstance(value, list | tuple):
+        return not any(
+            isinstance(item, ContentBlock | Image | Audio | File) for item in value
+        )
+    return True
+
+
 def _convert_to_content(
     result: Any,
     serializer: ToolResultSerializerType | None = None,
@@ -0,0 +1,391 @@
+"""Bounded executors for tool calls.
+
+By default every sync tool is dispatched through anyio's global worker-thread
+limiter, so one slow, blocking tool can starve all the others. An
+`ExecutorPolicy` isolates a tool: sync functions can run on a named
+`ThreadPool` with its own size and queue bound, and the tool itself can cap
+how many of its calls run at once. Calls beyond a queue bound fail fast with
+`ExecutorSaturatedError` instead of waiting indefinitely.
+
+Example:
+    ```python
+    from fastmcp import FastMCP
+    from fastmcp.tools.executors import ExecutorPolicy, configure_thread_pool
+
+    configure_thread_pool("db", max_workers=4, max_queue=16)
+
+    mcp = FastMCP()
+
+    @mcp.tool(executor=ExecutorPolicy(pool="db", max_concurrency=2))
+    def slow_query(sql: str) -> list[dict]: ...
+    ```
+
+CPU-bound functions that hold the GIL gain nothing from threads. Tools
+registered with `execution_mode="process"` run on a shared `ProcessPool`
+instead; size it with `configure_process_pool`.
+
+Pool activity is recorded through the OpenTelemetry metrics API as
+`fastmcp.executor.active`, `fastmcp.executor.queued` and
+`fastmcp.executor.rejected`, labelled with `fastmcp.executor.name`. A point
+in time view is available from `ThreadPool.stats()`.
+"""
+
+from __future__ import annotations
+
+import functools
+import multiprocessing.context
+import os
+import sys
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+import anyio.to_thread
+
+from fastmcp.exceptions import ExecutorSaturatedError, ToolError
+from fastmcp.telemetry import get_meter
+
+_meter = get_meter()
+_active_counter = _meter.create_up_down_counter(
+    "fastmcp.executor.active",
+    description="Calls currently holding an executor slot",
+)
+_queued_counter = _meter.create_up_down_counter(
+    "fastmcp.executor.queued",
+    description="Calls waiting for an executor slot",
+)
+_rejected_counter = _meter.create_counter(
+    "fastmcp.executor.rejected",
+    description="Calls rejected because the executor queue was full",
+)
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Point-in-time snapshot of an executor's load."""
+
+    name: str
+    capacity: int
+    max_queue: int | None
+    active: int
+    waiting: int
+    rejected: int
+
+    @property
+    def saturated(self) -> bool:
+        """True when every slot is in use."""
+        return self.active >= self.capacity
+
+
+class BoundedLimiter:
+    """Admit at most `capacity` concurrent holders and `max_queue` waiters.
+
+    Waiters are served in arrival order; a released slot is handed directly
+    to the next waiter. With `max_queue=None` the queue is unbounded.
+    """
+
+    def __init__(self, name: str, capacity: int, max_queue: int | None = None):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError(f"max_queue must be non-negative, got {max_queue}")
+        self.name = name
+        self.capacity = capacity
+        self.max_queue = max_queue
+        self._active = 0
+        self._rejected = 0
+        self._waiters: deque[anyio.Event] = deque()
+        self._attributes = {"fastmcp.executor.name": name}
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block.
+
+        Raises:
+            ExecutorSaturatedError: If all slots are busy and the queue is full.
+        """
+        if self._active < self.capacity:
+            self._active += 1
+        else:
+            if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+                self._rejected += 1
+                _rejected_counter.add(1, self._attributes)
+                raise ExecutorSaturatedError(
+                    f"Executor {self.name!r} is saturated "
+                    f"({self.capacity} running, {len(self._waiters)} queued)"
+                )
+            event = anyio.Event()
+            self._waiters.append(event)
+            _queued_counter.add(1, self._attributes)
+            try:
+                await event.wait()
+            except BaseException:
+                if event.is_set():
+                    # The slot was handed over just as we were cancelled.
+                    self._release()
+                else:
+                    self._waiters.remove(event)
+                raise
+            finally:
+                _queued_counter.add(-1, self._attributes)
+
+        _active_counter.add(1, self._attributes)
+        try:
+            yield
+        finally:
+            _active_counter.add(-1, self._attributes)
+            self._release()
+
+    def _release(self) -> None:
+        if self._waiters:
+            self._waiters.popleft().set()
+        else:
+            self._active -= 1
+
+    def stats(self) -> ExecutorStats:
+        return ExecutorStats(
+            name=self.name,
+            capacity=self.capacity,
+            max_queue=self.max_queue,
+            active=self._active,
+            waiting=len(self._waiters),
+            rejected=self._rejected,
+        )
+
+
+class ThreadPool:
+    """A named, bounded set of worker threads for sync tool functions.
+
+    Calls beyond `max_workers` wait in a queue of at most `max_queue` entries;
+    further calls are rejected. Worker threads come from anyio's thread cache,
+    but the pool has its own capacity, independent of anyio's global limiter
+    and of every other pool.
+    """
+
+    def __init__(self, name: str, *, max_workers: int, max_queue: int | None = None):
+        self.name = name
+        self._admission = BoundedLimiter(f"pool:{name}", max_workers, max_queue)
+        self._thread_limiter: anyio.CapacityLimiter | None = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._admission.capacity
+
+    @property
+    def max_queue(self) -> int | None:
+        return self._admission.max_queue
+
+    async def run_sync(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a sync function on one of this pool's worker threads."""
+        async with self._admission.slot():
+            if self._thread_limiter is None:
+                self._thread_limiter = anyio.CapacityLimiter(self.max_workers)
+            return await anyio.to_thread.run_sync(
+                functools.partial(fn, *args, **kwargs),
+                limiter=self._thread_limiter,
+            )
+
+    def stats(self) -> ExecutorStats:
+        return self._admission.stats()
+
+    def __repr__(self) -> str:
+        return (
+            f"ThreadPool(name={self.name!r}, max_workers={self.max_workers}, "
+            f"max_queue={self.max_queue})"
+        )
+
+
+def _noop() -> None:
+    pass
+
+
+def _default_process_workers() -> int:
+    # Matches ProcessPoolExecutor's own default
+    cpu_count = getattr(os, "process_cpu_count", os.cpu_count)
+    workers = cpu_count() or 1
+    if sys.platform == "win32":
+        workers = min(workers, 61)
+    return workers
+
+
+class ProcessPool:
+    """Worker processes for CPU-bound sync tool functions.
+
+    The underlying `ProcessPoolExecutor` is created on first use (or by
+    `start()`) and recreated if a worker process dies. Functions, arguments
+    and results cross the process boundary, so all of them must be picklable.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ):
+        self.max_workers = (
+            max_workers if max_workers is not None else _default_process_workers()
+        )
+        self.mp_context = mp_context
+        self._executor: ProcessPoolExecutor | None = None
+        # Created lazily because CapacityLimiter needs a running event loop
+        self._submit_limiter: anyio.CapacityLimiter | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=self.mp_context
+            )
+        return self._executor
+
+    def start(self) -> None:
+        """Spawn the worker processes now instead of on the first call."""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_noop)
+
+    async def run(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Run a sync function in a worker process and return its result.
+
+        Calls beyond `max_workers` wait here rather than in the executor's
+        queue, so each submitted call holds one thread waiting on its result.
+        Cancelling the caller cancels the call if it has not started yet.
+        """
+        if self._submit_limiter is None:
+            self._submit_limiter = anyio.CapacityLimiter(self.max_workers)
+        async with self._submit_limiter:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(fn, *args, **kwargs)
+                try:
+                    return await anyio.to_thread.run_sync(
+                        future.result, abandon_on_cancel=True
+                    )
+                except anyio.get_cancelled_exc_class():
+                    future.cancel()
+                    raise
+            except BrokenProcessPool:
+                if self._executor is executor:
+                    self._executor = None
+                executor.shutdown(wait=False)
+                name = getattr(fn, "__name__", repr(fn))
+                raise ToolError(
+                    f"Worker process running {name!r} terminated abruptly"
+                ) from None
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the worker processes. The pool restarts on next use."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __repr__(self) -> str:
+        return f"ProcessPool(max_workers={self.max_workers})"
+
+
+_process_pool = ProcessPool()
+
+
+def configure_process_pool(
+    *,
+    max_workers: int | None = None,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+) -> ProcessPool:
+    """Replace the process pool used by `execution_mode="process"` tools.
+
+    The previous pool is shut down once its in-flight calls complete.
+    """
+    global _process_pool
+    previous = _process_pool
+    _process_pool = ProcessPool(max_workers=max_workers, mp_context=mp_context)
+    previous.shutdown(wait=False)
+    return _process_pool
+
+
+def get_process_pool() -> ProcessPool:
+    """Return the process pool used by `execution_mode="process"` tools."""
+    return _process_pool
+
+
+@dataclass(frozen=True, kw_only=True)
+class ExecutorPolicy:
+    """How a tool's calls are admitted and where its sync function runs.
+
+    Args:
+        pool: Thread pool for sync functions, by name (see
+            `configure_thread_pool`) or as a `ThreadPool`. Ignored for async
+            functions. Defaults to anyio's shared worker threads.
+        max_concurrency: Maximum number of calls to this tool running at once.
+            Applies to sync and async functions alike.
+        max_queue: Maximum number of calls waiting for a `max_concurrency`
+            slot. Further calls fail with `ExecutorSaturatedError`. Unbounded
+            if not set.
+    """
+
+    pool: str | ThreadPool | None = None
+    max_concurrency: int | None = None
+    max_queue: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {self.max_concurrency}"
+            )
+        if self.max_queue is not None:
+            if self.max_concurrency is None:
+                raise ValueError("max_queue requires max_concurrency")
+            if self.max_queue < 0:
+                raise ValueError(
+                    f"max_queue must be non-negative, got {self.max_queue}"
+                )
+
+    def resolve_pool(self) -> ThreadPool | None:
+        """Return the configured thread pool, looking up names in the registry."""
+        if isinstance(self.pool, str):
+            return get_thread_pool(self.pool)
+        return self.pool
+
+
+_thread_pools: dict[str, ThreadPool] = {}
+
+
+def configure_thread_pool(
+    name: str, *, max_workers: int, max_queue: int | None = None
+) -> ThreadPool:
+    """Create or replace the named thread pool.
+
+    Calls already running on a replaced pool finish there; new calls use the
+    new pool.
+    """
+    pool = ThreadPool(name, max_workers=max_workers, max_queue=max_queue)
+    _thread_pools[name] = pool
+    return pool
+
+
+def get_thread_pool(name: str) -> ThreadPool:
+    """Look up a thread pool created with `configure_thread_pool`."""
+    try:
+        return _thread_pools[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown thread pool {name!r}. Create it with configure_thread_pool()."
+        ) from None
+
+
+__all__ = [
+    "BoundedLimiter",
+    "ExecutorPolicy",
+    "ExecutorStats",
+    "ProcessPool",
+    "ThreadPool",
+    "configure_process_pool",
+    "configure_thread_pool",
+    "get_process_pool",
+    "get_thread_pool",
+]
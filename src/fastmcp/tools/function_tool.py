@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import inspect
+import pickle
 import warnings
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -13,6 +15,7 @@ from typing import (
     Literal,
     Protocol,
     TypeVar,
+    get_type_hints,
     overload,
     runtime_checkable,
 )
@@ -20,7 +23,7 @@ from typing import (
 import anyio
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, Icon, ToolAnnotations
-from pydantic import Field
+from pydantic import ConfigDict, Field, PrivateAttr
 from pydantic.json_schema import SkipJsonSchema
 
 import fastmcp
@@ -33,8 +36,15 @@ from fastmcp.tools.base import (
     Tool,
     ToolResult,
     ToolResultSerializerType,
+    default_serializer,
 )
+from fastmcp.tools.executors import BoundedLimiter, ExecutorPolicy, get_process_pool
 from fastmcp.tools.function_parsing import ParsedFunction, _is_object_schema
+from fastmcp.tools.streaming import (
+    STREAM_SUMMARY_SCHEMA,
+    StreamConfig,
+    stream_generator,
+)
 from fastmcp.utilities.async_utils import (
     call_sync_fn_in_threadpool,
     is_coroutine_function,
@@ -54,6 +64,8 @@ if TYPE_CHECKING:
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+ToolExecutionMode = Literal["thread", "process"]
+
 
 @runtime_checkable
 class DecoratedTool(Protocol):
@@ -86,9 +98,72 @@ class ToolMeta:
     auth: AuthCheck | list[AuthCheck] | None = None
     enabled: bool = True
     run_in_thread: bool = True
+    executor: ExecutorPolicy | None = None
+    execution_mode: ToolExecutionMode = "thread"
+    stream: bool | StreamConfig = False
+    validate_output: bool = True
+
+
+@lru_cache(maxsize=5000)
+def _argument_collector(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Build a function with `fn`'s signature that returns its validated args.
+
+    Validating through this stand-in lets arguments be coerced in the server
+    process and shipped to a worker process, where `fn` itself is called.
+    """
+
+    def collect(*args: Any, **kwargs: Any) -> tuple[tuple[Any, ...], dict]:
+        return args, kwargs
+
+    try:
+        hints = get_type_hints(fn, include_extras=True)
+    except Exception:
+        hints = getattr(fn, "__annotations__", {})
+
+    collect.__signature__ = inspect.signature(fn).replace(  # type: ignore[attr-defined]  # ty:ignore[unresolved-attribute]
+        return_annotation=inspect.Signature.empty
+    )
+    collect.__annotations__ = {k: v for k, v in hints.items() if k != "return"}
+    collect.__name__ = getattr(fn, "__name__", "collect")
+    return collect
+
+
+def _validate_process_execution(
+    fn: Callable[..., Any], func_name: str, metadata: ToolMeta
+) -> None:
+    """Reject tool configurations that cannot run in a worker process."""
+    problem = None
+    if is_coroutine_function(fn) or inspect.isasyncgenfunction(fn):
+        problem = "async functions already run on the event loop"
+    elif inspect.isgeneratorfunction(fn):
+        problem = "generator functions cannot be sent between processes"
+    elif without_injected_parameters(fn) is not fn:
+        problem = (
+            "Context and Depends() parameters are resolved in the server "
+            "process and cannot be injected into a worker process"
+        )
+    elif not metadata.run_in_thread:
+        problem = "run_in_thread=False runs the function inline"
+    elif metadata.executor is not None and metadata.executor.pool is not None:
+        problem = "executor thread pools do not apply to process execution"
+    else:
+        try:
+            pickle.dumps(fn)
+        except Exception:
+            problem = (
+                "the function cannot be pickled; define it at module level "
+                "so worker processes can import it"
+            )
+    if problem is not None:
+        raise ValueError(
+            f"Tool {func_name!r}: execution_mode='process' is not supported: {problem}"
+        )
 
 
 class FunctionTool(Tool):
+    # ExecutorPolicy can hold a ThreadPool, which pydantic has no schema for
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     fn: SkipJsonSchema[Callable[..., Any]]
     return_type: Annotated[SkipJsonSchema[Any], Field(exclude=True)] = None
     run_in_thread: Annotated[
@@ -106,6 +181,50 @@ class FunctionTool(Tool):
             )
         ),
     ] = True
+    executor: Annotated[
+        SkipJsonSchema[ExecutorPolicy | None],
+        Field(
+            exclude=True,
+            description=(
+                "Thread pool and concurrency limits for this tool's calls. "
+                "Calls beyond the queue bound fail with ExecutorSaturatedError."
+            ),
+        ),
+    ] = None
+    execution_mode: Annotated[
+        SkipJsonSchema[ToolExecutionMode],
+        Field(
+            exclude=True,
+            description=(
+                'Where sync functions run. "thread" (default) uses a worker '
+                'thread; "process" sends validated arguments to a worker '
+                "process, for CPU-bound functions that hold the GIL."
+            ),
+        ),
+    ] = "thread"
+    stream: Annotated[
+        SkipJsonSchema[StreamConfig | None],
+        Field(
+            exclude=True,
+            description=(
+                "Deliver chunks yielded by a generator tool to the client as "
+                "they are produced, through a bounded buffer."
+            ),
+        ),
+    ] = None
+
+    # Shared by copies of this tool (e.g. namespaced views), so the
+    # concurrency limit applies to the underlying function, not each copy.
+    _concurrency: BoundedLimiter | None = PrivateAttr(default=None)
+
+    def model_post_init(self, context: Any, /) -> None:
+        super().model_post_init(context)
+        if self.executor is not None and self.executor.max_concurrency is not None:
+            self._concurrency = BoundedLimiter(
+                f"tool:{self.name}",
+                self.executor.max_concurrency,
+                self.executor.max_queue,
+            )
 
     @classmethod
     def from_function(
@@ -129,6 +248,10 @@ class FunctionTool(Tool):
         timeout: float | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
         run_in_thread: bool | None = None,
+        executor: ExecutorPolicy | None = None,
+        execution_mode: ToolExecutionMode | None = None,
+        stream: bool | StreamConfig | None = None,
+        validate_output: bool | None = None,
     ) -> FunctionTool:
         """Create a FunctionTool from a function.
 
@@ -157,6 +280,10 @@ class FunctionTool(Tool):
                     timeout,
                     auth,
                     run_in_thread,
+                    executor,
+                    execution_mode,
+                    stream,
+                    validate_output,
                 ]
             )
             or output_schema is not NotSet
@@ -187,6 +314,10 @@ class FunctionTool(Tool):
                 timeout=timeout,
                 auth=auth,
                 run_in_thread=True if run_in_thread is None else run_in_thread,
+                executor=executor,
+                execution_mode=execution_mode or "thread",
+                stream=stream or False,
+                validate_output=True if validate_output is None else validate_output,
             )
 
         if metadata.serializer is not None and fastmcp.settings.deprecation_warnings:
@@ -231,6 +362,17 @@ class FunctionTool(Tool):
                 "Either drop the timeout or remove run_in_thread=False and "
                 "accept worker-thread dispatch."
             )
+        if (
+            metadata.executor is not None
+            and metadata.executor.pool is not None
+            and not metadata.run_in_thread
+        ):
+            raise ValueError(
+                f"Tool {func_name!r}: an executor pool cannot be used with "
+                "run_in_thread=False. Inline calls never reach the pool."
+            )
+        if metadata.execution_mode == "process":
+            _validate_process_execution(parsed_fn.fn, func_name, metadata)
 
         # Normalize task to TaskConfig
         task_value = metadata.task
@@ -242,9 +384,15 @@ class FunctionTool(Tool):
             task_config = task_value
         task_config.validate_function(fn, func_name)
 
+        stream_config = (
+            StreamConfig() if metadata.stream is True else metadata.stream or None
+        )
+
         # Handle output_schema
         if isinstance(metadata.output_schema, NotSetT):
             final_output_schema = parsed_fn.output_schema
+            if stream_config is not None and stream_config.result == "summary":
+                final_output_schema = STREAM_SUMMARY_SCHEMA
         else:
             final_output_schema = metadata.output_schema
 
@@ -275,15 +423,40 @@ class FunctionTool(Tool):
             timeout=metadata.timeout,
             auth=metadata.auth,
             run_in_thread=metadata.run_in_thread,
+            executor=metadata.executor,
+            execution_mode=metadata.execution_mode,
+            stream=stream_config,
+            validate_output=metadata.validate_output,
         )
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Run the tool with arguments."""
+        if self._concurrency is None:
+            return await self._run_fn(arguments)
+        async with self._concurrency.slot():
+            return await self._run_fn(arguments)
+
+    async def _run_fn(self, arguments: dict[str, Any]) -> ToolResult:
+        thread_pool = self.executor.resolve_pool() if self.executor else None
         wrapper_fn = without_injected_parameters(
-            self.fn, run_in_thread=self.run_in_thread
+            self.fn, run_in_thread=self.run_in_thread, thread_pool=thread_pool
         )
         type_adapter = get_cached_typeadapter(wrapper_fn)
 
+        async def call_sync() -> Any:
+            if self.execution_mode == "process":
+                args, kwargs = get_cached_typeadapter(
+                    _argument_collector(self.fn)
+                ).validate_python(arguments)
+                return await get_process_pool().run(self.fn, *args, **kwargs)
+            if thread_pool is not None:
+                return await thread_pool.run_sync(
+                    type_adapter.validate_python, arguments
+                )
+            return await call_sync_fn_in_threadpool(
+                type_adapter.validate_python, arguments
+            )
+
         # Apply timeout if configured. Combining timeout with
         # run_in_thread=False on a sync function is rejected at
         # registration (see FunctionTool.from_function), so the timeout
@@ -296,15 +469,13 @@ class FunctionTool(Tool):
                         result = await type_adapter.validate_python(arguments)
                     else:
                         # Sync function: run in threadpool to avoid blocking
-                        result = await call_sync_fn_in_threadpool(
-                            type_adapter.validate_python, arguments
-                        )
+                        result = await call_sync()
                         # Handle sync wrappers that return awaitables
                         if inspect.isawaitable(result):
                             result = await result
                     # Materialize generators inside timeout scope so slow
                     # generators don't run past the configured timeout
-                    result = await self._materialize_generator(result)
+                    result = await self._consume_generator(result)
             except TimeoutError:
                 logger.warning(
                     f"Tool '{self.name}' timed out after {self.timeout}s. "
@@ -322,19 +493,30 @@ class FunctionTool(Tool):
             if is_coroutine_function(wrapper_fn):
                 result = await type_adapter.validate_python(arguments)
             elif self.run_in_thread:
-                result = await call_sync_fn_in_threadpool(
-                    type_adapter.validate_python, arguments
-                )
+                result = await call_sync()
                 if inspect.isawaitable(result):
                     result = await result
             else:
                 result = type_adapter.validate_python(arguments)
                 if inspect.isawaitable(result):
                     result = await result
-            result = await self._materialize_generator(result)
+            result = await self._consume_generator(result)
 
         return self.convert_result(result)
 
+    async def _consume_generator(self, result: Any) -> Any:
+        """Stream or materialize a generator result; pass other values through."""
+        if self.stream is not None and (
+            inspect.isgenerator(result) or inspect.isasyncgen(result)
+        ):
+            return await stream_generator(
+                result,
+                self.stream,
+                serialize=self.serializer or default_serializer,
+                run_in_thread=self.run_in_thread,
+            )
+        return await self._materialize_generator(result)
+
     @staticmethod
     async def _materialize_generator(result: Any) -> Any:
         """Consume generators/async generators into lists.
@@ -406,6 +588,10 @@ def tool(
     timeout: float | None = None,
     auth: AuthCheck | list[AuthCheck] | None = None,
     run_in_thread: bool = True,
+    executor: ExecutorPolicy | None = None,
+    execution_mode: ToolExecutionMode = "thread",
+    stream: bool | StreamConfig = False,
+    validate_output: bool = True,
 ) -> Callable[[F], F]: ...
 @overload
 def tool(
@@ -426,6 +612,10 @@ def tool(
     timeout: float | None = None,
     auth: AuthCheck | list[AuthCheck] | None = None,
     run_in_thread: bool = True,
+    executor: ExecutorPolicy | None = None,
+    execution_mode: ToolExecutionMode = "thread",
+    stream: bool | StreamConfig = False,
+    validate_output: bool = True,
 ) -> Callable[[F], F]: ...
 
 
@@ -447,6 +637,10 @@ def tool(
     timeout: float | None = None,
     auth: AuthCheck | list[AuthCheck] | None = None,
     run_in_thread: bool = True,
+    executor: ExecutorPolicy | None = None,
+    execution_mode: ToolExecutionMode = "thread",
+    stream: bool | StreamConfig = False,
+    validate_output: bool = True,
 ) -> Any:
     """Standalone decorator to mark a function as an MCP tool.
 
@@ -462,6 +656,17 @@ def tool(
             some GPU/driver bindings). Ignored for async functions. Cannot be
             combined with `timeout` on a sync function: inline calls have no
             cancellation checkpoints, so the timeout would be a silent no-op.
+        executor: Optional `ExecutorPolicy` giving the tool its own thread pool
+            and/or a cap on concurrent calls, with a bounded wait queue.
+        execution_mode: "thread" (default) or "process". Process execution runs a
+            module-level sync function in a worker process, for CPU-bound work
+            that holds the GIL. Functions taking Context or Depends() are
+            rejected.
+        stream: For generator tools, send each yielded chunk to the client
+            as it is produced. Pass a `StreamConfig` to set the buffer size or
+            return only a summary instead of every chunk.
+        validate_output: When False, structured results are returned without
+            being checked against the output schema.
     """
     if isinstance(annotations, dict):
         annotations = ToolAnnotations(**annotations)
@@ -490,6 +695,10 @@ def tool(
             timeout=timeout,
             auth=auth,
             run_in_thread=run_in_thread,
+            executor=executor,
+            execution_mode=execution_mode,
+            stream=stream,
+            validate_output=validate_output,
         )
         return FunctionTool.from_function(fn, metadata=tool_meta)
 
@@ -510,6 +719,10 @@ def tool(
             timeout=timeout,
             auth=auth,
             run_in_thread=run_in_thread,
+            executor=executor,
+            execution_mode=execution_mode,
+            stream=stream,
+            validate_output=validate_output,
         )
         target = fn.__func__ if hasattr(fn, "__func__") else fn
         target.__fastmcp__ = metadata
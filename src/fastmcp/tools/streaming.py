@@ -0,0 +1,168 @@
+"""Progressive delivery of generator tool output.
+
+A tool registered with `stream=True` (or a `StreamConfig`) sends each chunk
+its generator yields to the client as soon as it is produced, instead of
+draining the generator into a list first. Chunks are delivered as progress
+notifications when the request carries a progress token, as progress updates
+on the task for background (task-mode) calls, and as log notifications on the
+`fastmcp.stream` logger otherwise.
+
+Example:
+    ```python
+    from collections.abc import Iterator
+
+    from fastmcp import FastMCP
+    from fastmcp.tools.streaming import StreamConfig
+
+    mcp = FastMCP()
+
+    @mcp.tool(stream=StreamConfig(result="summary"))
+    def export_rows(table: str) -> Iterator[dict]:
+        for row in read_table(table):
+            yield row
+    ```
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import AsyncGenerator, Callable, Generator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import anyio
+
+from fastmcp.utilities.async_utils import call_sync_fn_in_threadpool
+
+if TYPE_CHECKING:
+    from fastmcp.server.context import Context
+
+STREAM_LOGGER_NAME = "fastmcp.stream"
+
+STREAM_SUMMARY_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"chunks": {"type": "integer"}},
+    "required": ["chunks"],
+}
+
+_EXHAUSTED = object()
+
+
+@dataclass(frozen=True, kw_only=True)
+class StreamConfig:
+    """How a generator tool's chunks are delivered.
+
+    Args:
+        buffer_size: Chunks the generator may run ahead of delivery before it
+            is paused.
+        result: "all" returns every chunk in the final result, as for
+            non-streaming tools. "summary" returns only the number of chunks,
+            so memory use does not grow with the output.
+    """
+
+    buffer_size: int = 16
+    result: Literal["all", "summary"] = "all"
+
+    def __post_init__(self) -> None:
+        if self.buffer_size < 0:
+            raise ValueError(
+                f"buffer_size must be non-negative, got {self.buffer_size}"
+            )
+
+
+async def stream_generator(
+    result: Generator[Any, Any, Any] | AsyncGenerator[Any, Any],
+    config: StreamConfig,
+    *,
+    serialize: Callable[[Any], str],
+    run_in_thread: bool = True,
+) -> list[Any] | dict[str, int]:
+    """Deliver each chunk of a generator to the client as it is produced.
+
+    The generator runs in a producer task that is paused whenever
+    `config.buffer_size` chunks are waiting to be sent. Sync generators are
+    advanced on a worker thread unless `run_in_thread` is False.
+
+    Args:
+        result: The generator returned by the tool function.
+        config: Buffering and result aggregation settings.
+        serialize: Converts a non-string chunk to notification text.
+        run_in_thread: Whether to advance sync generators on a worker thread.
+
+    Returns:
+        The list of chunks, or `{"chunks": n}` when `config.result` is
+        "summary".
+    """
+    from fastmcp.server.context import _current_context
+
+    ctx = _current_context.get()
+    send, receive = anyio.create_memory_object_stream[Any](config.buffer_size)
+
+    # Failures are re-raised after the task group exits so callers see the
+    # original exception rather than an exception group.
+    failures: list[Exception] = []
+
+    async def produce() -> None:
+        async with send:
+            try:
+                if inspect.isasyncgen(result):
+                    try:
+                        async for item in result:
+                            await send.send(item)
+                    finally:
+                        await result.aclose()
+                    return
+                generator = cast(Generator[Any, Any, Any], result)
+                try:
+                    while True:
+                        if run_in_thread:
+                            item = await call_sync_fn_in_threadpool(
+                                next, generator, _EXHAUSTED
+                            )
+                        else:
+                            item = next(generator, _EXHAUSTED)
+                        if item is _EXHAUSTED:
+                            return
+                        await send.send(item)
+                finally:
+                    generator.close()
+            except Exception as exc:
+                failures.append(exc)
+
+    collected: list[Any] | None = [] if config.result == "all" else None
+    count = 0
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(produce)
+        try:
+            async with receive:
+                async for item in receive:
+                    count += 1
+                    if ctx is not None:
+                        text = item if isinstance(item, str) else serialize(item)
+                        await _deliver_chunk(ctx, count, text)
+                    if collected is not None:
+                        collected.append(item)
+        except Exception as exc:
+            failures.append(exc)
+            tg.cancel_scope.cancel()
+    if failures:
+        raise failures[0]
+
+    if collected is None:
+        return {"chunks": count}
+    return collected
+
+
+async def _deliver_chunk(ctx: Context, index: int, text: str) -> None:
+    request_context = ctx.request_context
+    if request_context is None:
+        # Background task: progress messages are visible through tasks/get
+        await ctx.report_progress(index, message=text)
+        return
+    meta = request_context.meta
+    if meta is not None and meta.progressToken is not None:
+        await ctx.report_progress(index, message=text)
+        return
+    await ctx.log(
+        text, level="info", logger_name=STREAM_LOGGER_NAME, extra={"chunk": index}
+    )
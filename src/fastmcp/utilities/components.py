@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import weakref
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, TypedDict, cast
 
 from mcp.types import Icon
-from pydantic import BeforeValidator, Field
+from pydantic import BeforeValidator, Field, PrivateAttr
 from typing_extensions import Self, TypeVar
 
 from fastmcp.server.tasks.config import TaskConfig
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
     from docket.execution import Execution
 
 T = TypeVar("T", default=Any)
+WireT = TypeVar("WireT")
+ComponentT = TypeVar("ComponentT", bound="FastMCPComponent")
 
 
 class FastMCPMeta(TypedDict, total=False):
@@ -121,6 +124,44 @@ class FastMCPComponent(FastMCPBaseModel):
         Field(description="Background task execution configuration (SEP-1686)."),
     ] = Field(default_factory=lambda: TaskConfig(mode="forbidden"))
 
+    # Memoized SDK representation from `to_mcp_*()` without overrides. Reset
+    # whenever an attribute is reassigned or the component is copied.
+    _mcp_wire: Any = PrivateAttr(default=None)
+    # Bumped whenever an attribute is reassigned, so caches of copies derived
+    # from this component (see DerivedComponentCache) can tell it changed.
+    _revision: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        private = self.__pydantic_private__
+        if name not in ("_mcp_wire", "_revision") and private is not None:
+            private["_mcp_wire"] = None
+            private["_revision"] = private.get("_revision", 0) + 1
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._mcp_wire = None
+        return copied
+
+    def _memoized_wire(
+        self, overrides: dict[str, Any], build: Callable[[], WireT]
+    ) -> WireT:
+        """Return the cached SDK representation, building it on first use.
+
+        Only override-free conversions are cached. Components are treated as
+        immutable once listed: reassigning a field invalidates the cache, but
+        in-place mutation of nested values (e.g. `meta`) does not.
+        """
+        if overrides:
+            return build()
+        wire = self._mcp_wire
+        if wire is None:
+            wire = build()
+            self._mcp_wire = wire
+        return wire
+
     @classmethod
     def make_key(cls, identifier: str) -> str:
         """Construct the lookup key for this component type.
@@ -260,3 +301,55 @@ class FastMCPComponent(FastMCPBaseModel):
         Subclasses should call super() and merge their specific attributes.
         """
         return {"fastmcp.component.key": self.key}
+
+
+class DerivedComponentCache:
+    """Cache of components derived from source components, keyed by identity.
+
+    Transforms and middleware that rewrite every component on every listing
+    (renaming, marking visibility, dereferencing schemas) use this to hand
+    back the same derived copy for the same source object, so repeated
+    listings allocate nothing per component.
+
+    Entries are held only as long as the source component is alive, so the
+    cache grows and shrinks with the catalog. Each entry records the source's
+    revision, which `FastMCPComponent.__setattr__` bumps on every attribute
+    assignment, so reassigning any field on the source rebuilds the copy.
+    In-place mutation of nested values (e.g. `meta`) is not detected.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[
+            int, tuple[weakref.ref[FastMCPComponent], int, FastMCPComponent]
+        ] = {}
+
+    def get(
+        self,
+        source: ComponentT,
+        build: Callable[[ComponentT], ComponentT],
+    ) -> ComponentT:
+        """Return the cached copy of `source`, building it on a miss."""
+        key = id(source)
+        revision = source._revision
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is source and entry[1] == revision:
+            return cast(ComponentT, entry[2])
+        derived = build(source)
+        self._entries[key] = (weakref.ref(source, self._evict(key)), revision, derived)
+        return derived
+
+    def clear(self) -> None:
+        """Drop all cached copies."""
+        self._entries.clear()
+
+    def _evict(self, key: int) -> Callable[[weakref.ref[FastMCPComponent]], None]:
+        cache_ref = weakref.ref(self)
+
+        def callback(ref: weakref.ref[FastMCPComponent]) -> None:
+            cache = cache_ref()
+            if cache is not None:
+                entry = cache._entries.get(key)
+                if entry is not None and entry[0] is ref:
+                    del cache._entries[key]
+
+        return callback
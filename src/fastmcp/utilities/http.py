@@ -1,4 +1,36 @@
+"""HTTP helpers, including the connection pool shared by FastMCP's HTTP clients.
+
+`StreamableHttpTransport`, `SSETransport` and `HttpResource` create a new
+`httpx.AsyncClient` for every session or read. By default those clients send
+their requests through one keep-alive connection pool per event loop, so
+short-lived sessions to the same origin reuse sockets instead of repeating
+TCP and TLS setup. Headers, auth and timeouts stay on each client and are
+applied per request. When proxies are configured through the environment
+(`HTTP_PROXY`, `HTTPS_PROXY`, `ALL_PROXY`), clients skip the shared pool so
+httpx routes them, honouring `NO_PROXY`, as it would by default.
+
+Example:
+    ```python
+    from fastmcp.utilities.http import configure_http_pool
+
+    configure_http_pool(max_connections=200, keepalive_expiry=30.0)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
 import socket
+import urllib.request
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+# Matches the MCP SDK's defaults for streamable HTTP clients
+DEFAULT_HTTP_TIMEOUT = httpx.Timeout(30.0, read=300.0)
 
 
 def find_available_port() -> int:
@@ -6,3 +38,180 @@ def find_available_port() -> int:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(("127.0.0.1", 0))
         return s.getsockname()[1]
+
+
+@dataclass(frozen=True, kw_only=True)
+class HTTPPoolConfig:
+    """Limits for the shared HTTP connection pool.
+
+    Args:
+        max_connections: Maximum open connections across all origins.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept before closing.
+        http2: Negotiate HTTP/2 where the server supports it. Requires the
+            `h2` package (`pip install httpx[http2]`).
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+
+    def __post_init__(self) -> None:
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 requires the 'h2' package. "
+                "Install it with: pip install httpx[http2]"
+            )
+
+
+class _Pool:
+    """A pooled transport plus the number of clients still using it."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self.transport = transport
+        self.clients = 0
+        self.retired = False
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Sends requests through a shared pool; closing a client leaves it open.
+
+    A pool replaced by `configure_http_pool` is closed once the last client
+    using it closes.
+    """
+
+    def __init__(self, pool: _Pool):
+        self._pool = pool
+        self._closed = False
+        pool.clients += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await _close_retired_pools()
+        return await self._pool.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._pool.clients -= 1
+        if self._pool.retired and self._pool.clients == 0:
+            await self._pool.transport.aclose()
+
+
+_pool_config = HTTPPoolConfig()
+# Pooled connections belong to the event loop that opened them
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Pool] = (
+    weakref.WeakKeyDictionary()
+)
+# Replaced pools that no client uses any more, closed on their loop's next request
+_retired_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list[_Pool]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _close_retired_pools() -> None:
+    for pool in _retired_pools.pop(asyncio.get_running_loop(), []):
+        await pool.transport.aclose()
+
+
+def configure_http_pool(
+    *,
+    max_connections: int | None = 100,
+    max_keepalive_connections: int | None = 20,
+    keepalive_expiry: float | None = 5.0,
+    http2: bool = False,
+) -> HTTPPoolConfig:
+    """Set the limits of the shared HTTP connection pool.
+
+    Clients created afterwards use a new pool with these limits; clients that
+    are already open keep their current pool until they are closed, after
+    which the old pool is closed too.
+    """
+    global _pool_config
+    _pool_config = HTTPPoolConfig(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
+    )
+    for loop, pool in list(_pools.items()):
+        pool.retired = True
+        if pool.clients == 0:
+            _retired_pools.setdefault(loop, []).append(pool)
+    _pools.clear()
+    return _pool_config
+
+
+def get_http_pool_config() -> HTTPPoolConfig:
+    """Return the limits of the shared HTTP connection pool."""
+    return _pool_config
+
+
+def get_shared_http_transport() -> httpx.AsyncBaseTransport:
+    """Return an httpx transport backed by the current event loop's shared pool.
+
+    The returned transport is safe to hand to a short-lived `httpx.AsyncClient`:
+    closing the client does not close the pooled connections.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        config = _pool_config
+        pool = _Pool(
+            httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_keepalive_connections,
+                    keepalive_expiry=config.keepalive_expiry,
+                ),
+                http2=config.http2,
+            )
+        )
+        _pools[loop] = pool
+    return _SharedTransport(pool)
+
+
+async def close_http_pool() -> None:
+    """Close the current event loop's pooled connections.
+
+    The pool is recreated on next use.
+    """
+    await _close_retired_pools()
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.transport.aclose()
+
+
+def _env_proxies_configured() -> bool:
+    """Whether the environment routes HTTP traffic through a proxy."""
+    return any(
+        scheme in ("http", "https", "all") for scheme in urllib.request.getproxies()
+    )
+
+
+def create_pooled_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """Create an httpx client that sends requests through the shared pool.
+
+    Accepts the same arguments as the MCP SDK's `create_mcp_http_client`, so
+    it can be used wherever an `McpHttpClientFactory` is expected. If the
+    environment configures a proxy (and `trust_env` is not disabled), the
+    client uses httpx's own proxy-aware transports instead of the pool.
+    """
+    kwargs.setdefault("follow_redirects", True)
+    if kwargs.get("trust_env", True) and _env_proxies_configured():
+        transport = None
+    else:
+        transport = get_shared_http_transport()
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout if timeout is not None else DEFAULT_HTTP_TIMEOUT,
+        auth=auth,
+        transport=transport,
+        **kwargs,
+    )
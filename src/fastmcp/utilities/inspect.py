@@ -115,7 +115,7 @@ async def inspect_fastmcp_v2(mcp: FastMCP[Any]) -> FastMCPInfo:
     # Extract detailed tool information
     tool_infos = []
     for tool in tools_list:
-        mcp_tool = tool.to_mcp_tool(name=tool.name)
+        mcp_tool = tool.to_mcp_tool()
         tool_infos.append(
             ToolInfo(
                 key=tool.key,
@@ -5,9 +5,11 @@ from __future__ import annotations
 import base64
 import binascii
 import json
-from collections.abc import Sequence
+import secrets
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import Any, TypeVar
 
 T = TypeVar("T")
 
@@ -16,15 +18,20 @@ T = TypeVar("T")
 class CursorState:
     """Internal representation of pagination cursor state.
 
-    The cursor encodes the offset into the result set. This is opaque to clients
+    The cursor encodes the offset into the result set and, optionally, the id
+    of the listing snapshot the offset refers to. This is opaque to clients
     per the MCP spec - they should not parse or modify cursors.
     """
 
     offset: int
+    snapshot: str | None = None
 
     def encode(self) -> str:
         """Encode cursor state to an opaque string."""
-        data = json.dumps({"o": self.offset})
+        payload: dict[str, Any] = {"o": self.offset}
+        if self.snapshot is not None:
+            payload["s"] = self.snapshot
+        data = json.dumps(payload)
         return base64.urlsafe_b64encode(data.encode()).decode()
 
     @classmethod
@@ -36,8 +43,15 @@ class CursorState:
         """
         try:
             data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
-            return cls(offset=data["o"])
+            offset = data["o"]
+            snapshot = data.get("s")
+            if not isinstance(offset, int) or offset < 0:
+                raise ValueError("offset must be a non-negative integer")
+            if snapshot is not None and not isinstance(snapshot, str):
+                raise ValueError("snapshot must be a string")
+            return cls(offset=offset, snapshot=snapshot)
         except (
+            AttributeError,
             json.JSONDecodeError,
             KeyError,
             ValueError,
@@ -78,3 +92,45 @@ def paginate_sequence(
         next_cursor = CursorState(offset=end).encode()
 
     return page, next_cursor
+
+
+class ListingSnapshots:
+    """Bounded LRU of listing orders that paginated cursors point into.
+
+    The first page of a paginated listing stores the keys of the full
+    listing here and embeds the snapshot id in its cursor. Later pages still
+    list through the server (so middleware and auth see every request) but
+    slice the stored keys, which keeps pages consistent with each other and
+    limits conversion to the items on the page. Each snapshot belongs to the
+    owner (session and token) that created it; cursors whose snapshot has
+    been evicted or belongs to another owner fall back to a fresh listing at
+    the same offset.
+    """
+
+    def __init__(self, max_snapshots: int = 64) -> None:
+        self._max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, tuple[str, Hashable, Sequence[Any]]] = (
+            OrderedDict()
+        )
+
+    def get(
+        self, kind: str, snapshot_id: str, owner: Hashable = None
+    ) -> Sequence[Any] | None:
+        """Return the stored keys, or None if unknown or not this kind and owner."""
+        entry = self._snapshots.get(snapshot_id)
+        if entry is None or entry[0] != kind or entry[1] != owner:
+            return None
+        self._snapshots.move_to_end(snapshot_id)
+        return entry[2]
+
+    def add(self, kind: str, keys: Sequence[Any], owner: Hashable = None) -> str:
+        """Store a listing's keys for an owner and return the snapshot id."""
+        snapshot_id = secrets.token_urlsafe(12)
+        self._snapshots[snapshot_id] = (kind, owner, keys)
+        while len(self._snapshots) > self._max_snapshots:
+            self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def clear(self) -> None:
+        """Drop all stored listings."""
+        self._snapshots.clear()
@@ -0,0 +1,119 @@
+"""Tests for the client-side catalog cache enabled with `cache_catalog=True`."""
+
+import mcp.types
+import pytest
+
+from fastmcp import Client, FastMCP
+from fastmcp.server.context import Context
+from fastmcp.server.middleware import Middleware
+
+
+class CountListRequests(Middleware):
+    def __init__(self):
+        self.tools = 0
+        self.prompts = 0
+
+    async def on_list_tools(self, context, call_next):
+        self.tools += 1
+        return await call_next(context)
+
+    async def on_list_prompts(self, context, call_next):
+        self.prompts += 1
+        return await call_next(context)
+
+
+@pytest.fixture
+def counter() -> CountListRequests:
+    return CountListRequests()
+
+
+@pytest.fixture
+def server(counter: CountListRequests) -> FastMCP:
+    server = FastMCP("CatalogServer", middleware=[counter])
+
+    @server.tool
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @server.tool
+    async def add_tool(ctx: Context) -> str:
+        def added() -> str:
+            return "new"
+
+        server.tool(added)
+        await ctx.send_notification(mcp.types.ToolListChangedNotification())
+        return "ok"
+
+    @server.prompt
+    def welcome() -> str:
+        return "Welcome!"
+
+    return server
+
+
+class TestClientCatalog:
+    async def test_lists_are_cached(self, server, counter):
+        async with Client(server, cache_catalog=True) as client:
+            first = await client.list_tools()
+            second = await client.list_tools()
+            await client.list_prompts()
+            await client.list_prompts()
+
+        assert [t.name for t in first] == [t.name for t in second]
+        assert counter.tools == 1
+        assert counter.prompts == 1
+
+    async def test_not_cached_by_default(self, server, counter):
+        async with Client(server) as client:
+            await client.list_tools()
+            await client.list_tools()
+
+        assert counter.tools == 2
+
+    async def test_list_changed_invalidates(self, server, counter):
+        async with Client(server, cache_catalog=True) as client:
+            await client.list_tools()
+            await client.list_prompts()
+            await client.call_tool("add_tool", {})
+
+            tools = await client.list_tools()
+            await client.list_prompts()
+
+        assert "added" in [t.name for t in tools]
+        assert counter.tools == 2
+        assert counter.prompts == 1
+
+    async def test_get_tool_uses_cache(self, server, counter):
+        async with Client(server, cache_catalog=True) as client:
+            tool = await client.get_tool("add")
+            assert tool is not None
+            assert tool.name == "add"
+            assert await client.get_tool("missing") is None
+
+        assert counter.tools == 1
+
+    async def test_call_results_parsed_from_cached_schemas(self, server, counter):
+        async with Client(server, cache_catalog=True) as client:
+            for i in range(3):
+                result = await client.call_tool("add", {"a": i, "b": 1})
+                assert result.data == i + 1
+
+        assert counter.tools == 1
+
+    async def test_shared_with_new_copies(self, server, counter):
+        client = Client(server, cache_catalog=True)
+        async with client:
+            await client.list_tools()
+            async with client.new() as copy:
+                await copy.list_tools()
+
+        assert counter.tools == 1
+
+    async def test_cleared_when_reconnecting(self, server, counter):
+        client = Client(server, cache_catalog=True)
+        async with client:
+            await client.list_tools()
+        async with client:
+            await client.list_tools()
+
+        assert counter.tools == 2
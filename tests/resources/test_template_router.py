@@ -0,0 +1,87 @@
+import pytest
+
+from fastmcp.resources import ResourceTemplate
+from fastmcp.resources.template_router import TemplateRouter
+from fastmcp.server.providers.local_provider import LocalProvider
+
+
+def make_template(uri_template: str) -> ResourceTemplate:
+    return ResourceTemplate(uri_template=uri_template, name=uri_template, parameters={})
+
+
+class TestTemplateRouter:
+    @pytest.mark.parametrize(
+        "uri_template, uri",
+        [
+            ("weather://{city}/current", "weather://london/current"),
+            ("data://items/{id}", "data://items/42"),
+            ("files://{path*}", "files://a/b/c.txt"),
+            ("repo://{owner}/{repo}/blob/{path*}", "repo://me/proj/blob/src/x.py"),
+            ("file://{name}.txt", "file://notes.txt"),
+            ("search://{query}{?limit}", "search://cats?limit=5"),
+        ],
+    )
+    def test_routes_to_matching_template(self, uri_template: str, uri: str):
+        template = make_template(uri_template)
+        router = TemplateRouter([make_template("other://{x}"), template])
+        assert router.match(uri) == [template]
+
+    def test_agrees_with_linear_scan(self):
+        templates = [
+            make_template(t)
+            for t in [
+                "data://{id}",
+                "data://items/{id}",
+                "data://items/{id}/meta",
+                "data://{path*}",
+                "data://items/special",
+                "other://{a}/{b}",
+                "bad://{1x}",
+            ]
+        ]
+        router = TemplateRouter(templates)
+        for uri in [
+            "data://x",
+            "data://items/1",
+            "data://items/1/meta",
+            "data://items/special",
+            "data://a/b/c/d",
+            "other://1/2",
+            "other://1",
+            "data://",
+            "bad://value",
+        ]:
+            expected = [t for t in templates if t.matches(uri) is not None]
+            assert router.match(uri) == expected, uri
+
+    def test_candidates_prune_unrelated_templates(self):
+        templates = [make_template(f"svc{i}://{{id}}") for i in range(100)]
+        router = TemplateRouter(templates)
+        assert router.candidates("svc7://abc") == [templates[7]]
+
+    def test_invalid_templates_are_skipped(self):
+        router = TemplateRouter([make_template("bad://{1x}")])
+        assert len(router) == 0
+
+
+class TestLocalProviderTemplateRouting:
+    async def test_router_invalidated_on_add_and_remove(self):
+        provider = LocalProvider()
+
+        @provider.resource("data://{id}")
+        def item(id: str) -> str:
+            return id
+
+        assert await provider._get_resource_template("data://1") is not None
+        assert await provider._get_resource_template("users://1/profile") is None
+
+        @provider.resource("users://{id}/profile")
+        def profile(id: str) -> str:
+            return id
+
+        template = await provider._get_resource_template("users://1/profile")
+        assert template is not None
+        assert template.uri_template == "users://{id}/profile"
+
+        provider.remove_template("users://{id}/profile")
+        assert await provider._get_resource_template("users://1/profile") is None
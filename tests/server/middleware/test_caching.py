@@ -2,10 +2,12 @@
 
 import sys
 import tempfile
+import time
 import warnings
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import mcp.types
 import pytest
 from inline_snapshot import snapshot
@@ -27,6 +29,7 @@ from pydantic import AnyUrl, BaseModel
 from fastmcp import Context, FastMCP
 from fastmcp.client.client import CallToolResult, Client
 from fastmcp.client.transports import FastMCPTransport
+from fastmcp.exceptions import ToolError
 from fastmcp.prompts.base import Message, Prompt
 from fastmcp.prompts.function_prompt import FunctionPrompt
 from fastmcp.resources.base import Resource
@@ -34,8 +37,13 @@ from fastmcp.server.middleware.caching import (
     ANONYMOUS_AUTH_KEY,
     CachableToolResult,
     CallToolSettings,
+    LocalCacheCollectionStatistics,
+    LocalCacheSettings,
+    ReadResourceSettings,
     ResponseCachingMiddleware,
     ResponseCachingStatistics,
+    _InvalidationIndex,
+    _LocalCache,
     _make_call_tool_cache_key,
     _make_get_prompt_cache_key,
     _make_read_resource_cache_key,
@@ -503,8 +511,7 @@ class TestResponseCachingMiddlewareIntegration:
             assert statistics == snapshot(
                 ResponseCachingStatistics(
                     list_tools=KVStoreCollectionStatistics(
-                        get=GetStatistics(count=2, hit=1, miss=1),
-                        put=PutStatistics(count=1),
+                        get=GetStatistics(count=1, miss=1), put=PutStatistics(count=1)
                     ),
                     call_tool=KVStoreCollectionStatistics(
                         get=GetStatistics(count=1, miss=1), put=PutStatistics(count=1)
@@ -518,8 +525,7 @@ class TestResponseCachingMiddlewareIntegration:
             assert statistics == snapshot(
                 ResponseCachingStatistics(
                     list_tools=KVStoreCollectionStatistics(
-                        get=GetStatistics(count=2, hit=1, miss=1),
-                        put=PutStatistics(count=1),
+                        get=GetStatistics(count=1, miss=1), put=PutStatistics(count=1)
                     ),
                     call_tool=KVStoreCollectionStatistics(
                         get=GetStatistics(count=2, hit=1, miss=1),
@@ -839,3 +845,363 @@ class TestAuthAwareCaching:
             assert {p.name for p in prompts} == {"public_prompt"}
         finally:
             auth_context_var.reset(tok)
+
+
+class TestRequestCoalescing:
+    async def test_single_flight_runs_concurrent_misses_once(self):
+        mcp_server = FastMCP("test")
+        mcp_server.add_middleware(
+            ResponseCachingMiddleware(
+                call_tool_settings=CallToolSettings(single_flight=True)
+            )
+        )
+        calls = 0
+        release = anyio.Event()
+
+        @mcp_server.tool
+        async def expensive() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        results: list[CallToolResult] = []
+
+        async with Client(mcp_server) as client:
+
+            async def call() -> None:
+                results.append(await client.call_tool("expensive"))
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(20):
+                    tg.start_soon(call)
+                await anyio.wait_all_tasks_blocked()
+                release.set()
+
+        assert calls == 1
+        assert [r.structured_content for r in results] == [{"result": 42}] * 20
+
+    async def test_single_flight_propagates_errors_to_waiters(self):
+        mcp_server = FastMCP("test")
+        mcp_server.add_middleware(
+            ResponseCachingMiddleware(
+                call_tool_settings=CallToolSettings(single_flight=True)
+            )
+        )
+        release = anyio.Event()
+
+        @mcp_server.tool
+        async def broken() -> int:
+            await release.wait()
+            raise ValueError("boom")
+
+        errors: list[Exception] = []
+
+        async with Client(mcp_server) as client:
+
+            async def call() -> None:
+                try:
+                    await client.call_tool("broken")
+                except ToolError as e:
+                    errors.append(e)
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(call)
+                await anyio.wait_all_tasks_blocked()
+                release.set()
+
+        assert len(errors) == 3
+        assert all("boom" in str(e) for e in errors)
+
+    async def test_stale_entry_served_during_background_refresh(self):
+        middleware = ResponseCachingMiddleware(
+            read_resource_settings=ReadResourceSettings(
+                ttl=60, stale_while_revalidate=60
+            )
+        )
+        mcp_server = FastMCP("test")
+        mcp_server.add_middleware(middleware)
+        version = 0
+
+        @mcp_server.resource("data://value")
+        def value() -> str:
+            return f"v{version}"
+
+        async with Client(mcp_server) as client:
+            first = await client.read_resource("data://value")
+            assert isinstance(first[0], TextResourceContents)
+            assert first[0].text == "v0"
+
+            version = 1
+            with patch(
+                "fastmcp.server.middleware.caching.time.time",
+                return_value=time.time() + 120,
+            ):
+                stale = await client.read_resource("data://value")
+                assert isinstance(stale[0], TextResourceContents)
+                assert stale[0].text == "v0"
+                with anyio.fail_after(5):
+                    while middleware._refreshes:
+                        await anyio.sleep(0.01)
+
+            refreshed = await client.read_resource("data://value")
+            assert isinstance(refreshed[0], TextResourceContents)
+            assert refreshed[0].text == "v1"
+
+    async def test_background_refresh_cancelled_on_shutdown(self):
+        middleware = ResponseCachingMiddleware(
+            read_resource_settings=ReadResourceSettings(
+                ttl=60, stale_while_revalidate=60
+            )
+        )
+        mcp_server = FastMCP("test")
+        mcp_server.add_middleware(middleware)
+        started = anyio.Event()
+        blocked = False
+
+        @mcp_server.resource("data://value")
+        async def value() -> str:
+            if blocked:
+                started.set()
+                await anyio.sleep_forever()
+            return "v0"
+
+        async with Client(mcp_server) as client:
+            await client.read_resource("data://value")
+            blocked = True
+            with patch(
+                "fastmcp.server.middleware.caching.time.time",
+                return_value=time.time() + 120,
+            ):
+                await client.read_resource("data://value")
+                with anyio.fail_after(5):
+                    await started.wait()
+            assert middleware._refreshes
+
+        assert not middleware._refreshes
+
+
+class TestLocalCacheTier:
+    @pytest.fixture
+    def local_caching(
+        self, tracking_calculator: TrackingCalculator
+    ) -> tuple[FastMCP, ResponseCachingMiddleware]:
+        mcp = FastMCP("LocalCachingTestServer")
+        middleware = ResponseCachingMiddleware(
+            local_cache_settings=LocalCacheSettings(max_entries=2)
+        )
+        mcp.add_middleware(middleware)
+        tracking_calculator.add_tools(fastmcp=mcp)
+        return mcp, middleware
+
+    async def test_local_hit_skips_shared_store(
+        self, local_caching: tuple[FastMCP, ResponseCachingMiddleware]
+    ):
+        mcp_server, middleware = local_caching
+
+        async with Client(mcp_server) as client:
+            first = await client.call_tool("add", {"a": 5, "b": 3})
+            with patch.object(
+                middleware._call_tool_cache, "get", side_effect=AssertionError
+            ):
+                second = await client.call_tool("add", {"a": 5, "b": 3})
+
+        assert first == second
+        stats = middleware.statistics().local
+        assert stats is not None
+        assert stats.entries == 1
+        assert stats.call_tool == LocalCacheCollectionStatistics(hits=1, misses=1)
+
+    async def test_disabled_by_default(self):
+        assert ResponseCachingMiddleware().statistics().local is None
+
+    async def test_evicts_least_recently_used(
+        self, local_caching: tuple[FastMCP, ResponseCachingMiddleware]
+    ):
+        mcp_server, middleware = local_caching
+
+        async with Client(mcp_server) as client:
+            for a in range(3):
+                await client.call_tool("add", {"a": a, "b": 0})
+
+        stats = middleware.statistics().local
+        assert stats is not None
+        assert stats.entries == 2
+        assert stats.call_tool is not None
+        assert stats.call_tool.evictions == 1
+
+    def test_size_accounting(self):
+        cache = _LocalCache(max_entries=10, max_size=100, ttl=60)
+        cache.put("tools/call", "a", "A", size=60, ttl=60)
+        cache.put("tools/call", "b", "B", size=60, ttl=60)
+        assert cache.get("tools/call", "a") is None
+        assert cache.get("tools/call", "b") == "B"
+        assert cache.size == 60
+
+        cache.put("tools/call", "huge", "H", size=101, ttl=60)
+        assert cache.get("tools/call", "huge") is None
+        assert cache.size == 60
+
+    def test_entries_expire_at_ttl_cap(self):
+        cache = _LocalCache(max_entries=10, max_size=100, ttl=5)
+        cache.put("resources/read", "a", "A", size=1, ttl=60)
+        with patch(
+            "fastmcp.server.middleware.caching.time.monotonic",
+            return_value=time.monotonic() + 10,
+        ):
+            assert cache.get("resources/read", "a") is None
+        assert cache.size == 0
+
+    async def test_clear_local_cache(
+        self, local_caching: tuple[FastMCP, ResponseCachingMiddleware]
+    ):
+        mcp_server, middleware = local_caching
+
+        async with Client(mcp_server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+            middleware.clear_local_cache()
+
+        stats = middleware.statistics().local
+        assert stats is not None
+        assert stats.entries == 0
+        assert stats.size == 0
+
+
+class TestInvalidation:
+    @pytest.fixture
+    def invalidating(self) -> tuple[FastMCP, ResponseCachingMiddleware]:
+        mcp = FastMCP("InvalidationTestServer")
+        middleware = ResponseCachingMiddleware(
+            local_cache_settings=LocalCacheSettings()
+        )
+        mcp.add_middleware(middleware)
+        return mcp, middleware
+
+    async def test_invalidate_tool(
+        self,
+        invalidating: tuple[FastMCP, ResponseCachingMiddleware],
+        tracking_calculator: TrackingCalculator,
+    ):
+        mcp_server, middleware = invalidating
+        tracking_calculator.add_tools(fastmcp=mcp_server)
+
+        async with Client(mcp_server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+            await client.call_tool("add", {"a": 3, "b": 4})
+            await client.call_tool("multiply", {"a": 1, "b": 2})
+
+            assert await middleware.invalidate(tool="add") == 2
+
+            await client.call_tool("add", {"a": 1, "b": 2})
+            await client.call_tool("multiply", {"a": 1, "b": 2})
+
+        assert tracking_calculator.add_calls == 3
+        assert tracking_calculator.multiply_calls == 1
+
+    async def test_invalidate_uri_prefix(
+        self, invalidating: tuple[FastMCP, ResponseCachingMiddleware]
+    ):
+        mcp_server, middleware = invalidating
+        reads: list[str] = []
+
+        @mcp_server.resource("orders://{order_id}")
+        def order(order_id: str) -> str:
+            reads.append(order_id)
+            return order_id
+
+        @mcp_server.resource("customers://{customer_id}")
+        def customer(customer_id: str) -> str:
+            reads.append(customer_id)
+            return customer_id
+
+        async with Client(mcp_server) as client:
+            for uri in ["orders://1", "orders://2", "customers://1"]:
+                await client.read_resource(uri)
+
+            assert await middleware.invalidate(uri_prefix="orders://") == 2
+
+            for uri in ["orders://1", "orders://2", "customers://1"]:
+                await client.read_resource(uri)
+
+        assert reads == ["1", "2", "1", "1", "2"]
+
+    async def test_invalidate_tags(
+        self, invalidating: tuple[FastMCP, ResponseCachingMiddleware]
+    ):
+        mcp_server, middleware = invalidating
+        calls: list[str] = []
+
+        @mcp_server.tool(tags={"orders"})
+        def list_orders() -> str:
+            calls.append("orders")
+            return "orders"
+
+        @mcp_server.tool(tags={"catalog"})
+        def list_products() -> str:
+            calls.append("products")
+            return "products"
+
+        async with Client(mcp_server) as client:
+            await client.call_tool("list_orders")
+            await client.call_tool("list_products")
+
+            assert await middleware.invalidate(tags=["orders"]) == 1
+
+            await client.call_tool("list_orders")
+            await client.call_tool("list_products")
+
+        assert calls == ["orders", "products", "orders"]
+
+    async def test_invalidate_from_context(
+        self, invalidating: tuple[FastMCP, ResponseCachingMiddleware]
+    ):
+        mcp_server, _ = invalidating
+        stock = {"widget": 5}
+
+        @mcp_server.resource("stock://{item}")
+        def get_stock(item: str) -> str:
+            return str(stock[item])
+
+        @mcp_server.tool
+        async def sell(item: str, ctx: Context) -> int:
+            stock[item] -= 1
+            return await ctx.invalidate_cache(uri_prefix=f"stock://{item}")
+
+        async with Client(mcp_server) as client:
+            before = await client.read_resource("stock://widget")
+            result = await client.call_tool("sell", {"item": "widget"})
+            after = await client.read_resource("stock://widget")
+
+        assert result.data == 1
+        assert isinstance(before[0], TextResourceContents)
+        assert isinstance(after[0], TextResourceContents)
+        assert (before[0].text, after[0].text) == ("5", "4")
+
+    async def test_requires_criteria(self):
+        with pytest.raises(ValueError, match="requires"):
+            await ResponseCachingMiddleware().invalidate()
+
+
+class TestInvalidationIndex:
+    def test_prefix_match_is_bounded(self):
+        index = _InvalidationIndex()
+        for uri in ["orders://1", "orders://10", "ordersx://1", "users://1"]:
+            index.add(("resources/read", uri), uri=uri, tags=set(), ttl=60)
+
+        assert index.match(uri_prefix="orders://") == {
+            ("resources/read", "orders://1"),
+            ("resources/read", "orders://10"),
+        }
+
+    def test_expired_entries_are_pruned(self):
+        index = _InvalidationIndex()
+        index.add(("tools/call", "a"), tool="add", tags={"math"}, ttl=5)
+        with patch(
+            "fastmcp.server.middleware.caching.time.monotonic",
+            return_value=time.monotonic() + 10,
+        ):
+            index.add(("tools/call", "b"), tool="multiply", tags=set(), ttl=5)
+
+        assert len(index) == 1
+        assert index.match(tool="add", tags=["math"]) == set()
@@ -1,10 +1,13 @@
 """Tests for DereferenceRefsMiddleware."""
 
 from enum import Enum
+from unittest.mock import patch
 
 import pydantic
 
 from fastmcp import Client, FastMCP
+from fastmcp.server.middleware.dereference import DereferenceRefsMiddleware
+from fastmcp.utilities.json_schema import dereference_refs
 
 
 class Color(Enum):
@@ -134,3 +137,65 @@ class TestDereferenceRefsMiddleware:
         # Simple schema should not have $defs regardless
         assert "$defs" not in schema
         assert schema["properties"]["a"]["type"] == "integer"
+
+    async def test_dereferenced_tools_are_memoized(self):
+        """Listing the same catalog twice reuses the dereferenced copies."""
+        mcp = FastMCP("test", dereference_schemas=True)
+
+        @mcp.tool
+        def paint(request: PaintRequest) -> str:
+            return "ok"
+
+        with patch(
+            "fastmcp.server.middleware.dereference.dereference_refs",
+            wraps=dereference_refs,
+        ) as deref:
+            async with Client(mcp) as first:
+                await first.list_tools()
+            async with Client(mcp) as second:
+                tools = await second.list_tools()
+
+        assert "$defs" not in tools[0].inputSchema
+        assert deref.call_count == 1
+
+    async def test_reassigned_parameters_are_re_dereferenced(self):
+        """Replacing a tool's schema invalidates its cached copy."""
+        middleware = DereferenceRefsMiddleware()
+        mcp = FastMCP("test", dereference_schemas=False, middleware=[middleware])
+
+        @mcp.tool
+        def paint(request: PaintRequest) -> str:
+            return "ok"
+
+        async with Client(mcp) as client:
+            await client.list_tools()
+            tool = await mcp.get_tool("paint")
+            assert tool is not None
+            tool.parameters = {
+                "type": "object",
+                "properties": {"x": {"$ref": "#/$defs/X"}},
+                "$defs": {"X": {"type": "integer"}},
+            }
+            tools = await client.list_tools()
+
+        assert tools[0].inputSchema["properties"]["x"] == {"type": "integer"}
+
+    async def test_reassigned_fields_are_not_served_stale(self):
+        """Changing a field other than the schemas also refreshes the copy."""
+        middleware = DereferenceRefsMiddleware()
+        mcp = FastMCP("test", dereference_schemas=False, middleware=[middleware])
+
+        @mcp.tool
+        def paint(request: PaintRequest) -> str:
+            """Paint something."""
+            return "ok"
+
+        async with Client(mcp) as client:
+            await client.list_tools()
+            tool = await mcp.get_tool("paint")
+            assert tool is not None
+            tool.description = "Paint something else."
+            tools = await client.list_tools()
+
+        assert tools[0].description == "Paint something else."
+        assert "$defs" not in tools[0].inputSchema
@@ -619,3 +619,121 @@ class TestApplyMiddlewareParameter:
             "add", {"a": 5, "b": 3}, run_middleware=False
         )
         assert result_without.structured_content["result"] == 8  # type: ignore[union-attr,index]  # ty:ignore[not-subscriptable]
+
+
+class TestCompiledMiddlewareChain:
+    async def test_chain_is_reused_across_calls(self):
+        mcp = FastMCP()
+        mcp.add_middleware(Middleware())
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        await mcp.call_tool("add", {"a": 1, "b": 2})
+        compiled = mcp._middleware_chains[("tools/call", "request")]
+        await mcp.call_tool("add", {"a": 3, "b": 4})
+        assert mcp._middleware_chains[("tools/call", "request")] is compiled
+
+    async def test_add_middleware_invalidates_chain(self):
+        calls: list[str] = []
+
+        class Tracking(Middleware):
+            async def on_call_tool(self, context, call_next):
+                calls.append("tracking")
+                return await call_next(context)
+
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        mcp.add_middleware(Middleware())
+        await mcp.call_tool("add", {"a": 1, "b": 2})
+        assert calls == []
+
+        mcp.add_middleware(Tracking())
+        await mcp.call_tool("add", {"a": 1, "b": 2})
+        assert calls == ["tracking"]
+
+    async def test_direct_list_edits_are_picked_up(self):
+        calls: list[str] = []
+
+        class Tracking(Middleware):
+            async def on_message(self, context, call_next):
+                calls.append("tracking")
+                return await call_next(context)
+
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        await mcp.list_tools()
+        mcp.middleware.insert(0, Tracking())
+        await mcp.list_tools()
+        assert calls == ["tracking"]
+
+        class Other(Middleware):
+            async def on_message(self, context, call_next):
+                calls.append("other")
+                return await call_next(context)
+
+        mcp.middleware = [Other()]
+        await mcp.list_tools()
+        assert calls == ["tracking", "other"]
+
+    async def test_hooks_run_in_order(self):
+        calls: list[str] = []
+
+        class Outer(Middleware):
+            async def on_message(self, context, call_next):
+                calls.append("outer.on_message")
+                return await call_next(context)
+
+            async def on_call_tool(self, context, call_next):
+                calls.append("outer.on_call_tool")
+                return await call_next(context)
+
+        class Inner(Middleware):
+            async def on_request(self, context, call_next):
+                calls.append("inner.on_request")
+                return await call_next(context)
+
+        class CustomCall(Middleware):
+            async def __call__(self, context, call_next):
+                calls.append("custom.__call__")
+                return await call_next(context)
+
+        mcp = FastMCP(middleware=[Outer(), Inner(), CustomCall()])
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        result = await mcp.call_tool("add", {"a": 1, "b": 2})
+        assert result.structured_content == {"result": 3}
+        assert calls == [
+            "outer.on_message",
+            "outer.on_call_tool",
+            "inner.on_request",
+            "custom.__call__",
+        ]
+
+    async def test_nested_call_uses_its_own_terminal(self):
+        class CallsListTools(Middleware):
+            async def on_call_tool(self, context, call_next):
+                assert context.fastmcp_context is not None
+                await context.fastmcp_context.fastmcp.list_tools()
+                return await call_next(context)
+
+        mcp = FastMCP(middleware=[CallsListTools()])
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        result = await mcp.call_tool("add", {"a": 1, "b": 2})
+        assert result.structured_content == {"result": 3}
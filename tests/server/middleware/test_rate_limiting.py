@@ -1,7 +1,8 @@
 """Tests for rate limiting middleware."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -10,8 +11,12 @@ from fastmcp.client import Client
 from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware.middleware import MiddlewareContext
 from fastmcp.server.middleware.rate_limiting import (
+    ClientLimiters,
+    DistributedRateLimiter,
+    InMemoryRateLimitStore,
     RateLimitError,
     RateLimitingMiddleware,
+    RateLimitStore,
     SlidingWindowRateLimiter,
     SlidingWindowRateLimitingMiddleware,
     TokenBucketRateLimiter,
@@ -363,7 +368,7 @@ class TestRateLimitingMiddlewareIntegration:
         """Test sliding window rate limiting implementation."""
         rate_limit_server.add_middleware(
             SlidingWindowRateLimitingMiddleware(
-                max_requests=6,  # 1 init + 1 list_tools + 3 calls + 1 to fail
+                max_requests=5,  # 1 init + 1 list_tools + 3 calls, 4th call fails
                 window_minutes=1,  # 1-minute window
             )
         )
@@ -381,7 +386,8 @@ class TestRateLimitingMiddlewareIntegration:
     async def test_rate_limiting_with_different_operations(self, rate_limit_server):
         """Test that rate limiting applies to all types of operations."""
         rate_limit_server.add_middleware(
-            RateLimitingMiddleware(max_requests_per_second=9.0, burst_capacity=5)
+            # init + call + list_tools + call = 4, so the 3rd call fails
+            RateLimitingMiddleware(max_requests_per_second=9.0, burst_capacity=4)
         )
 
         async with Client(rate_limit_server) as client:
@@ -403,7 +409,7 @@ class TestRateLimitingMiddlewareIntegration:
         rate_limit_server.add_middleware(
             RateLimitingMiddleware(
                 max_requests_per_second=1.0,  # Very slow refill to ensure rate limiting triggers
-                burst_capacity=4,  # init + list_tools + call + list_tools = 4, so 2nd call fails
+                burst_capacity=3,  # init + call + list_tools = 3, so 2nd call fails
                 get_client_id=get_client_id,
             )
         )
@@ -441,7 +447,7 @@ class TestRateLimitingMiddlewareIntegration:
         rate_limit_server.add_middleware(
             RateLimitingMiddleware(
                 max_requests_per_second=10.0,  # 10 per second = 1 every 100ms
-                burst_capacity=4,
+                burst_capacity=3,  # init + call + list_tools
             )
         )
 
@@ -459,3 +465,122 @@ class TestRateLimitingMiddlewareIntegration:
             # Should be able to make another request
             result = await client.call_tool("quick_action", {"message": "after_wait"})
             assert "after_wait" in str(result)
+
+
+class TestClientLimiters:
+    """Test bounded per-client limiter storage."""
+
+    def test_idle_limiters_evicted(self):
+        limiters = ClientLimiters(
+            lambda: TokenBucketRateLimiter(capacity=2, refill_rate=1.0)
+        )
+        limiters["a"]
+        limiters["b"]
+
+        # Both buckets are full, so each is dropped once another client is seen
+        assert "a" not in limiters
+        assert len(limiters) == 1
+
+    async def test_active_limiters_kept(self):
+        limiters = ClientLimiters(
+            lambda: TokenBucketRateLimiter(capacity=2, refill_rate=0.001)
+        )
+        await limiters["a"].consume()
+        limiters["b"]
+
+        assert "a" in limiters
+
+    async def test_least_recently_used_evicted_over_capacity(self):
+        limiters = ClientLimiters(
+            lambda: SlidingWindowRateLimiter(max_requests=5, window_seconds=60),
+            max_clients=2,
+        )
+        for client_id in ["a", "b", "c"]:
+            await limiters[client_id].is_allowed()
+
+        assert "a" not in limiters
+        assert len(limiters) == 2
+
+    async def test_middleware_does_not_grow_unbounded(
+        self, mock_context, mock_call_next
+    ):
+        client_ids = iter(range(1000))
+        middleware = RateLimitingMiddleware(
+            max_requests_per_second=100.0,
+            get_client_id=lambda _: str(next(client_ids)),
+            max_clients=10,
+        )
+        for _ in range(1000):
+            await middleware.on_request(mock_context, mock_call_next)
+
+        assert len(middleware.limiters) <= 10
+
+
+class TestDistributedRateLimiter:
+    """Test rate limiting through a shared store."""
+
+    def test_in_memory_store_satisfies_protocol(self):
+        assert isinstance(InMemoryRateLimitStore(), RateLimitStore)
+
+    async def test_replicas_share_budget(self, mock_context, mock_call_next):
+        store = InMemoryRateLimitStore()
+        replicas = [
+            SlidingWindowRateLimitingMiddleware(max_requests=3, store=store)
+            for _ in range(3)
+        ]
+        with patch(
+            "fastmcp.server.middleware.rate_limiting.time.time", return_value=600.0
+        ):
+            for replica in replicas:
+                await replica.on_request(mock_context, mock_call_next)
+
+            with pytest.raises(RateLimitError):
+                await replicas[0].on_request(mock_context, mock_call_next)
+
+    async def test_rejections_do_not_consume_budget(self):
+        store = InMemoryRateLimitStore()
+        limiter = DistributedRateLimiter(store, max_requests=1, window_seconds=60)
+        with patch(
+            "fastmcp.server.middleware.rate_limiting.time.time", return_value=600.0
+        ):
+            assert await limiter.is_allowed("client")
+            assert not await limiter.is_allowed("client")
+            assert not await limiter.is_allowed("client")
+            assert await store.get("fastmcp:ratelimit:client:10") == 1
+
+    async def test_previous_window_weighted(self):
+        store = InMemoryRateLimitStore()
+        limiter = DistributedRateLimiter(store, max_requests=4, window_seconds=60)
+        now = time.time()
+        window_start = now - now % 60
+        with patch(
+            "fastmcp.server.middleware.rate_limiting.time.time",
+            return_value=window_start + 59,
+        ):
+            for _ in range(4):
+                assert await limiter.is_allowed("client")
+
+        # A quarter of the way into the next window, 3 of those 4 still count
+        with patch(
+            "fastmcp.server.middleware.rate_limiting.time.time",
+            return_value=window_start + 75,
+        ):
+            assert await limiter.is_allowed("client")
+            assert not await limiter.is_allowed("client")
+
+    async def test_token_bucket_middleware_uses_store(
+        self, mock_context, mock_call_next
+    ):
+        store = InMemoryRateLimitStore()
+        middleware = RateLimitingMiddleware(
+            max_requests_per_second=1.0, burst_capacity=2, store=store
+        )
+        with patch(
+            "fastmcp.server.middleware.rate_limiting.time.time", return_value=600.0
+        ):
+            await middleware.on_request(mock_context, mock_call_next)
+            await middleware.on_request(mock_context, mock_call_next)
+
+            with pytest.raises(RateLimitError):
+                await middleware.on_request(mock_context, mock_call_next)
+        assert len(middleware.limiters) == 0
@@ -1,11 +1,14 @@
 """Advanced mounting scenarios."""
 
+from unittest.mock import patch
+
 import pytest
 from mcp.types import TextContent
 from starlette.routing import Route
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
+from fastmcp.server.middleware import Middleware
 from fastmcp.server.providers import FastMCPProvider
 from fastmcp.server.providers.wrapped_provider import _WrappedProvider
 
@@ -276,6 +279,49 @@ class TestDeeplyNestedMount:
         result = await root.call_tool("middle_leaf_add", {"a": 5, "b": 7})
         assert result.structured_content == {"result": 12}
 
+    async def test_nested_call_resolves_each_level_once(self):
+        """Delegated calls reuse the route resolved by the parent."""
+        root = FastMCP("root")
+        middle = FastMCP("middle")
+        leaf = FastMCP("leaf")
+
+        @leaf.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        middle.mount(leaf, namespace="leaf")
+        root.mount(middle, namespace="middle")
+
+        with patch.object(
+            leaf.local_provider, "_get_tool", wraps=leaf.local_provider._get_tool
+        ) as leaf_get_tool:
+            result = await root.call_tool("middle_leaf_add", {"a": 5, "b": 7})
+
+        assert result.structured_content == {"result": 12}
+        assert leaf_get_tool.call_count == 1
+
+    async def test_nested_call_still_runs_child_middleware(self):
+        """Route reuse does not bypass middleware on mounted servers."""
+        root = FastMCP("root")
+        leaf = FastMCP("leaf")
+        seen: list[str] = []
+
+        class Recorder(Middleware):
+            async def on_call_tool(self, context, call_next):
+                seen.append(context.message.name)
+                return await call_next(context)
+
+        leaf.add_middleware(Recorder())
+
+        @leaf.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        root.mount(leaf, namespace="leaf")
+        await root.call_tool("leaf_add", {"a": 1, "b": 2})
+
+        assert seen == ["add"]
+
     async def test_three_level_nested_resource_invocation(self):
         """Test reading resources from servers mounted 3 levels deep."""
         root = FastMCP("root")
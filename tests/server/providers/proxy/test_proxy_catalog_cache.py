@@ -0,0 +1,177 @@
+"""Tests for ProxyProvider's component list cache and list_changed refresh."""
+
+from unittest.mock import patch
+
+import anyio
+import mcp.types
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.providers.proxy import (
+    _MAX_REFRESH_FAILURES,
+    ProxyClient,
+    ProxyProvider,
+    _ListChangedHandler,
+)
+
+
+class CountInitialize(Middleware):
+    def __init__(self):
+        self.count = 0
+
+    async def on_initialize(self, context, call_next):
+        self.count += 1
+        return await call_next(context)
+
+
+@pytest.fixture
+def backend() -> FastMCP:
+    server = FastMCP("Backend")
+
+    @server.tool
+    def greet(name: str) -> str:
+        return f"Hello, {name}!"
+
+    @server.prompt
+    def welcome() -> str:
+        return "Welcome!"
+
+    return server
+
+
+async def wait_for_refreshes(provider: ProxyProvider) -> None:
+    with anyio.fail_after(5):
+        while provider._refreshing:
+            await anyio.sleep(0.01)
+
+
+class TestCatalogCache:
+    async def test_lookups_use_name_index(self, backend):
+        provider = ProxyProvider(lambda: ProxyClient(backend))
+        await provider._list_tools()
+
+        assert provider._tools_cache is not None
+        assert [t.name for t in provider._tools_cache.index["greet"]] == ["greet"]
+        assert await provider._get_tool("missing") is None
+
+    async def test_stale_list_served_while_refreshing(self, backend):
+        provider = ProxyProvider(lambda: ProxyClient(backend), cache_ttl=60)
+        async with provider.lifespan():
+            await provider._list_tools()
+            assert provider._tools_cache is not None
+            provider._tools_cache.invalidate()
+
+            @backend.tool
+            def farewell() -> str:
+                return "Bye!"
+
+            assert await provider._get_tool("farewell") is None
+            assert "tools" in provider._refreshing
+
+            await wait_for_refreshes(provider)
+            assert await provider._get_tool("farewell") is not None
+
+    async def test_stale_list_refetched_inline_outside_lifespan(self, backend):
+        provider = ProxyProvider(lambda: ProxyClient(backend), cache_ttl=60)
+        await provider._list_tools()
+        assert provider._tools_cache is not None
+        provider._tools_cache.invalidate()
+
+        @backend.tool
+        def farewell() -> str:
+            return "Bye!"
+
+        assert await provider._get_tool("farewell") is not None
+
+    async def test_failed_refresh_keeps_cached_list(self, backend):
+        provider = ProxyProvider(lambda: ProxyClient(backend), cache_ttl=60)
+        async with provider.lifespan():
+            await provider._list_tools()
+            assert provider._tools_cache is not None
+            provider._tools_cache.invalidate()
+
+            with patch.object(
+                provider, "_list_tools", side_effect=RuntimeError("backend down")
+            ):
+                assert await provider._get_tool("greet") is not None
+                await wait_for_refreshes(provider)
+            assert await provider._get_tool("greet") is not None
+
+    async def test_repeated_refresh_failures_drop_cached_list(self, backend):
+        provider = ProxyProvider(lambda: ProxyClient(backend), cache_ttl=60)
+        async with provider.lifespan():
+            await provider._list_tools()
+
+            with patch.object(
+                provider, "_list_tools", side_effect=RuntimeError("backend down")
+            ):
+                for _ in range(_MAX_REFRESH_FAILURES):
+                    assert provider._tools_cache is not None
+                    provider._tools_cache.invalidate()
+                    assert await provider._get_tool("greet") is not None
+                    await wait_for_refreshes(provider)
+
+                assert provider._tools_cache is None
+                with pytest.raises(RuntimeError, match="backend down"):
+                    await provider._get_tool("greet")
+
+            assert await provider._get_tool("greet") is not None
+
+    async def test_header_forwarding_backend_refreshed_inline(self):
+        provider = ProxyProvider(lambda: ProxyClient("http://localhost:9/mcp"))
+        async with provider.lifespan():
+            # A background refresh would connect without the request's headers
+            assert not provider._start_refresh("tools")
+
+    async def test_list_changed_refreshes_matching_list(self, backend):
+        provider = ProxyProvider(lambda: ProxyClient(backend))
+        async with provider.lifespan():
+            await provider._list_tools()
+            await provider._list_prompts()
+            assert provider._prompts_cache is not None
+            prompts_cache = provider._prompts_cache
+
+            @backend.tool
+            def farewell() -> str:
+                return "Bye!"
+
+            handler = _ListChangedHandler(provider)
+            await handler.on_tool_list_changed(mcp.types.ToolListChangedNotification())
+            await wait_for_refreshes(provider)
+
+            assert await provider._get_tool("farewell") is not None
+            assert provider._prompts_cache is prompts_cache
+
+
+class TestWatchChanges:
+    async def test_watch_session_held_for_lifespan(self, backend):
+        handshakes = CountInitialize()
+        backend.add_middleware(handshakes)
+
+        proxy = FastMCP("Proxy")
+        proxy.add_provider(
+            ProxyProvider(lambda: ProxyClient(backend), watch_changes=True)
+        )
+
+        async with Client(proxy) as client:
+            for _ in range(50):
+                if handshakes.count:
+                    break
+                await anyio.sleep(0.01)
+            assert handshakes.count == 1
+
+            await client.call_tool("greet", {"name": "World"})
+
+    async def test_no_watch_session_by_default(self, backend):
+        handshakes = CountInitialize()
+        backend.add_middleware(handshakes)
+
+        proxy = FastMCP("Proxy")
+        proxy.add_provider(ProxyProvider(lambda: ProxyClient(backend)))
+
+        async with Client(proxy):
+            await anyio.sleep(0.05)
+
+        assert handshakes.count == 0
@@ -0,0 +1,166 @@
+"""Tests for ProxySessionPool, which shares warm backend sessions."""
+
+import anyio
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.providers.proxy import (
+    FastMCPProxy,
+    ProxyClient,
+    ProxySessionPool,
+)
+from fastmcp.utilities.tests import run_server_async
+
+
+class CountInitialize(Middleware):
+    def __init__(self):
+        self.count = 0
+
+    async def on_initialize(self, context, call_next):
+        self.count += 1
+        return await call_next(context)
+
+
+@pytest.fixture
+def handshakes() -> CountInitialize:
+    return CountInitialize()
+
+
+@pytest.fixture
+def backend(handshakes: CountInitialize) -> FastMCP:
+    server = FastMCP("Backend", middleware=[handshakes])
+
+    @server.tool
+    async def add(a: int, b: int) -> int:
+        await anyio.sleep(0.01)
+        return a + b
+
+    return server
+
+
+def pooled_proxy(backend: FastMCP, pool: ProxySessionPool) -> FastMCPProxy:
+    base = ProxyClient(backend)
+    return FastMCPProxy(client_factory=base.new, session_pool=pool)
+
+
+class TestProxySessionPool:
+    async def test_sessions_are_reused(self, backend, handshakes):
+        proxy = pooled_proxy(backend, ProxySessionPool(size=2))
+
+        async with Client(proxy) as client:
+            for i in range(5):
+                result = await client.call_tool("add", {"a": i, "b": 1})
+                assert result.data == i + 1
+
+        assert handshakes.count == 1
+
+    async def test_concurrent_calls_bounded_by_size(self, backend, handshakes):
+        proxy = pooled_proxy(backend, ProxySessionPool(size=2))
+        results: list[int] = []
+
+        async def call(i: int) -> None:
+            result = await client.call_tool("add", {"a": i, "b": i})
+            results.append(result.data)
+
+        async with Client(proxy) as client:
+            async with anyio.create_task_group() as tg:
+                for i in range(10):
+                    tg.start_soon(call, i)
+
+        assert sorted(results) == [2 * i for i in range(10)]
+        assert handshakes.count == 2
+
+    async def test_acquire_counts_leases(self, backend, handshakes):
+        pool = ProxySessionPool(size=3)
+        pool.bind(ProxyClient(backend).new)
+
+        # Leases count before the callers enter their clients
+        clients = [await pool.acquire() for _ in range(3)]
+        assert len({id(c) for c in clients}) == 3
+        assert handshakes.count == 3
+
+        for client in clients:
+            async with client:
+                pass
+        (partition,) = pool._partitions.values()
+        assert [s.in_flight for s in partition.sessions] == [0, 0, 0]
+        await pool.close()
+
+    async def test_http_sessions_partitioned_by_authorization(self, handshakes):
+        backend = FastMCP("Backend", middleware=[handshakes])
+
+        @backend.tool
+        def whoami() -> str:
+            return get_http_headers(include={"authorization"})["authorization"]
+
+        async with run_server_async(backend) as backend_url:
+            pool = ProxySessionPool(size=2)
+            proxy = FastMCPProxy(
+                client_factory=ProxyClient(backend_url).new, session_pool=pool
+            )
+            async with run_server_async(proxy) as proxy_url:
+                async with (
+                    Client(proxy_url, auth="token-a") as alice,
+                    Client(proxy_url, auth="token-b") as bob,
+                ):
+                    for _ in range(3):
+                        a = await alice.call_tool("whoami", {})
+                        b = await bob.call_tool("whoami", {})
+                        assert a.data == "Bearer token-a"
+                        assert b.data == "Bearer token-b"
+
+                sessions = [
+                    {id(s.client) for s in partition.sessions}
+                    for partition in pool._partitions.values()
+                ]
+                assert len(sessions) == 2
+                assert not sessions[0] & sessions[1]
+
+    async def test_failed_session_is_replaced(self, backend, handshakes):
+        pool = ProxySessionPool(size=1)
+        proxy = pooled_proxy(backend, pool)
+
+        async with Client(proxy) as client:
+            await client.call_tool("add", {"a": 1, "b": 1})
+            (partition,) = pool._partitions.values()
+            await partition.sessions[0].client._disconnect(force=True)
+
+            result = await client.call_tool("add", {"a": 2, "b": 2})
+
+        assert result.data == 4
+        assert handshakes.count == 2
+
+    async def test_sessions_recycled_after_max_age(self, backend, handshakes):
+        proxy = pooled_proxy(backend, ProxySessionPool(size=1, max_age=0))
+
+        async with Client(proxy) as client:
+            await client.call_tool("add", {"a": 1, "b": 1})
+            opened = handshakes.count
+            await client.call_tool("add", {"a": 1, "b": 1})
+
+        assert handshakes.count > opened
+
+    async def test_close_disconnects_sessions(self, backend):
+        pool = ProxySessionPool()
+        proxy = pooled_proxy(backend, pool)
+
+        async with Client(proxy) as client:
+            await client.call_tool("add", {"a": 1, "b": 1})
+            (partition,) = pool._partitions.values()
+            pooled = partition.sessions[0].client
+
+        assert not pool._partitions
+        assert not pooled.is_connected()
+
+    def test_bind_only_once(self, backend):
+        pool = ProxySessionPool()
+        pool.bind(lambda: ProxyClient(backend))
+        with pytest.raises(ValueError, match="already bound"):
+            pool.bind(lambda: ProxyClient(backend))
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            ProxySessionPool(size=0)
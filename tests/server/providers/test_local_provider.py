@@ -832,3 +832,82 @@ class TestLocalProviderStandaloneUsage:
         async with Client(server) as client:
             result = await client.call_tool("duplicate_tool", {})
             assert result.data == "from server"
+
+
+class TestLocalProviderIndexes:
+    """Tests for LocalProvider's secondary name/URI indexes."""
+
+    async def test_get_tool_returns_highest_version_regardless_of_order(self):
+        provider = LocalProvider()
+        for version in ["2.0", "10.0", "1.0"]:
+            provider.add_tool(Tool(name="calc", version=version, parameters={}))
+
+        tool = await provider._get_tool("calc")
+        assert tool is not None
+        assert tool.version == "10.0"
+
+    async def test_get_tool_with_version_spec(self):
+        from fastmcp.utilities.versions import VersionSpec
+
+        provider = LocalProvider()
+        for version in ["1.0", "2.0", "3.0"]:
+            provider.add_tool(Tool(name="calc", version=version, parameters={}))
+
+        tool = await provider._get_tool("calc", VersionSpec(lt="3.0"))
+        assert tool is not None
+        assert tool.version == "2.0"
+        assert await provider._get_tool("calc", VersionSpec(eq="9.0")) is None
+
+    async def test_indexes_track_removal(self):
+        provider = LocalProvider()
+        provider.add_tool(Tool(name="calc", version="1.0", parameters={}))
+        provider.add_tool(Tool(name="calc", version="2.0", parameters={}))
+
+        provider.remove_tool("calc", version="2.0")
+        tool = await provider._get_tool("calc")
+        assert tool is not None
+        assert tool.version == "1.0"
+
+        provider.remove_tool("calc")
+        assert await provider._get_tool("calc") is None
+        assert await provider._list_tools() == []
+        assert provider._versions == {}
+
+    async def test_replace_keeps_single_index_entry(self):
+        provider = LocalProvider(on_duplicate="replace")
+        provider.add_tool(Tool(name="calc", description="old", parameters={}))
+        provider.add_tool(Tool(name="calc", description="new", parameters={}))
+
+        tools = await provider._list_tools()
+        assert [t.description for t in tools] == ["new"]
+        tool = await provider._get_tool("calc")
+        assert tool is not None
+        assert tool.description == "new"
+
+    async def test_list_views_are_per_type(self):
+        provider = LocalProvider()
+
+        @provider.tool
+        def my_tool() -> str:
+            return "tool"
+
+        @provider.resource("data://config")
+        def config() -> str:
+            return "config"
+
+        @provider.resource("data://{id}")
+        def item(id: str) -> str:
+            return id
+
+        @provider.prompt
+        def my_prompt() -> str:
+            return "prompt"
+
+        assert [t.name for t in await provider._list_tools()] == ["my_tool"]
+        assert [str(r.uri) for r in await provider._list_resources()] == [
+            "data://config"
+        ]
+        assert [t.uri_template for t in await provider._list_resource_templates()] == [
+            "data://{id}"
+        ]
+        assert [p.name for p in await provider._list_prompts()] == ["my_prompt"]
@@ -81,6 +81,40 @@ class TestNamespaceTransform:
         assert len(transformed_templates) == 1
         assert transformed_templates[0].uri_template == "resource://ns/{name}/data"
 
+    async def test_namespace_reuses_copies_across_listings(self):
+        """Listing the same components twice returns the same namespaced copies."""
+        server = FastMCP("Test")
+
+        @server.tool
+        def my_tool() -> str:
+            return "result"
+
+        layer = Namespace("ns")
+        tools = await server.local_provider.list_tools()
+
+        first = await layer.list_tools(tools)
+        second = await layer.list_tools(tools)
+
+        assert first[0] is second[0]
+        assert first[0] is not tools[0]
+
+    async def test_namespace_recopies_after_rename(self):
+        """Reassigning the source name invalidates the cached copy."""
+        server = FastMCP("Test")
+
+        @server.tool
+        def my_tool() -> str:
+            return "result"
+
+        layer = Namespace("ns")
+        tools = await server.local_provider.list_tools()
+        await layer.list_tools(tools)
+
+        tools[0].name = "renamed"
+        transformed = await layer.list_tools(tools)
+
+        assert transformed[0].name == "ns_renamed"
+
 
 class TestToolTransformRenames:
     """Test ToolTransform renaming functionality."""
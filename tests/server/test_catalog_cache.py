@@ -0,0 +1,238 @@
+"""Tests for generation-keyed caching of server component listings."""
+
+from collections.abc import Sequence
+from unittest.mock import patch
+
+from mcp.server.auth.middleware.auth_context import auth_context_var
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+
+from fastmcp import Client, FastMCP
+from fastmcp.server.auth import AccessToken, require_scopes
+from fastmcp.server.catalog_cache import CatalogCache
+from fastmcp.server.context import Context
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.providers import Provider
+from fastmcp.server.transforms import (
+    Namespace,
+    PromptsAsTools,
+    ResourcesAsTools,
+    Transform,
+)
+from fastmcp.tools.base import Tool
+
+
+class CountingProvider(Provider):
+    """Static provider that counts list calls."""
+
+    def __init__(self, *, cacheable: bool = True):
+        super().__init__()
+        if cacheable:
+            self._catalog_generation = 0
+        self.tools: list[Tool] = [Tool.from_function(lambda: "a", name="a")]
+        self.list_calls = 0
+
+    async def _list_tools(self) -> Sequence[Tool]:
+        self.list_calls += 1
+        return list(self.tools)
+
+
+class TestCatalogCache:
+    def test_miss_without_generation(self):
+        cache = CatalogCache()
+        cache.set("tools", None, [], ["x"])
+        assert cache.get("tools", None, []) is None
+
+    def test_hit_and_stale_generation(self):
+        cache = CatalogCache()
+        cache.set("tools", (1,), [], ["x"])
+        assert cache.get("tools", (1,), []) == ["x"]
+        assert cache.get("tools", (2,), []) is None
+        cache.set("tools", (2,), [], ["y"])
+        assert cache.get("tools", (1,), []) is None
+        assert cache.get("tools", (2,), []) == ["y"]
+
+    def test_rules_keyed_separately(self):
+        cache = CatalogCache()
+        rules = [{"enabled": False, "names": ["a"]}]
+        cache.set("tools", 0, [], ["a"])
+        cache.set("tools", 0, rules, [])
+        assert cache.get("tools", 0, []) == ["a"]
+        assert cache.get("tools", 0, rules) == []
+
+    def test_lru_bound(self):
+        cache = CatalogCache(max_entries=2)
+        for i in range(3):
+            cache.set("tools", 0, [{"i": i}], [i])
+        assert cache.get("tools", 0, [{"i": 0}]) is None
+        assert cache.get("tools", 0, [{"i": 2}]) == [2]
+
+
+class TestServerCatalogCaching:
+    async def test_repeated_list_hits_cache(self):
+        mcp = FastMCP("test")
+        provider = CountingProvider()
+        mcp.add_provider(provider)
+
+        await mcp.list_tools()
+        await mcp.list_tools()
+        assert provider.list_calls == 1
+
+    async def test_local_changes_invalidate(self):
+        mcp = FastMCP("test")
+
+        @mcp.tool
+        def one() -> int:
+            return 1
+
+        assert [t.name for t in await mcp.list_tools()] == ["one"]
+
+        @mcp.tool
+        def two() -> int:
+            return 2
+
+        assert {t.name for t in await mcp.list_tools()} == {"one", "two"}
+
+        mcp.local_provider.remove_tool("one")
+        assert [t.name for t in await mcp.list_tools()] == ["two"]
+
+        mcp.disable(names={"two"})
+        assert await mcp.list_tools() == []
+
+    async def test_add_transform_invalidates(self):
+        mcp = FastMCP("test")
+
+        @mcp.tool
+        def one() -> int:
+            return 1
+
+        await mcp.list_tools()
+        mcp.add_transform(Namespace("ns"))
+        assert [t.name for t in await mcp.list_tools()] == ["ns_one"]
+
+    async def test_dynamic_provider_is_not_cached(self):
+        mcp = FastMCP("test")
+        provider = CountingProvider(cacheable=False)
+        mcp.add_provider(provider)
+
+        await mcp.list_tools()
+        await mcp.list_tools()
+        assert provider.list_calls == 2
+
+    async def test_dynamic_transform_is_not_cached(self):
+        mcp = FastMCP("test")
+        provider = CountingProvider()
+        mcp.add_provider(provider)
+        mcp.add_transform(Transform())
+
+        await mcp.list_tools()
+        await mcp.list_tools()
+        assert provider.list_calls == 2
+
+    async def test_session_rules_do_not_leak(self):
+        mcp = FastMCP("test")
+
+        @mcp.tool(tags={"finance"})
+        def finance() -> str:
+            return "finance"
+
+        @mcp.tool
+        async def hide_finance(ctx: Context) -> str:
+            await ctx.disable_components(tags={"finance"})
+            return "hidden"
+
+        async with Client(mcp) as first, Client(mcp) as second:
+            await first.call_tool("hide_finance", {})
+            first_names = {t.name for t in await first.list_tools()}
+            second_names = {t.name for t in await second.list_tools()}
+
+        assert "finance" not in first_names
+        assert "finance" in second_names
+
+    async def test_mounted_server_is_cached(self):
+        child = FastMCP("child")
+        child.add_provider(CountingProvider())
+        mcp = FastMCP("parent")
+        mcp.mount(child, namespace="child")
+
+        with patch.object(child, "list_tools", wraps=child.list_tools) as listings:
+            await mcp.list_tools()
+            await mcp.list_tools()
+        # A single child listing: the call plus its re-entry past middleware
+        assert listings.call_count == 2
+
+        @child.tool
+        def added() -> int:
+            return 1
+
+        assert "child_added" in {t.name for t in await mcp.list_tools()}
+
+    async def test_mounted_server_middleware_runs_on_every_listing(self):
+        listings = 0
+
+        class CountListings(Middleware):
+            async def on_list_tools(self, context, call_next):
+                nonlocal listings
+                listings += 1
+                return await call_next(context)
+
+        child = FastMCP("child", middleware=[CountListings()])
+        child.add_provider(CountingProvider())
+        mcp = FastMCP("parent")
+        mcp.mount(child, namespace="child")
+
+        await mcp.list_tools()
+        await mcp.list_tools()
+        assert listings == 2
+
+    async def test_component_tool_transforms_follow_server(self):
+        mcp = FastMCP("test")
+        provider = CountingProvider()
+        mcp.add_provider(provider)
+        mcp.add_transform(PromptsAsTools(mcp))
+        mcp.add_transform(ResourcesAsTools(mcp))
+
+        first = {t.name for t in await mcp.list_tools()}
+        await mcp.list_tools()
+        assert provider.list_calls == 1
+        assert {"list_prompts", "list_resources"} <= first
+
+        provider.tools.append(Tool.from_function(lambda: "b", name="b"))
+        provider._bump_catalog_generation()
+        assert "b" in {t.name for t in await mcp.list_tools()}
+
+    async def test_mounted_auth_applied_per_caller(self):
+        child = FastMCP("child")
+
+        @child.tool
+        def public() -> str:
+            return "public"
+
+        @child.tool(auth=require_scopes("admin"))
+        def secret() -> str:
+            return "secret"
+
+        @child.resource("data://secret", auth=require_scopes("admin"))
+        def secret_data() -> str:
+            return "secret"
+
+        mcp = FastMCP("parent")
+        mcp.mount(child, namespace="c")
+
+        async def visible(scopes: list[str]) -> tuple[set[str], set[str]]:
+            token = AccessToken(
+                token="t", client_id="c", scopes=scopes, expires_at=None, claims={}
+            )
+            reset = auth_context_var.set(AuthenticatedUser(token))
+            try:
+                tools = {t.name for t in await mcp.list_tools()}
+                resources = {str(r.uri) for r in await mcp.list_resources()}
+                return tools, resources
+            finally:
+                auth_context_var.reset(reset)
+
+        assert await visible([]) == ({"c_public"}, set())
+        assert await visible(["admin"]) == (
+            {"c_public", "c_secret"},
+            {"data://c/secret"},
+        )
+        assert await visible([]) == ({"c_public"}, set())
@@ -1192,3 +1192,104 @@ class TestSharedDependencies:
                 in result.messages[0].content.text
             )
             assert call_count == 1
+
+
+class TestScopedDependencies:
+    """Tests for Depends(scope="session" | "server")."""
+
+    @pytest.fixture
+    def tracked(self):
+        events: list[str] = []
+        counter = 0
+
+        @asynccontextmanager
+        async def resource():
+            nonlocal counter
+            counter += 1
+            name = f"resource-{counter}"
+            events.append(f"open {name}")
+            try:
+                yield name
+            finally:
+                events.append(f"close {name}")
+
+        return resource, events
+
+    async def test_server_scope_shared_across_sessions(self, mcp: FastMCP, tracked):
+        resource, events = tracked
+
+        @mcp.tool()
+        async def use(value: str = Depends(resource, scope="server")) -> str:
+            return value
+
+        async with Client(mcp) as first, Client(mcp) as second:
+            results = [
+                await first.call_tool("use", {}),
+                await first.call_tool("use", {}),
+                await second.call_tool("use", {}),
+            ]
+            assert events == ["open resource-1"]
+
+        assert [r.data for r in results] == ["resource-1"] * 3
+        assert events == ["open resource-1", "close resource-1"]
+
+    async def test_session_scope_per_session(self, mcp: FastMCP, tracked):
+        resource, events = tracked
+
+        @mcp.tool()
+        async def use(value: str = Depends(resource, scope="session")) -> str:
+            return value
+
+        async with Client(mcp) as first:
+            async with Client(mcp) as second:
+                assert (await first.call_tool("use", {})).data == "resource-1"
+                assert (await second.call_tool("use", {})).data == "resource-2"
+                assert (await first.call_tool("use", {})).data == "resource-1"
+            assert events == ["open resource-1", "open resource-2", "close resource-2"]
+
+        assert events[-1] == "close resource-1"
+
+    async def test_request_scope_is_default(self, mcp: FastMCP, tracked):
+        resource, events = tracked
+
+        @mcp.tool()
+        async def use(value: str = Depends(resource)) -> str:
+            return value
+
+        async with Client(mcp) as client:
+            await client.call_tool("use", {})
+            await client.call_tool("use", {})
+
+        assert events == [
+            "open resource-1",
+            "close resource-1",
+            "open resource-2",
+            "close resource-2",
+        ]
+
+    async def test_scoped_dependency_can_depend_on_scoped(self, mcp: FastMCP):
+        settings_calls = 0
+
+        def get_settings() -> dict[str, str]:
+            nonlocal settings_calls
+            settings_calls += 1
+            return {"dsn": "memory://"}
+
+        def get_client(
+            settings: dict[str, str] = Depends(get_settings, scope="server"),
+        ) -> str:
+            return f"client({settings['dsn']})"
+
+        @mcp.tool()
+        async def use(client: str = Depends(get_client, scope="session")) -> str:
+            return client
+
+        async with Client(mcp) as client:
+            assert (await client.call_tool("use", {})).data == "client(memory://)"
+            await client.call_tool("use", {})
+
+        assert settings_calls == 1
+
+    def test_rejects_unknown_scope(self):
+        with pytest.raises(ValueError, match="Unknown dependency scope"):
+            Depends(lambda: None, scope="global")  # ty: ignore[invalid-argument-type]
@@ -0,0 +1,203 @@
+"""Tests for call_tool schema validation in the low-level server.
+
+Tool definitions are looked up for the called tool only, and their schemas
+are compiled once and reused across calls.
+"""
+
+from collections.abc import Sequence
+from unittest.mock import patch
+
+from fastmcp import Client, FastMCP
+from fastmcp.server import low_level
+from fastmcp.server.low_level import get_schema_validator
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.providers import Provider
+from fastmcp.tools.base import Tool, ToolResult
+from fastmcp.utilities.versions import VersionSpec
+
+OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {"n": {"type": "integer"}},
+    "required": ["n"],
+}
+
+
+class CountListTools(Middleware):
+    def __init__(self):
+        self.calls = 0
+
+    async def on_list_tools(self, context, call_next):
+        self.calls += 1
+        return await call_next(context)
+
+
+class CountingToolProvider(Provider):
+    """Dynamic provider (no catalog generation) that counts tool lookups."""
+
+    def __init__(self):
+        super().__init__()
+        self.tool = Tool.from_function(lambda n: n * 2, name="double")
+        self.get_calls = 0
+
+    async def _list_tools(self) -> Sequence[Tool]:
+        return [self.tool]
+
+    async def _get_tool(
+        self, name: str, version: VersionSpec | None = None
+    ) -> Tool | None:
+        self.get_calls += 1
+        return self.tool if name == self.tool.name else None
+
+
+def bad_output_server(*, validate_output: bool = True) -> FastMCP:
+    mcp = FastMCP()
+
+    @mcp.tool(output_schema=OUTPUT_SCHEMA, validate_output=validate_output)
+    def bad() -> ToolResult:
+        return ToolResult(structured_content={"n": "not a number"})
+
+    return mcp
+
+
+def skip_client_validation(client: Client, *names: str) -> None:
+    """Keep the SDK client from validating (and relisting for) these tools.
+
+    The SDK session checks structured content against output schemas itself,
+    listing tools the first time each one is called. Recording the tools as
+    schemaless leaves these tests observing the server alone.
+    """
+    for name in names:
+        client.session._tool_output_schemas[name] = None
+
+
+class TestOutputValidation:
+    async def test_invalid_output_is_an_error(self):
+        async with Client(bad_output_server()) as client:
+            result = await client.call_tool_mcp("bad", {})
+
+        assert result.isError
+        assert "Output validation error" in result.content[0].text  # type: ignore[union-attr]
+
+    async def test_validation_can_be_disabled_per_tool(self):
+        async with Client(bad_output_server(validate_output=False)) as client:
+            skip_client_validation(client, "bad")
+            result = await client.call_tool_mcp("bad", {})
+
+        assert not result.isError
+        assert result.structuredContent == {"n": "not a number"}
+
+    async def test_strict_input_validation_still_applies(self):
+        mcp = FastMCP(strict_input_validation=True)
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        async with Client(mcp) as client:
+            result = await client.call_tool_mcp("add", {"a": "1", "b": 2})
+
+        assert result.isError
+        assert "Input validation error" in result.content[0].text  # type: ignore[union-attr]
+
+
+class TestToolDefinitionCache:
+    async def test_call_does_not_list_tools(self):
+        counter = CountListTools()
+        mcp = FastMCP(middleware=[counter])
+
+        @mcp.tool
+        def double(n: int) -> int:
+            return n * 2
+
+        async with Client(mcp) as client:
+            skip_client_validation(client, "double")
+            result = await client.call_tool("double", {"n": 2})
+
+        assert result.structured_content == {"result": 4}
+        assert counter.calls == 0
+
+    async def test_schema_compiled_once_per_tool(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def double(n: int) -> int:
+            return n * 2
+
+        with patch.object(
+            low_level, "get_schema_validator", wraps=get_schema_validator
+        ) as compile_schema:
+            async with Client(mcp) as client:
+                for n in range(3):
+                    await client.call_tool("double", {"n": n})
+
+        assert compile_schema.call_count == 1
+
+    async def test_listing_keeps_definitions(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def double(n: int) -> int:
+            return n * 2
+
+        async with Client(mcp) as client:
+            await client.call_tool("double", {"n": 1})
+            definitions = dict(mcp._mcp_server._tool_definitions)
+            await client.list_tools()
+            assert mcp._mcp_server._tool_definitions == definitions
+
+    async def test_definitions_refreshed_when_tool_replaced(self):
+        mcp = bad_output_server(validate_output=False)
+
+        async with Client(mcp) as client:
+            skip_client_validation(client, "bad")
+            assert not (await client.call_tool_mcp("bad", {})).isError
+
+            mcp.local_provider.remove_tool("bad")
+
+            @mcp.tool(output_schema=OUTPUT_SCHEMA, name="bad")
+            def strict_bad() -> ToolResult:
+                return ToolResult(structured_content={"n": "not a number"})
+
+            assert (await client.call_tool_mcp("bad", {})).isError
+
+    async def test_definitions_follow_requested_version(self):
+        mcp = FastMCP()
+
+        @mcp.tool(version="1", output_schema=OUTPUT_SCHEMA, validate_output=False)
+        def bad() -> ToolResult:
+            return ToolResult(structured_content={"n": "not a number"})
+
+        @mcp.tool(version="2", output_schema=OUTPUT_SCHEMA, name="bad")
+        def strict_bad() -> ToolResult:
+            return ToolResult(structured_content={"n": "not a number"})
+
+        async with Client(mcp) as client:
+            skip_client_validation(client, "bad")
+            pinned = await client.call_tool_mcp(
+                "bad", {}, meta={"fastmcp": {"version": "1"}}
+            )
+            latest = await client.call_tool_mcp("bad", {})
+
+        assert not pinned.isError
+        assert latest.isError
+
+    async def test_unversioned_definitions_reused_briefly(self):
+        provider = CountingToolProvider()
+        mcp = FastMCP(providers=[provider])
+        assert mcp.catalog_generation() is None
+
+        async with Client(mcp) as client:
+            for n in range(3):
+                await client.call_tool("double", {"n": n})
+
+            # One lookup per call plus one for the shared definition
+            assert provider.get_calls == 4
+
+            with patch.object(low_level, "_UNVERSIONED_DEFINITION_TTL", 0):
+                await client.call_tool("double", {"n": 3})
+            assert provider.get_calls == 6
+
+    def test_validators_shared_by_equal_schemas(self):
+        first = get_schema_validator({"type": "object", "required": ["a"]})
+        second = get_schema_validator({"required": ["a"], "type": "object"})
+        assert first is second
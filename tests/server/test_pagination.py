@@ -9,7 +9,13 @@ import pytest
 from mcp.shared.exceptions import McpError
 
 from fastmcp import Client, FastMCP
-from fastmcp.utilities.pagination import CursorState, paginate_sequence
+from fastmcp.server.middleware import Middleware
+from fastmcp.tools.base import Tool
+from fastmcp.utilities.pagination import (
+    CursorState,
+    ListingSnapshots,
+    paginate_sequence,
+)
 
 
 class TestCursorEncoding:
@@ -22,6 +28,20 @@ class TestCursorEncoding:
         decoded = CursorState.decode(encoded)
         assert decoded.offset == 100
 
+    def test_encode_decode_roundtrip_with_snapshot(self) -> None:
+        """Snapshot id should survive encode/decode roundtrip."""
+        decoded = CursorState.decode(CursorState(offset=10, snapshot="abc").encode())
+        assert decoded == CursorState(offset=10, snapshot="abc")
+
+    def test_decode_negative_offset_raises(self) -> None:
+        """Negative offsets should raise ValueError."""
+        import base64
+        import json
+
+        invalid = base64.urlsafe_b64encode(json.dumps({"o": -1}).encode()).decode()
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            CursorState.decode(invalid)
+
     def test_encode_produces_string(self) -> None:
         """Encoded cursor should be a string."""
         state = CursorState(offset=50)
@@ -105,6 +125,36 @@ class TestPaginateSequence:
             paginate_sequence([1, 2, 3], "invalid!", 10)
 
 
+class TestListingSnapshots:
+    """Tests for the snapshot store backing paginated cursors."""
+
+    def test_get_returns_stored_listing(self) -> None:
+        snapshots = ListingSnapshots()
+        snapshot_id = snapshots.add("tools", [1, 2, 3])
+        assert snapshots.get("tools", snapshot_id) == [1, 2, 3]
+
+    def test_get_rejects_other_kind(self) -> None:
+        snapshots = ListingSnapshots()
+        snapshot_id = snapshots.add("tools", [1])
+        assert snapshots.get("prompts", snapshot_id) is None
+
+    def test_get_rejects_other_owner(self) -> None:
+        snapshots = ListingSnapshots()
+        snapshot_id = snapshots.add("tools", [1], owner=("session-a", "token-a"))
+        assert snapshots.get("tools", snapshot_id, ("session-a", "token-b")) is None
+        assert snapshots.get("tools", snapshot_id, ("session-b", "token-a")) is None
+        assert snapshots.get("tools", snapshot_id, ("session-a", "token-a")) == [1]
+
+    def test_evicts_least_recently_used(self) -> None:
+        snapshots = ListingSnapshots(max_snapshots=2)
+        first = snapshots.add("tools", [1])
+        second = snapshots.add("tools", [2])
+        snapshots.get("tools", first)
+        snapshots.add("tools", [3])
+        assert snapshots.get("tools", first) == [1]
+        assert snapshots.get("tools", second) is None
+
+
 class TestServerPagination:
     """Integration tests for server pagination."""
 
@@ -178,6 +228,96 @@ class TestServerPagination:
             assert len(result3.tools) == 5
             assert result3.nextCursor is None
 
+    async def test_every_page_runs_middleware(self) -> None:
+        """Each page request should pass through middleware and convert only its page."""
+        server = FastMCP(list_page_size=10)
+        pages: list[int] = []
+
+        class CountingMiddleware(Middleware):
+            async def on_list_tools(self, context, call_next):
+                result = await call_next(context)
+                pages.append(len(result))
+                return result
+
+        server.add_middleware(CountingMiddleware())
+
+        for i in range(25):
+
+            @server.tool(name=f"tool_{i}")
+            def make_tool() -> str:
+                return "ok"
+
+        async with Client(server) as client:
+            with patch.object(
+                Tool, "to_mcp_tool", autospec=True, side_effect=Tool.to_mcp_tool
+            ) as to_mcp_tool:
+                tools = await client.list_tools()
+
+        assert len(tools) == 25
+        assert pages == [25, 25, 25]
+        assert to_mcp_tool.call_count == 25
+
+    async def test_later_pages_recheck_visibility(self) -> None:
+        """Components hidden after the first page should not be served from the snapshot."""
+        server = FastMCP(list_page_size=10)
+
+        for i in range(25):
+
+            @server.tool(name=f"tool_{i}")
+            def make_tool() -> str:
+                return "ok"
+
+        async with Client(server) as client:
+            result = await client.list_tools_mcp()
+            server.disable(names={"tool_15"})
+            result2 = await client.list_tools_mcp(cursor=result.nextCursor)
+
+        assert [t.name for t in result2.tools] == [
+            f"tool_{i}" for i in range(10, 20) if i != 15
+        ]
+
+    async def test_snapshot_not_shared_across_sessions(self) -> None:
+        """A cursor replayed in another session should not read the first session's snapshot."""
+        server = FastMCP(list_page_size=10)
+
+        for i in range(25):
+
+            @server.tool(name=f"tool_{i}")
+            def make_tool() -> str:
+                return "ok"
+
+        async with Client(server) as first:
+            result = await first.list_tools_mcp()
+            server.disable(names={"tool_0"})
+
+            # The owning session keeps its snapshot's order
+            own = await first.list_tools_mcp(cursor=result.nextCursor)
+            assert [t.name for t in own.tools] == [f"tool_{i}" for i in range(10, 20)]
+
+            # Another session falls back to its own listing at the same offset
+            async with Client(server) as second:
+                other = await second.list_tools_mcp(cursor=result.nextCursor)
+            assert [t.name for t in other.tools] == [f"tool_{i}" for i in range(11, 21)]
+
+    async def test_evicted_snapshot_falls_back_to_offset(self) -> None:
+        """A cursor whose snapshot is gone should still return the next page."""
+        server = FastMCP(list_page_size=10)
+
+        for i in range(25):
+
+            @server.tool(name=f"tool_{i}")
+            def make_tool() -> str:
+                return "ok"
+
+        async with Client(server) as client:
+            result = await client.list_tools_mcp()
+            server._list_snapshots.clear()
+            result2 = await client.list_tools_mcp(cursor=result.nextCursor)
+            assert [t.name for t in result2.tools] == [
+                f"tool_{i}" for i in range(10, 20)
+            ]
+            assert result2.nextCursor is not None
+
     async def test_invalid_cursor_returns_error(self) -> None:
         """Server should return MCP error for invalid cursor."""
         server = FastMCP(list_page_size=10)
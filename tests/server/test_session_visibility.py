@@ -766,3 +766,94 @@ class TestSessionVisibilityResetBug:
             assert any(t.name == "shared_tool" for t in tools), (
                 "New session should see shared_tool regardless of previous session"
             )
+
+
+class TestSessionVisibilityCache:
+    """Tests for the in-process cache of session visibility rules."""
+
+    async def test_rules_read_from_store_once_per_session(self):
+        """Repeated requests don't re-read rules from the state store."""
+        from unittest.mock import patch
+
+        from fastmcp import Client
+
+        mcp = FastMCP("test")
+
+        @mcp.tool(tags={"finance"})
+        def finance_tool() -> str:
+            return "finance"
+
+        @mcp.tool
+        async def hide_finance(ctx: Context) -> str:
+            await ctx.disable_components(tags={"finance"})
+            return "hidden"
+
+        async with Client(mcp) as client:
+            await client.call_tool("hide_finance", {})
+            with patch.object(
+                mcp._state_store, "get", wraps=mcp._state_store.get
+            ) as store_get:
+                for _ in range(3):
+                    tools = await client.list_tools()
+                    assert not any(t.name == "finance_tool" for t in tools)
+
+        visibility_reads = [
+            call
+            for call in store_get.call_args_list
+            if str(call.kwargs.get("key", "")).endswith(":_visibility_rules")
+        ]
+        assert visibility_reads == []
+
+    async def test_write_through_on_reset(self):
+        """Resetting visibility updates the cache immediately."""
+        from fastmcp import Client
+
+        mcp = FastMCP("test")
+
+        @mcp.tool(tags={"finance"})
+        def finance_tool() -> str:
+            return "finance"
+
+        @mcp.tool
+        async def hide_finance(ctx: Context) -> str:
+            await ctx.disable_components(tags={"finance"})
+            return "hidden"
+
+        @mcp.tool
+        async def reset(ctx: Context) -> str:
+            await ctx.reset_visibility()
+            return "reset"
+
+        async with Client(mcp) as client:
+            await client.call_tool("hide_finance", {})
+            await client.call_tool("reset", {})
+            tools = await client.list_tools()
+            assert any(t.name == "finance_tool" for t in tools)
+
+    def test_cache_entries_expire(self):
+        """Expired entries are treated as misses."""
+        from fastmcp.server.transforms.visibility import SessionVisibilityCache
+
+        cache = SessionVisibilityCache(ttl=-1)
+        cache.set("s", [{"enabled": False, "match_all": True}])
+        assert cache.get("s") is None
+
+    def test_cache_is_bounded(self):
+        """Least recently used sessions are evicted beyond max_sessions."""
+        from fastmcp.server.transforms.visibility import SessionVisibilityCache
+
+        cache = SessionVisibilityCache(max_sessions=1)
+        cache.set("a", [])
+        cache.set("b", [])
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    def test_cache_ttl_from_settings(self):
+        """The server's cache expires entries after the configured TTL."""
+        from fastmcp.utilities.tests import temporary_settings
+
+        with temporary_settings(session_visibility_cache_ttl=-1):
+            mcp = FastMCP("test")
+
+        mcp._session_visibility.set("s", [])
+        assert mcp._session_visibility.get("s") is None
@@ -129,6 +129,23 @@ class TestMarking:
         # Original is untouched
         assert is_enabled(tool) is True
 
+    def test_reuses_copy_for_same_source(self):
+        """Repeated marking of the same component returns the cached copy."""
+        tool = Tool(name="foo", parameters={})
+        transform = Visibility(False, names={"foo"})
+        assert transform._mark_component(tool) is transform._mark_component(tool)
+
+    def test_recopies_after_meta_reassigned(self):
+        """Reassigning the source meta invalidates the cached copy."""
+        tool = Tool(name="foo", parameters={})
+        transform = Visibility(False, names={"foo"})
+        transform._mark_component(tool)
+        tool.meta = {"owner": "team"}
+        marked = transform._mark_component(tool)
+        assert marked.meta is not None
+        assert marked.meta["owner"] == "team"
+        assert is_enabled(marked) is False
+
     def test_disable_all(self):
         """match_all=True disables all components."""
         tool = Tool(name="anything", parameters={})
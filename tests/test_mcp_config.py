@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import anyio
 import psutil
 import pytest
 from mcp.types import TextContent
@@ -21,6 +22,7 @@ from fastmcp.client.auth.bearer import BearerAuth
 from fastmcp.client.auth.oauth import OAuthClientProvider
 from fastmcp.client.client import Client
 from fastmcp.client.logging import LogMessage
+from fastmcp.client.messages import MessageHandler
 from fastmcp.client.transports import (
     MCPConfigTransport,
     SSETransport,
@@ -1118,6 +1120,135 @@ async def test_multi_server_all_fail():
             pass
 
 
+def _delayed_create_proxy(delays: dict[str, float | None]):
+    """Fake _create_proxy that connects each backend after a delay.
+
+    A delay of None never connects.
+    """
+
+    async def create_proxy(name, config, timeout, stack):
+        delay = delays[name]
+        if delay is None:
+            await anyio.sleep_forever()
+        else:
+            await anyio.sleep(delay)
+        proxy = FastMCP(name=f"Proxy-{name}")
+
+        @proxy.tool
+        def hello() -> str:
+            return name
+
+        return AsyncMock(), AsyncMock(), proxy
+
+    return create_proxy
+
+
+def _three_server_config() -> MCPConfig:
+    return MCPConfig(
+        mcpServers={
+            name: StdioMCPServer(command="echo", args=["test"])
+            for name in ("a", "b", "c")
+        }
+    )
+
+
+async def test_multi_server_connects_concurrently():
+    """Backends connect at the same time rather than one after another."""
+    transport = MCPConfigTransport(_three_server_config())
+    arrived = 0
+    all_arrived = anyio.Event()
+
+    async def create_proxy(name, config, timeout, stack):
+        nonlocal arrived
+        arrived += 1
+        if arrived == 3:
+            all_arrived.set()
+        # Deadlocks (and times out) if connections are sequential
+        with anyio.fail_after(2):
+            await all_arrived.wait()
+        return AsyncMock(), AsyncMock(), FastMCP(name=f"Proxy-{name}")
+
+    with patch.object(transport, "_create_proxy", create_proxy):
+        async with Client(transport) as client:
+            await client.ping()
+
+    assert arrived == 3
+
+
+async def test_multi_server_connect_timeout_skips_server():
+    transport = MCPConfigTransport(_three_server_config(), connect_timeout=0.1)
+    create_proxy = _delayed_create_proxy({"a": 0, "b": None, "c": 0})
+
+    with patch.object(transport, "_create_proxy", create_proxy):
+        async with Client(transport) as client:
+            names = {t.name for t in await client.list_tools()}
+
+    assert names == {"a_hello", "c_hello"}
+
+
+async def test_multi_server_startup_timeout_skips_slow_servers():
+    transport = MCPConfigTransport(_three_server_config(), startup_timeout=0.1)
+    create_proxy = _delayed_create_proxy({"a": 0, "b": 5, "c": 0})
+
+    with patch.object(transport, "_create_proxy", create_proxy):
+        with anyio.fail_after(2):
+            async with Client(transport) as client:
+                names = {t.name for t in await client.list_tools()}
+
+    assert names == {"a_hello", "c_hello"}
+
+
+async def test_multi_server_mounts_late_servers():
+    transport = MCPConfigTransport(
+        _three_server_config(), startup_timeout=0.1, mount_late=True
+    )
+    create_proxy = _delayed_create_proxy({"a": 0, "b": 0.3, "c": 0})
+    changed = anyio.Event()
+
+    class Handler(MessageHandler):
+        async def on_tool_list_changed(self, message):
+            changed.set()
+
+    with patch.object(transport, "_create_proxy", create_proxy):
+        async with Client(transport, message_handler=Handler()) as client:
+            names = {t.name for t in await client.list_tools()}
+            assert names == {"a_hello", "c_hello"}
+
+            with anyio.fail_after(2):
+                await changed.wait()
+            names = {t.name for t in await client.list_tools()}
+
+    assert names == {"a_hello", "b_hello", "c_hello"}
+
+
+async def test_multi_server_late_mount_failure_keeps_session():
+    """A backend that fails to mount late doesn't cancel the open session."""
+    transport = MCPConfigTransport(
+        _three_server_config(), startup_timeout=0.1, mount_late=True
+    )
+    create_proxy = _delayed_create_proxy({"a": 0, "b": 0.2, "c": 0})
+    mounted = anyio.Event()
+    original_mount = FastMCP.mount
+
+    def mount(self, server, namespace=None):
+        if namespace == "b":
+            mounted.set()
+            raise RuntimeError("mount failed")
+        return original_mount(self, server, namespace=namespace)
+
+    with (
+        patch.object(transport, "_create_proxy", create_proxy),
+        patch.object(FastMCP, "mount", mount),
+    ):
+        async with Client(transport) as client:
+            with anyio.fail_after(2):
+                await mounted.wait()
+            await anyio.sleep(0.05)
+            names = {t.name for t in await client.list_tools()}
+
+    assert names == {"a_hello", "c_hello"}
+
+
 async def test_multi_server_partial_failure_cleanup(tmp_path: Path):
     """Transports for failed servers should not leak into _transports."""
     server_script = inspect.cleandoc("""
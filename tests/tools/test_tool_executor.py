@@ -0,0 +1,185 @@
+"""Tests for per-tool executor policies.
+
+An ExecutorPolicy gives a tool its own thread pool and/or a cap on concurrent
+calls with a bounded wait queue, so one slow tool cannot starve the rest.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import cast
+
+import anyio
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ExecutorSaturatedError, ToolError
+from fastmcp.tools import tool
+from fastmcp.tools.base import Tool
+from fastmcp.tools.executors import (
+    BoundedLimiter,
+    ExecutorPolicy,
+    ThreadPool,
+    configure_thread_pool,
+    get_thread_pool,
+)
+from fastmcp.tools.function_tool import DecoratedTool
+
+
+class TestBoundedLimiter:
+    async def test_rejects_when_queue_full(self):
+        limiter = BoundedLimiter("test", capacity=1, max_queue=1)
+        release = anyio.Event()
+        entered = anyio.Event()
+
+        async def hold():
+            async with limiter.slot():
+                entered.set()
+                await release.wait()
+
+        async def wait_in_queue():
+            async with limiter.slot():
+                pass
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(hold)
+            await entered.wait()
+            tg.start_soon(wait_in_queue)
+            await anyio.wait_all_tasks_blocked()
+            assert limiter.stats().waiting == 1
+
+            with pytest.raises(ExecutorSaturatedError):
+                async with limiter.slot():
+                    pass
+            release.set()
+
+        stats = limiter.stats()
+        assert stats.active == 0
+        assert stats.waiting == 0
+        assert stats.rejected == 1
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = BoundedLimiter("test", capacity=1)
+
+        async with limiter.slot():
+            with anyio.move_on_after(0.01):
+                async with limiter.slot():
+                    pass
+            assert limiter.stats().waiting == 0
+
+        assert limiter.stats().active == 0
+
+    def test_rejects_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            BoundedLimiter("test", capacity=0)
+        with pytest.raises(ValueError):
+            ExecutorPolicy(max_queue=1)
+
+
+class TestThreadPool:
+    async def test_sync_tool_runs_on_named_pool(self):
+        pool = configure_thread_pool("test-named", max_workers=1)
+        assert get_thread_pool("test-named") is pool
+        mcp = FastMCP()
+        seen = []
+
+        @mcp.tool(executor=ExecutorPolicy(pool="test-named"))
+        def work() -> int:
+            seen.append(pool.stats().active)
+            return threading.get_ident()
+
+        result = await mcp.call_tool("work")
+        assert result.structured_content is not None
+        assert result.structured_content["result"] != threading.get_ident()
+        assert seen == [1]
+
+    async def test_pool_saturation_fails_fast(self):
+        pool = ThreadPool("test-saturated", max_workers=1, max_queue=0)
+        release = threading.Event()
+        mcp = FastMCP()
+
+        @mcp.tool(executor=ExecutorPolicy(pool=pool))
+        def block() -> str:
+            release.wait(5)
+            return "done"
+
+        results = []
+
+        async def call():
+            results.append(await mcp.call_tool("block"))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call)
+            with anyio.fail_after(5):
+                while pool.stats().active == 0:
+                    await anyio.sleep(0.001)
+            with pytest.raises(ToolError, match="saturated"):
+                await mcp.call_tool("block")
+            release.set()
+
+        assert len(results) == 1
+        assert pool.stats().rejected == 1
+
+    def test_unknown_pool_name(self):
+        with pytest.raises(ValueError, match="Unknown thread pool"):
+            get_thread_pool("does-not-exist")
+
+    def test_pool_rejected_with_inline_execution(self):
+        def inline() -> str:
+            return "x"
+
+        with pytest.raises(ValueError, match="run_in_thread=False"):
+            Tool.from_function(
+                inline,
+                run_in_thread=False,
+                executor=ExecutorPolicy(pool=ThreadPool("inline", max_workers=1)),
+            )
+
+
+class TestToolConcurrency:
+    async def test_max_concurrency_limits_async_tool(self):
+        mcp = FastMCP()
+        running = 0
+        peak = 0
+
+        @mcp.tool(executor=ExecutorPolicy(max_concurrency=2))
+        async def work() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await anyio.sleep(0.01)
+            running -= 1
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(6):
+                tg.start_soon(mcp.call_tool, "work")
+
+        assert peak == 2
+
+    async def test_limit_shared_across_namespaced_copies(self):
+        child = FastMCP("child")
+        release = anyio.Event()
+
+        @child.tool(executor=ExecutorPolicy(max_concurrency=1, max_queue=0))
+        async def work() -> str:
+            await release.wait()
+            return "done"
+
+        parent = FastMCP("parent")
+        parent.mount(child, namespace="ns")
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(child.call_tool, "work")
+            await anyio.wait_all_tasks_blocked()
+            with pytest.raises(ToolError, match="saturated"):
+                await parent.call_tool("ns_work")
+            release.set()
+
+    def test_standalone_decorator_records_policy(self):
+        policy = ExecutorPolicy(max_concurrency=3)
+
+        @tool(executor=policy)
+        def work() -> str:
+            return "x"
+
+        assert cast(DecoratedTool, work).__fastmcp__.executor is policy
@@ -0,0 +1,141 @@
+"""Tests for execution_mode="process" on sync tools.
+
+Process execution validates arguments in the server process and runs the
+function in a worker process, for CPU-bound tools that hold the GIL. Tool
+functions here live at module level so worker processes can import them.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import anyio
+import pytest
+from pydantic import BaseModel
+
+from fastmcp import Context, FastMCP
+from fastmcp.dependencies import Depends
+from fastmcp.tools.base import Tool
+from fastmcp.tools.executors import (
+    ExecutorPolicy,
+    ProcessPool,
+    ThreadPool,
+    get_process_pool,
+)
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+def worker_pid() -> int:
+    return os.getpid()
+
+
+def manhattan(a: Point, b: Point, scale: int = 1) -> int:
+    return (abs(a.x - b.x) + abs(a.y - b.y)) * scale
+
+
+def explode() -> None:
+    raise ValueError("boom")
+
+
+def with_context(ctx: Context) -> int:
+    return 1
+
+
+def get_value() -> int:
+    return 1
+
+
+def with_dependency(value: int = Depends(get_value)) -> int:
+    return value
+
+
+def numbers():
+    yield 1
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _shutdown_process_pool():
+    yield
+    get_process_pool().shutdown()
+
+
+class TestProcessExecution:
+    async def test_runs_in_worker_process(self):
+        mcp = FastMCP()
+        mcp.tool(worker_pid, execution_mode="process")
+
+        result = await mcp.call_tool("worker_pid")
+        assert result.structured_content is not None
+        assert result.structured_content["result"] != os.getpid()
+
+    async def test_arguments_validated_before_dispatch(self):
+        mcp = FastMCP()
+        mcp.tool(manhattan, execution_mode="process")
+
+        result = await mcp.call_tool(
+            "manhattan", {"a": {"x": 0, "y": 0}, "b": {"x": "3", "y": 4}}
+        )
+        assert result.structured_content == {"result": 7}
+
+    async def test_worker_exception_surfaces(self):
+        mcp = FastMCP()
+        mcp.tool(explode, execution_mode="process")
+
+        with pytest.raises(Exception, match="boom"):
+            await mcp.call_tool("explode")
+
+    async def test_cancelled_call_returns_promptly(self):
+        pool = ProcessPool(max_workers=1)
+        try:
+            with anyio.fail_after(2):
+                with anyio.move_on_after(0.2):
+                    await pool.run(time.sleep, 5)
+                # The queued call is cancelled before it reaches the worker
+                with anyio.move_on_after(0.2):
+                    await pool.run(time.sleep, 5)
+            assert pool._submit_limiter is not None
+            assert pool._submit_limiter.borrowed_tokens == 0
+        finally:
+            pool.shutdown(wait=False)
+
+
+class TestProcessExecutionValidation:
+    @pytest.mark.parametrize("fn", [with_context, with_dependency])
+    def test_rejects_injected_parameters(self, fn):
+        with pytest.raises(ValueError, match="Context and Depends"):
+            Tool.from_function(fn, execution_mode="process")
+
+    def test_rejects_async_function(self):
+        async def run() -> int:
+            return 1
+
+        with pytest.raises(ValueError, match="async functions"):
+            Tool.from_function(run, execution_mode="process")
+
+    def test_rejects_generator(self):
+        with pytest.raises(ValueError, match="generator"):
+            Tool.from_function(numbers, execution_mode="process")
+
+    def test_rejects_unpicklable_function(self):
+        def local() -> int:
+            return 1
+
+        with pytest.raises(ValueError, match="module level"):
+            Tool.from_function(local, execution_mode="process")
+
+    def test_rejects_inline_and_thread_pool(self):
+        with pytest.raises(ValueError, match="run_in_thread=False"):
+            Tool.from_function(
+                worker_pid, execution_mode="process", run_in_thread=False
+            )
+        with pytest.raises(ValueError, match="thread pools"):
+            Tool.from_function(
+                worker_pid,
+                execution_mode="process",
+                executor=ExecutorPolicy(pool=ThreadPool("p", max_workers=1)),
+            )
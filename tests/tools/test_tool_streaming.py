@@ -0,0 +1,99 @@
+"""Tests for streaming generator tools.
+
+With ``stream=True`` each chunk a generator tool yields is delivered to the
+client as it is produced, rather than after the generator is drained.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+
+import anyio
+import pytest
+from mcp.types import TextContent
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.tools.base import Tool
+from fastmcp.tools.streaming import STREAM_SUMMARY_SCHEMA, StreamConfig
+
+
+class TestStreamingTools:
+    async def test_chunks_delivered_as_progress(self):
+        mcp = FastMCP()
+
+        @mcp.tool(stream=True)
+        def rows() -> Iterator[dict]:
+            for i in range(3):
+                yield {"row": i}
+
+        messages = []
+
+        async def progress_handler(
+            progress: float, total: float | None, message: str | None
+        ) -> None:
+            messages.append((progress, message))
+
+        async with Client(mcp, progress_handler=progress_handler) as client:
+            result = await client.call_tool("rows")
+
+        assert messages == [(1, '{"row":0}'), (2, '{"row":1}'), (3, '{"row":2}')]
+        # As for non-streaming generator tools, the final result holds every
+        # chunk; without an output schema it is returned as text only.
+        assert isinstance(result.content[0], TextContent)
+        assert result.content[0].text == '[{"row":0},{"row":1},{"row":2}]'
+        assert result.structured_content is None
+
+    async def test_chunk_delivered_before_generator_finishes(self):
+        mcp = FastMCP()
+        release = anyio.Event()
+        first_seen = anyio.Event()
+
+        @mcp.tool(stream=True)
+        async def slow() -> AsyncIterator[str]:
+            yield "first"
+            await release.wait()
+            yield "second"
+
+        async def progress_handler(
+            progress: float, total: float | None, message: str | None
+        ) -> None:
+            if message == "first":
+                first_seen.set()
+
+        async with Client(mcp, progress_handler=progress_handler) as client:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.call_tool, "slow")
+                with anyio.fail_after(2):
+                    await first_seen.wait()
+                release.set()
+
+    async def test_summary_result(self):
+        def count_up() -> Iterator[int]:
+            yield from range(1000)
+
+        tool = Tool.from_function(count_up, stream=StreamConfig(result="summary"))
+        assert tool.output_schema == STREAM_SUMMARY_SCHEMA
+
+        result = await tool.run({})
+        assert result.structured_content == {"chunks": 1000}
+
+    async def test_generator_closed_when_consumer_fails(self):
+        closed = False
+
+        async def numbers() -> AsyncIterator[int]:
+            nonlocal closed
+            try:
+                yield 1
+                raise ValueError("boom")
+            finally:
+                closed = True
+
+        tool = Tool.from_function(numbers, stream=StreamConfig(buffer_size=0))
+        with pytest.raises(ValueError, match="boom"):
+            await tool.run({})
+        assert closed
+
+    def test_rejects_negative_buffer(self):
+        with pytest.raises(ValueError):
+            StreamConfig(buffer_size=-1)
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+from mcp.types import TextContent
 
 from fastmcp.tools.base import Tool, ToolResult
 
@@ -182,3 +184,70 @@ class TestSerializationAlias:
                 component_data = result.structured_content
             assert component_data["componentId"] == "test123"
             assert "id" not in component_data
+
+
+class TestSinglePassSerialization:
+    """Plain return values are serialized once for both text and structured forms."""
+
+    def test_text_and_structured_from_one_serialization(self):
+        @dataclass
+        class Row:
+            id: int
+            tags: tuple[str, ...]
+
+        def rows() -> list[Row]:
+            return [Row(id=1, tags=("a",)), Row(id=2, tags=())]
+
+        tool = Tool.from_function(rows)
+        with patch(
+            "fastmcp.tools.base.pydantic_core.to_jsonable_python"
+        ) as to_jsonable:
+            result = tool.convert_result(rows())
+
+        to_jsonable.assert_not_called()
+        assert result.structured_content == {
+            "result": [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}]
+        }
+        assert isinstance(result.content[0], TextContent)
+        assert result.content[0].text == '[{"id":1,"tags":["a"]},{"id":2,"tags":[]}]'
+        assert result.meta == {"fastmcp": {"wrap_result": True}}
+
+    def test_matches_general_path_without_schema(self):
+        tool = Tool.from_function(lambda: None, name="t", output_schema=None)
+
+        result = tool.convert_result({"b": 1, "a": [1.5, None]})
+        assert result.structured_content == {"b": 1, "a": [1.5, None]}
+        assert isinstance(result.content[0], TextContent)
+        assert result.content[0].text == '{"b":1,"a":[1.5,null]}'
+
+        listed = tool.convert_result([1, 2])
+        assert listed.structured_content is None
+        assert isinstance(listed.content[0], TextContent)
+        assert listed.content[0].text == "[1,2]"
+
+    def test_unserializable_value_falls_back_to_str(self):
+        class Opaque:
+            def __str__(self) -> str:
+                return "opaque"
+
+        tool = Tool.from_function(lambda: None, name="t", output_schema=None)
+        result = tool.convert_result({"value": Opaque()})
+        assert result.structured_content is None
+        assert isinstance(result.content[0], TextContent)
+        assert result.content[0].text == '{"value":"opaque"}'
+
+    def test_structured_only_drops_mirrored_text(self):
+        tool = Tool.from_function(lambda: None, name="t", output_schema=None)
+        result = tool.convert_result({"a": 1})
+
+        assert result.to_mcp_result() == (result.content, {"a": 1})
+        assert result.to_mcp_result(structured_only=True) == ([], {"a": 1})
+
+    def test_structured_only_keeps_explicit_content(self):
+        result = ToolResult(content="summary", structured_content={"a": 1})
+        mcp_result = result.to_mcp_result(structured_only=True)
+        assert isinstance(mcp_result, tuple)
+        content, structured = mcp_result
+        assert isinstance(content[0], TextContent)
+        assert content[0].text == "summary"
+        assert structured == {"a": 1}
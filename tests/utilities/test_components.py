@@ -10,6 +10,7 @@ from fastmcp.resources.base import Resource
 from fastmcp.resources.template import ResourceTemplate
 from fastmcp.tools.base import Tool
 from fastmcp.utilities.components import (
+    DerivedComponentCache,
     FastMCPComponent,
     FastMCPMeta,
     _convert_set_default_none,
@@ -440,3 +441,76 @@ class TestEdgeCasesAndIntegration:
         assert deep_copy.meta is not None
         deep_copy.meta["nested"]["value"] = 3
         assert component.meta["nested"]["value"] == 1  # Original unaffected
+
+
+class TestWireMemoization:
+    """Tests for memoized SDK conversion of components."""
+
+    def test_tool_conversion_is_memoized(self):
+        tool = Tool.from_function(lambda: 1, name="t")
+        assert tool.to_mcp_tool() is tool.to_mcp_tool()
+
+    def test_overrides_bypass_cache(self):
+        tool = Tool.from_function(lambda: 1, name="t")
+        cached = tool.to_mcp_tool()
+        renamed = tool.to_mcp_tool(name="other")
+        assert renamed.name == "other"
+        assert tool.to_mcp_tool() is cached
+
+    def test_setattr_invalidates(self):
+        tool = Tool.from_function(lambda: 1, name="t")
+        tool.to_mcp_tool()
+        tool.description = "updated"
+        assert tool.to_mcp_tool().description == "updated"
+
+    def test_model_copy_does_not_share_cache(self):
+        prompt = Prompt.from_function(lambda: "hi", name="p")
+        prompt.to_mcp_prompt()
+        copied = prompt.model_copy(update={"name": "q"})
+        assert copied.to_mcp_prompt().name == "q"
+        assert prompt.to_mcp_prompt().name == "p"
+
+    def test_resource_and_template_memoized(self):
+        def read() -> str:
+            return "x"
+
+        def read_item(item_id: str) -> str:
+            return item_id
+
+        resource = Resource.from_function(read, uri="test://r")
+        template = ResourceTemplate.from_function(
+            read_item, uri_template="test://r/{item_id}"
+        )
+        assert resource.to_mcp_resource() is resource.to_mcp_resource()
+        assert template.to_mcp_template() is template.to_mcp_template()
+
+
+class TestDerivedComponentCache:
+    """Tests for the cache of copies derived from source components."""
+
+    def test_reuses_copy_of_unchanged_source(self):
+        cache = DerivedComponentCache()
+        source = FastMCPComponent(name="test")
+        first = cache.get(source, lambda c: c.model_copy(update={"name": "copy"}))
+        second = cache.get(source, lambda c: c.model_copy(update={"name": "copy"}))
+        assert first is second
+        assert first is not source
+
+    def test_rebuilds_after_any_field_is_reassigned(self):
+        cache = DerivedComponentCache()
+        source = FastMCPComponent(name="test", description="old")
+        first = cache.get(source, lambda c: c.model_copy())
+
+        source.description = "new"
+        second = cache.get(source, lambda c: c.model_copy())
+
+        assert second is not first
+        assert second.description == "new"
+
+    def test_equal_sources_get_separate_copies(self):
+        cache = DerivedComponentCache()
+        a = FastMCPComponent(name="test")
+        b = FastMCPComponent(name="test")
+        assert cache.get(a, lambda c: c.model_copy()) is not cache.get(
+            b, lambda c: c.model_copy()
+        )
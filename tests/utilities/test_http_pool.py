@@ -0,0 +1,141 @@
+"""Tests for the shared HTTP connection pool."""
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from fastmcp.utilities import http
+from fastmcp.utilities.http import (
+    HTTPPoolConfig,
+    close_http_pool,
+    configure_http_pool,
+    create_pooled_http_client,
+    get_http_pool_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool():
+    yield
+    configure_http_pool()
+
+
+class RecordingPool(httpx.AsyncBaseTransport):
+    """Stands in for the pooled transport, answering every request locally."""
+
+    def __init__(self, **kwargs: Any):
+        self.kwargs = kwargs
+        self.requests: list[httpx.Request] = []
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def pools() -> Iterator[list[RecordingPool]]:
+    created: list[RecordingPool] = []
+
+    def make_pool(**kwargs: Any) -> RecordingPool:
+        pool = RecordingPool(**kwargs)
+        created.append(pool)
+        return pool
+
+    configure_http_pool()
+    with patch.object(httpx, "AsyncHTTPTransport", side_effect=make_pool):
+        yield created
+
+
+class TestSharedHttpPool:
+    async def test_clients_share_one_pool(self, pools: list[RecordingPool]):
+        async with create_pooled_http_client() as first:
+            await first.get("http://example.com/a")
+        async with create_pooled_http_client(headers={"x-a": "1"}) as second:
+            await second.get("http://example.com/b")
+
+        assert len(pools) == 1
+        assert [r.url.path for r in pools[0].requests] == ["/a", "/b"]
+        assert pools[0].requests[1].headers["x-a"] == "1"
+
+    async def test_closing_client_keeps_pool_open(self, pools: list[RecordingPool]):
+        async with create_pooled_http_client() as client:
+            await client.get("http://example.com/")
+
+        assert not pools[0].closed
+
+    async def test_default_client_settings(self):
+        async with create_pooled_http_client() as client:
+            assert client.follow_redirects
+            assert client.timeout == http.DEFAULT_HTTP_TIMEOUT
+
+    async def test_configure_creates_new_pool(self, pools: list[RecordingPool]):
+        async with create_pooled_http_client() as client:
+            await client.get("http://example.com/")
+
+        config = configure_http_pool(max_connections=5, keepalive_expiry=30.0)
+        assert get_http_pool_config() is config
+
+        async with create_pooled_http_client() as client:
+            await client.get("http://example.com/")
+
+        assert len(pools) == 2
+        assert pools[1].kwargs["limits"].max_connections == 5
+        assert pools[1].kwargs["limits"].keepalive_expiry == 30.0
+        assert pools[0].closed
+
+    async def test_replaced_pool_closes_with_last_client(
+        self, pools: list[RecordingPool]
+    ):
+        async with create_pooled_http_client() as client:
+            await client.get("http://example.com/")
+            configure_http_pool(max_connections=5)
+            assert not pools[0].closed
+            await client.get("http://example.com/")
+
+        assert pools[0].closed
+        assert len(pools[0].requests) == 2
+
+    async def test_env_proxy_bypasses_pool(
+        self, pools: list[RecordingPool], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv("HTTP_PROXY", "http://proxy.internal:3128")
+        async with create_pooled_http_client():
+            pass
+
+        # httpx builds its own proxy-aware transports; the shared pool is unused
+        assert pools == []
+
+    async def test_env_proxy_ignored_without_trust_env(
+        self, pools: list[RecordingPool], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv("HTTP_PROXY", "http://proxy.internal:3128")
+        async with create_pooled_http_client(trust_env=False) as first:
+            await first.get("http://example.com/a")
+        async with create_pooled_http_client(trust_env=False) as second:
+            await second.get("http://example.com/b")
+
+        assert len(pools) == 1
+        assert "proxy" not in pools[0].kwargs
+
+    async def test_close_http_pool(self, pools: list[RecordingPool]):
+        async with create_pooled_http_client() as client:
+            await client.get("http://example.com/")
+        await close_http_pool()
+        assert pools[0].closed
+
+        async with create_pooled_http_client() as client:
+            await client.get("http://example.com/")
+        assert len(pools) == 2
+        assert len(pools[1].requests) == 1
+
+    def test_http2_requires_h2(self):
+        with patch("importlib.util.find_spec", return_value=None):
+            with pytest.raises(ImportError, match="h2"):
+                HTTPPoolConfig(http2=True)